@@ -0,0 +1,4 @@
+# Load backend/.env once, before any app module reads the environment.
+from dotenv import load_dotenv
+
+load_dotenv()
@@ -0,0 +1,100 @@
+# backend/app/core/buckets.py
+"""
+SQL helpers for grouping timestamps into East Africa Time buckets.
+
+Timestamps are stored in UTC (datetime.utcnow). Vendors think in local days,
+so buckets are computed on the timestamp shifted to EAT (UTC+3, no DST).
+Production runs on PostgreSQL, local setups on MySQL, and quick checks on
+SQLite, so each expression is built for the session's dialect. Constants are
+rendered inline so the same expression can appear in SELECT and GROUP BY.
+"""
+from datetime import date, datetime, timedelta
+from sqlalchemy import Date, Integer, cast, extract, func, literal_column
+from sqlalchemy.orm import Session
+
+EAT_OFFSET_HOURS = 3
+EAT_OFFSET = timedelta(hours=EAT_OFFSET_HOURS)
+
+PERIODS = ("day", "week", "month")
+
+
+def dialect_name(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+
+def local_timestamp(column, dialect: str):
+    """Shift a UTC timestamp column to EAT."""
+    if dialect == "postgresql":
+        return column + literal_column(f"INTERVAL '{EAT_OFFSET_HOURS} hours'")
+    if dialect == "mysql":
+        return func.date_add(column, literal_column(f"INTERVAL {EAT_OFFSET_HOURS} HOUR"))
+    return func.datetime(column, literal_column(f"'+{EAT_OFFSET_HOURS} hours'"))
+
+
+def date_bucket(column, period: str, dialect: str):
+    """Start date (EAT) of the day/week/month a UTC timestamp falls in. Weeks start on Monday."""
+    if period not in PERIODS:
+        raise ValueError(f"Unsupported period: {period!r}")
+    local = local_timestamp(column, dialect)
+
+    if dialect == "postgresql":
+        return cast(func.date_trunc(literal_column(f"'{period}'"), local), Date)
+    if dialect == "mysql":
+        if period == "day":
+            return func.date(local)
+        if period == "week":
+            return func.subdate(func.date(local), func.weekday(local))
+        return cast(func.date_format(local, literal_column("'%Y-%m-01'")), Date)
+
+    # SQLite date() modifiers
+    modifiers = {
+        "day": (),
+        "week": ("weekday 0", "-6 days"),
+        "month": ("start of month",),
+    }[period]
+    return func.date(local, *(literal_column(f"'{modifier}'") for modifier in modifiers))
+
+
+def local_hour(column, dialect: str):
+    """Hour of day (0-23) in EAT."""
+    return cast(extract("hour", local_timestamp(column, dialect)), Integer)
+
+
+def local_today() -> date:
+    return (datetime.utcnow() + EAT_OFFSET).date()
+
+
+def utc_start_of(day: date) -> datetime:
+    """Naive UTC datetime of local (EAT) midnight on `day`."""
+    return datetime.combine(day, datetime.min.time()) - EAT_OFFSET
+
+
+def bucket_start(day: date, period: str) -> date:
+    """Python twin of date_bucket for an EAT calendar date."""
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    return day
+
+
+def bucket_range(first_day: date, last_day: date, period: str) -> list[date]:
+    """Every bucket start from the bucket holding first_day through last_day."""
+    starts = []
+    current = bucket_start(first_day, period)
+    while current <= last_day:
+        starts.append(current)
+        if period == "month":
+            current = (current + timedelta(days=32)).replace(day=1)
+        else:
+            current += timedelta(days=7 if period == "week" else 1)
+    return starts
+
+
+def as_date(value) -> date:
+    """Normalise a bucket value (date, datetime or SQLite 'YYYY-MM-DD' string)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
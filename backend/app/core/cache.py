@@ -0,0 +1,40 @@
+# backend/app/core/cache.py
+"""
+Small in-process cache for per-vendor computed results.
+
+Entries are stored under (vendor_id, key) so everything cached for a vendor
+can be dropped at once when their data changes. The cache lives in each
+worker process; it only saves recomputation and is never a source of truth.
+"""
+from collections import OrderedDict
+from threading import Lock
+
+
+class VendorCache:
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, vendor_id: int, key=None):
+        with self._lock:
+            entry = self._entries.get((vendor_id, key))
+            if entry is not None:
+                self._entries.move_to_end((vendor_id, key))
+            return entry
+
+    def set(self, vendor_id: int, key, value) -> None:
+        with self._lock:
+            self._entries[(vendor_id, key)] = value
+            self._entries.move_to_end((vendor_id, key))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, vendor_id: int) -> None:
+        with self._lock:
+            for cached in [cached for cached in self._entries if cached[0] == vendor_id]:
+                del self._entries[cached]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,178 @@
+# backend/app/core/compression.py
+"""
+Response compression for clients on metered mobile data.
+
+JSON lists (sales, inventory, M-Pesa history) compress 5-10x. The middleware
+picks brotli or gzip from the request's Accept-Encoding (brotli only when the
+`brotli` package is installed) and compresses a response when:
+
+- its content type is on COMPRESSIBLE_TYPES (JSON, CSV, text...), so images,
+  Parquet and other already-compressed bodies pass through;
+- it is not already encoded and is not a 204/304;
+- a complete body is at least COMPRESSION_MIN_SIZE bytes (default 1024);
+  smaller ones cost more in CPU and headers than they save.
+
+Streaming responses (more_body chunks) are compressed chunk by chunk and
+flushed after each one, so clients still receive rows as they are produced.
+Compressed responses get a weak ETag, since the bytes differ from the
+identity encoding. `Vary: Accept-Encoding` goes on every response that could
+be compressed for some client - including uncompressed ones and the 304s
+revalidating them - so caches never hand one client's encoding to another.
+
+GZIP_LEVEL (default 6) and BROTLI_QUALITY (default 4, tuned for dynamic
+responses rather than static assets) trade CPU for ratio.
+"""
+import os
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+
+COMPRESSIBLE_TYPES = frozenset({
+    "application/json",
+    "application/problem+json",
+    "application/x-ndjson",
+    "application/xml",
+    "application/javascript",
+    "image/svg+xml",
+    "text/csv",
+    "text/html",
+    "text/plain",
+    "text/xml",
+})
+
+
+class _Gzip:
+    def __init__(self):
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class _Brotli:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+ENCODERS = {"br": _Brotli, "gzip": _Gzip} if brotli is not None else {"gzip": _Gzip}
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """The supported encoding the client weights highest (brotli on ties), or None."""
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in ENCODERS:  # brotli first
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _compressible_type(headers: Headers) -> bool:
+    media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+    return media_type in COMPRESSIBLE_TYPES
+
+
+def _varies(headers: Headers, status: int) -> bool:
+    # A 304 has no content type but stands in for a 200 that may be compressed
+    return status == 304 or _compressible_type(headers)
+
+
+def _compressible(headers: Headers, status: int) -> bool:
+    if status < 200 or status in (204, 304) or "content-encoding" in headers:
+        return False
+    return _compressible_type(headers)
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing eligible responses with brotli or gzip."""
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start = None  # held until the first body chunk decides
+        passthrough = False
+        encoder = None
+
+        async def send_wrapper(message):
+            nonlocal start, passthrough, encoder
+            if passthrough or message["type"] not in ("http.response.start", "http.response.body"):
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                # Before the passthrough check, so a 200 and its 304 carry the same Vary
+                if _varies(headers, message["status"]):
+                    headers.add_vary_header("Accept-Encoding")
+                if encoding is None or not _compressible(headers, message["status"]):
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if encoder is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                encoder = ENCODERS[encoding]()
+                headers = MutableHeaders(scope=start)
+                headers["Content-Encoding"] = encoding
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = "W/" + etag
+                if more_body:
+                    del headers["Content-Length"]
+                    await send(start)
+                    await send({"type": "http.response.body", "body": encoder.chunk(body), "more_body": True})
+                else:
+                    body = encoder.finish(body)
+                    headers["Content-Length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body, "more_body": False})
+                return
+
+            data = encoder.chunk(body) if more_body else encoder.finish(body)
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
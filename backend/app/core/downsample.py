@@ -0,0 +1,81 @@
+# backend/app/core/downsample.py
+"""
+Reduce a time series to at most `width` points for charting.
+
+Both methods return sorted indices into the original series, so callers can
+keep every field of the selected points, and always keep the first and last
+point.
+
+- lttb: Largest-Triangle-Three-Buckets. Keeps the visual shape of a line
+  chart; one point per bucket.
+- minmax: the lowest and highest point of each bucket. Never hides a spike
+  or a dip; up to two points per bucket. Needs width >= 4 and falls back to
+  lttb below that.
+"""
+import numpy as np
+
+METHODS = ("lttb", "minmax")
+
+
+def lttb_indices(x, y, width: int) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if width >= n:
+        return np.arange(n)
+    if width < 3:
+        return np.array([0, n - 1][:width], dtype=np.intp)
+
+    # Interior points split into width - 2 buckets; the ends are fixed.
+    edges = np.linspace(1, n - 1, width - 1).astype(np.intp)
+    selected = np.empty(width, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(width - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third triangle vertex
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x, avg_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        area = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(area.argmax())
+        selected[i + 1] = previous
+    return selected
+
+
+def minmax_indices(y, width: int) -> np.ndarray:
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if width >= n:
+        return np.arange(n)
+    if width < 4:
+        # Room for the ends and at most one interior point: no bucket has a min and a max.
+        return lttb_indices(np.arange(n), y, width)
+
+    # Two points per bucket, so width // 2 buckets over the interior.
+    buckets = max((width - 2) // 2, 1)
+    bucket_of = (np.arange(1, n - 1) - 1) * buckets // max(n - 2, 1)
+    interior = np.arange(1, n - 1)
+    # Sorting by (bucket, value) puts each bucket's min first and max last.
+    order = np.lexsort((y[interior], bucket_of))
+    starts = np.flatnonzero(np.r_[True, np.diff(bucket_of[order]) != 0])
+    ends = np.r_[starts[1:], len(order)] - 1
+    picked = interior[np.concatenate([order[starts], order[ends]])]
+    return np.unique(np.concatenate([[0, n - 1], picked]))
+
+
+def downsample(points: list, value, width: int, method: str = "lttb", x=None) -> list:
+    """Pick at most `width` of `points` using value(point) as the y axis."""
+    if width is None or len(points) <= width:
+        return points
+    y = np.fromiter((value(point) for point in points), dtype=float, count=len(points))
+    if method == "minmax":
+        indices = minmax_indices(y, width)
+    else:
+        indices = lttb_indices(np.arange(len(points)) if x is None else x, y, width)
+    return [points[i] for i in indices]
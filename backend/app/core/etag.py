@@ -0,0 +1,29 @@
+# backend/app/core/etag.py
+"""
+Conditional GET helpers.
+
+List routes compute a cheap ETag (see services/resource_version.py) before
+running their query. If the client already holds that version the route
+returns 304 with no body; otherwise the tag is attached to the full response.
+"""
+from typing import Optional
+from fastapi import Request, Response
+
+CACHE_CONTROL = "private, no-cache"  # always revalidate, never share between users
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Return a 304 response if the client's copy is current, else tag `response` and return None."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Authorization"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,258 @@
+# backend/app/core/metrics.py
+"""
+In-process Prometheus metrics.
+
+Counters and histograms are plain dicts of floats behind one lock each, and
+are rendered in the Prometheus text format by GET /metrics. Every worker
+process keeps its own numbers, so each series carries a `worker` label (the
+pid) and dashboards should sum() across workers.
+
+What is recorded:
+- HTTP requests by method, route template and status, with latency;
+- DB statements per request and their total time, via SQLAlchemy cursor
+  events, attributed to the route that issued them;
+- DB pool size, checked-out connections and saturation, read at scrape time;
+- Daraja (M-Pesa API) call latency by operation and outcome;
+- password hashing jobs: time waiting for a slot, time hashing, and how
+  many are running or waiting now.
+"""
+import os
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from threading import Lock
+
+from sqlalchemy import event
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+EXTERNAL_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 30)
+
+WORKER = str(os.getpid())
+
+# Queries issued while handling the current request: [count, seconds].
+_request_queries: ContextVar = ContextVar("request_queries", default=None)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=()) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs += [f'{name}="{_escape(value)}"' for name, value in extra]
+    pairs.append(f'worker="{WORKER}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = Lock()
+
+    def inc(self, labels=(), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = list(self._values.items())
+        lines += [f"{self.name}{_labels(self.labelnames, labels)} {value}" for labels, value in items]
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._values = {}  # labels -> [count per bucket..., +Inf count, sum]
+        self._lock = Lock()
+
+    def observe(self, labels, value: float) -> None:
+        slot = bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(labels)
+            if row is None:
+                row = self._values[labels] = [0] * (len(self.buckets) + 2)
+            row[slot] += 1
+            row[-1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = [(labels, list(row)) for labels, row in self._values.items()]
+        for labels, row in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), row[:-1]):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {row[-1]}")
+        return lines
+
+
+class Gauge:
+    """Read from a callback at scrape time; the callback returns {labels: value}."""
+
+    def __init__(self, name: str, documentation: str, labelnames=(), collect=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.collect = collect
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        values = self.collect() if self.collect else {}
+        lines += [f"{self.name}{_labels(self.labelnames, labels)} {value}" for labels, value in values.items()]
+        return lines
+
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests handled.", ("method", "route", "status"))
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "Time to handle an HTTP request.", ("method", "route", "status"))
+DB_QUERIES = Histogram(
+    "db_queries_per_request", "SQL statements executed per HTTP request.", ("route",), QUERY_COUNT_BUCKETS)
+DB_QUERY_TIME = Histogram(
+    "db_query_seconds_per_request", "Time spent in SQL statements per HTTP request.", ("route",))
+DB_STATEMENTS = Counter(
+    "db_statements_total", "SQL statements executed, in and outside requests.")
+DB_STATEMENT_TIME = Counter(
+    "db_statement_seconds_total", "Time spent in SQL statements, in and outside requests.")
+DARAJA_LATENCY = Histogram(
+    "daraja_request_duration_seconds", "Latency of M-Pesa Daraja API calls.", ("operation", "outcome"), EXTERNAL_BUCKETS)
+PASSWORD_HASH_WAIT = Histogram(
+    "password_hash_wait_seconds", "Time a password hash or verify waited for a hashing slot.", ("operation",))
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds", "Time to hash or verify a password, once started.", ("operation",))
+PASSWORD_HASH_JOBS = Gauge("password_hash_jobs", "Password hashing jobs by state.", ("state",))
+
+_pool = None
+
+
+def _pool_stats() -> dict:
+    pool = _pool
+    if pool is None or not hasattr(pool, "checkedout"):
+        return {}
+    capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+    return {
+        ("size",): pool.size(),
+        ("checked_out",): pool.checkedout(),
+        ("overflow",): max(pool.overflow(), 0),
+        ("capacity",): capacity,
+    }
+
+
+def _pool_saturation() -> dict:
+    stats = _pool_stats()
+    if not stats or not stats[("capacity",)]:
+        return {}
+    return {(): round(stats[("checked_out",)] / stats[("capacity",)], 4)}
+
+
+DB_POOL = Gauge("db_pool_connections", "DB connection pool state.", ("state",), _pool_stats)
+DB_POOL_SATURATION = Gauge(
+    "db_pool_saturation", "Checked-out connections as a fraction of pool capacity.", (), _pool_saturation)
+
+REGISTRY = [
+    HTTP_REQUESTS, HTTP_LATENCY, DB_QUERIES, DB_QUERY_TIME, DB_STATEMENTS, DB_STATEMENT_TIME,
+    DB_POOL, DB_POOL_SATURATION, DARAJA_LATENCY, PASSWORD_HASH_WAIT, PASSWORD_HASH_SECONDS, PASSWORD_HASH_JOBS,
+]
+
+
+def render_metrics() -> str:
+    lines = []
+    for metric in REGISTRY:
+        lines += metric.render()
+    return "\n".join(lines) + "\n"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    DB_STATEMENTS.inc()
+    DB_STATEMENT_TIME.inc(amount=elapsed)
+    current = _request_queries.get()
+    if current is not None:
+        current[0] += 1
+        current[1] += elapsed
+
+
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute; drop its start time.
+    starts = context.connection.info.get("query_start") if context.connection is not None else None
+    if starts:
+        starts.pop()
+
+
+def instrument_engine(engine) -> None:
+    """Time every statement on `engine` and expose its pool; safe to call once per engine."""
+    global _pool
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+    _pool = engine.pool
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request count, latency and DB usage per route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        queries = [0, 0.0]
+        token = _request_queries.set(queries)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_queries.reset(token)
+            route = scope.get("route")
+            # Unmatched paths share one label so scanners cannot blow up cardinality.
+            template = getattr(route, "path", None) or "unmatched"
+            labels = (scope["method"], template, str(status[0]))
+            HTTP_REQUESTS.inc(labels)
+            HTTP_LATENCY.observe(labels, elapsed)
+            DB_QUERIES.observe((template,), queries[0])
+            DB_QUERY_TIME.observe((template,), queries[1])
+
+
+class timed_call:
+    """Context manager observing an external call's latency: `with timed_call(DARAJA_LATENCY, "stk_push"):`."""
+
+    def __init__(self, histogram: Histogram, operation: str):
+        self.histogram = histogram
+        self.operation = operation
+        self.outcome = "ok"  # callers may set "error" for failed responses that did not raise
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        outcome = "error" if exc_type else self.outcome
+        self.histogram.observe((self.operation, outcome), time.perf_counter() - self.start)
+        return False
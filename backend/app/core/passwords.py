@@ -0,0 +1,129 @@
+# backend/app/core/passwords.py
+"""
+Password hashing off the request path.
+
+A bcrypt hash or verify burns ~250 ms of CPU. Run on the request threadpool,
+a burst of logins at market opening holds the GIL in long chunks and stalls
+every other request on the worker. Here the work goes to a small process
+pool instead, behind an async API:
+
+    password_hash = await hash_password(plain)
+    valid, new_hash = await verify_password(plain, vendor.password_hash)
+
+At most HASH_CONCURRENCY jobs run at once per web worker (default: one per
+hashing process); later callers wait their turn, and once HASH_MAX_WAITING
+are already waiting, new ones get a 503 so a login storm cannot pile up
+unbounded. Waiting and hashing times are exported on /metrics.
+
+BCRYPT_ROUNDS sets the cost factor (default 12). verify_password returns a
+fresh hash when the stored one was made with a different cost, so callers
+can store it and hashes follow the setting as vendors log in.
+
+HASH_WORKERS is the number of hashing processes per web worker (default 1);
+0 hashes on the threadpool instead, for environments without subprocesses.
+"""
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from passlib.context import CryptContext
+
+from app.core.metrics import PASSWORD_HASH_JOBS, PASSWORD_HASH_SECONDS, PASSWORD_HASH_WAIT
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", "1"))
+HASH_CONCURRENCY = int(os.getenv("HASH_CONCURRENCY", str(max(HASH_WORKERS, 1))))
+HASH_MAX_WAITING = int(os.getenv("HASH_MAX_WAITING", "64"))
+
+# min = max = default, so a hash with any other cost reports needs_update.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+    bcrypt__max_rounds=BCRYPT_ROUNDS,
+)
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(password: str, password_hash: str) -> tuple[bool, str | None]:
+    return pwd_context.verify_and_update(password, password_hash)
+
+
+_executor = None
+_slots = None
+_running = 0
+_waiting = 0
+
+
+def _job_stats() -> dict:
+    return {("running",): _running, ("waiting",): _waiting}
+
+
+PASSWORD_HASH_JOBS.collect = _job_stats
+
+
+def start_pool() -> None:
+    """Start the hashing processes ahead of the first login (called from the app lifespan)."""
+    global _executor
+    if HASH_WORKERS > 0 and _executor is None:
+        # spawn, not fork: the web worker has threads and an event loop running
+        _executor = ProcessPoolExecutor(HASH_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        for _ in range(HASH_WORKERS):
+            _executor.submit(int)
+
+
+def shutdown_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def _run(operation: str, func, *args):
+    global _slots, _running, _waiting
+    if _slots is None:
+        _slots = asyncio.Semaphore(HASH_CONCURRENCY)
+    if _slots.locked() and _waiting >= HASH_MAX_WAITING:
+        raise HTTPException(status_code=503, detail="Server busy, please retry", headers={"Retry-After": "1"})
+
+    queued = time.perf_counter()
+    _waiting += 1
+    try:
+        await _slots.acquire()
+    finally:
+        _waiting -= 1
+    started = time.perf_counter()
+    PASSWORD_HASH_WAIT.observe((operation,), started - queued)
+    _running += 1
+    try:
+        if HASH_WORKERS <= 0:
+            return await run_in_threadpool(func, *args)
+        start_pool()
+        try:
+            return await asyncio.wrap_future(_executor.submit(func, *args))
+        except BrokenProcessPool:
+            # A hashing process died; start a fresh pool for the next caller.
+            shutdown_pool()
+            raise HTTPException(status_code=503, detail="Server busy, please retry", headers={"Retry-After": "1"})
+    finally:
+        _running -= 1
+        _slots.release()
+        PASSWORD_HASH_SECONDS.observe((operation,), time.perf_counter() - started)
+
+
+async def hash_password(password: str) -> str:
+    return await _run("hash", _hash, password)
+
+
+async def verify_password(password: str, password_hash: str) -> tuple[bool, str | None]:
+    """(valid, new_hash): new_hash is set when the stored hash should be replaced."""
+    return await _run("verify", _verify, password, password_hash)
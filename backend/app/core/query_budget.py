@@ -0,0 +1,130 @@
+# backend/app/core/query_budget.py
+"""
+Query budgets: catch N+1 regressions where they are introduced.
+
+A route handler declares how many SQL statements it may issue:
+
+    @router.get("/history")
+    @query_budget(3)
+    def get_mpesa_history(...):
+
+While the handler runs, every statement is counted and reduced to its shape
+(literals and IN-lists collapsed). The budget is broken when the handler
+issues more than `max_queries` statements, or the same shape more than
+`max_repeats` times - the signature of a per-row lazy load, whatever the
+row count of the test data.
+
+QUERY_BUDGET controls what a broken budget does: "warn" (default) logs it,
+"enforce" raises QueryBudgetExceeded so the request fails (for development
+and CI), "off" skips counting. `query_budget` also works as a context
+manager around any block of code.
+"""
+import functools
+import inspect
+import logging
+import os
+import re
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_REPEATS = 3
+
+_active: ContextVar = ContextVar("query_budgets", default=())
+
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s|:\w+|\$\d+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+|\$\d+))*\s*\)")
+_PARAMETER = re.compile(r"%\(\w+\)s|:\w+|\$\d+|%s")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_SPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def statement_shape(statement: str) -> str:
+    """The statement with parameters, literals and IN-lists collapsed, for spotting repeats."""
+    shape = _STRING.sub("?", statement)
+    shape = _PARAMETER.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    shape = _NUMBER.sub("?", shape)
+    return _SPACE.sub(" ", shape).strip()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    budgets = _active.get()
+    if budgets:
+        shape = statement_shape(statement)
+        for budget in budgets:
+            budget.shapes[shape] += 1
+
+
+class query_budget:
+    def __init__(self, max_queries: int, max_repeats: int = DEFAULT_MAX_REPEATS, name: str | None = None):
+        self.max_queries = max_queries
+        self.max_repeats = max_repeats
+        self.name = name
+        self.shapes = Counter()
+        self._token = None
+
+    @property
+    def count(self) -> int:
+        return sum(self.shapes.values())
+
+    def __enter__(self):
+        self.shapes = Counter()
+        self._token = _active.set(_active.get() + (self,))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _active.reset(self._token)
+        if exc_type is None:
+            self.check()
+        return False
+
+    def violations(self) -> list[str]:
+        problems = []
+        if self.count > self.max_queries:
+            problems.append(f"{self.count} statements, budget is {self.max_queries}")
+        for shape, times in self.shapes.most_common():
+            if times <= self.max_repeats:
+                break
+            problems.append(f"{times}x (max {self.max_repeats}): {shape[:200]}")
+        return problems
+
+    def check(self) -> None:
+        problems = self.violations()
+        if not problems:
+            return
+        message = f"Query budget exceeded in {self.name or 'block'}: " + "; ".join(problems)
+        if os.getenv("QUERY_BUDGET", "warn").lower() == "enforce":
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+    def __call__(self, func):
+        name = self.name or func.__qualname__
+
+        def budget():
+            return query_budget(self.max_queries, self.max_repeats, name)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if os.getenv("QUERY_BUDGET", "warn").lower() == "off":
+                    return await func(*args, **kwargs)
+                with budget():
+                    return await func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if os.getenv("QUERY_BUDGET", "warn").lower() == "off":
+                    return func(*args, **kwargs)
+                with budget():
+                    return func(*args, **kwargs)
+        return wrapper
@@ -0,0 +1,51 @@
+# backend/app/core/schema.py
+"""
+Startup check that the database schema is at the Alembic head.
+
+The schema is owned by Alembic (`alembic upgrade head`); the app never
+creates tables itself. At startup it only compares the revision stored in
+alembic_version with the head of migrations/versions: one small query
+instead of reflecting every table.
+
+SCHEMA_CHECK controls what a mismatch does: "warn" (default) logs it,
+"strict" refuses to start, "off" skips the check.
+"""
+import logging
+import os
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def head_revisions() -> set:
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+def current_revisions(engine) -> set:
+    with engine.connect() as connection:
+        return set(MigrationContext.configure(connection).get_current_heads())
+
+
+def check_schema(engine, mode: str | None = None) -> bool:
+    """True when the database is at head; logs or raises otherwise, per SCHEMA_CHECK."""
+    mode = (mode or os.getenv("SCHEMA_CHECK", "warn")).lower()
+    if mode == "off":
+        return True
+    current, heads = current_revisions(engine), head_revisions()
+    if current == heads:
+        return True
+    message = (
+        f"Database schema is at {sorted(current) or 'no revision'}, migrations head is {sorted(heads)}. "
+        "Run `alembic upgrade head`."
+    )
+    if mode == "strict":
+        raise RuntimeError(message)
+    logger.error(message)
+    return False
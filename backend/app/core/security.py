@@ -1,18 +1,15 @@
-from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import jwt
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+from app.core.passwords import pwd_context
 
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
+# Blocking helpers for scripts; request handlers use the async API in app.core.passwords.
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -1,16 +1,65 @@
+from threading import Lock
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+from app.core.metrics import instrument_engine
+
+
+def database_url() -> str:
+    url = os.getenv("DATABASE_URL")
+    if url and url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql://", 1)
+    return url
+
+
+# Connections per worker process. The request threadpool is sized to match
+# (see pool_capacity), so a sync endpoint never waits on the pool while
+# holding a thread.
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+
+def pool_capacity() -> int:
+    return POOL_SIZE + MAX_OVERFLOW
+
+
+# The engine (and the DB driver import behind it) is created on first use,
+# not at import, so importing the app stays cheap and side-effect free.
+_engine = None
+_engine_lock = Lock()
+
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                url = database_url()
+                options = {"echo": os.getenv("SQL_ECHO", "true").lower() in ("1", "true", "yes")}
+                if not url.startswith("sqlite"):
+                    options.update(pool_size=POOL_SIZE, max_overflow=MAX_OVERFLOW)
+                _engine = create_engine(url, **options)
+                instrument_engine(_engine)
+                SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+class _LazySessionmaker(sessionmaker):
+    def __call__(self, **local_kw):
+        if "bind" not in local_kw:
+            get_engine()
+        return super().__call__(**local_kw)
+
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+def __getattr__(name):
+    # Keeps `from app.database import engine` working for scripts and migrations.
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-if DATABASE_URL and DATABASE_URL.startswith("postgres://"):
-    DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
-engine = create_engine(DATABASE_URL, echo=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
\ No newline at end of file
+SessionLocal = _LazySessionmaker(autocommit=False, autoflush=False)
+Base = declarative_base()
@@ -2,6 +2,9 @@
 from app.database import SessionLocal
 from sqlalchemy.orm import Session
 
+# The one session provider for routes and auth. FastAPI caches a dependency
+# per request, so get_current_vendor and the route share this session (and
+# one pooled connection) as long as both depend on this exact function.
 def get_db():
     db: Session = SessionLocal()
     try:
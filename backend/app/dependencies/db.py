@@ -1,9 +0,0 @@
-# app/dependencies/db.py
-from app.database import SessionLocal
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
@@ -1,13 +1,22 @@
 # backend/app/main.py
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+
+from app.core.compression import CompressionMiddleware
+from app.core.metrics import MetricsMiddleware, render_metrics
+from app.core import passwords
 
-from app.database import Base, engine
+from app.core.schema import check_schema
+from app.database import get_engine, pool_capacity
 from app.routes import auth, sale, mpesa
 from app.routes.product import router as product_router
 from app.routes.purchase import router as purchase_router
 from app.routes.inventory import router as inventory_router
-from dotenv import load_dotenv
 from app.routes.vendor import router as vendor_router  # NEW
 from app.routes import vendor_preference
 from app.routes import spoilage_entry as spoilage_entry_router
@@ -18,15 +27,30 @@ from app.routes import inventory_history
 from app.routes import cart
 from app.routes import cart_item
 from app.routes import bonus_rule
+from app.routes import report
+from app.routes import analytics
+from app.routes import catalogue
 
 
 # --- IMPORTANT: force import all models here ---
 from app.models import product, sale as sale_model, vendor, purchase, inventory, mpesa_transaction
-# This ensures SQLAlchemy registers all models (Product, Sale, etc.) before metadata.create_all
+# This ensures SQLAlchemy registers all models (Product, Sale, etc.) before the first query
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema is managed by Alembic; startup only checks the revision.
+    await run_in_threadpool(check_schema, get_engine())
+    # Sync endpoints run in this threadpool and each holds a DB connection;
+    # more threads than connections would only queue on the pool.
+    to_thread.current_default_thread_limiter().total_tokens = pool_capacity()
+    passwords.start_pool()
+    yield
+    passwords.shutdown_pool()
+    get_engine().dispose()
 
-load_dotenv()  # loads .env into process env
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # CORS
 app.add_middleware(
@@ -36,6 +60,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Inside metrics, so recorded latency includes compression time
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 # Routers
 app.include_router(auth.router)
@@ -53,10 +80,9 @@ app.include_router(inventory_history.router)
 app.include_router(cart.router)
 app.include_router(cart_item.router)
 app.include_router(bonus_rule.router)
-
-
-# DB - run after all models are imported
-Base.metadata.create_all(bind=engine)
+app.include_router(report.router)
+app.include_router(analytics.router)
+app.include_router(catalogue.router)
 
 @app.get("/")
 def root():
@@ -66,6 +92,10 @@ def root():
 def ping():
     return {"ok": True}
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 @app.get("/envcheck")
 def envcheck():
     import os
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, Float, String, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 from datetime import datetime
@@ -12,4 +12,9 @@ class InventoryHistory(Base):
     quantity_change = Column(Float, nullable=False)
     timestamp = Column(DateTime, default=datetime.utcnow)
 
+    # history pages are read newest-first per inventory item
+    __table_args__ = (
+        Index("ix_inventory_history_inventory_timestamp", "inventory_id", "timestamp"),
+    )
+
     inventory = relationship("Inventory")
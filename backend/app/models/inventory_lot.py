@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, Float, ForeignKey, DateTime, Index
+from sqlalchemy.orm import relationship
+from app.database import Base
+from datetime import datetime
+
+class InventoryLot(Base):
+    __tablename__ = "inventory_lots"
+
+    id = Column(Integer, primary_key=True, index=True)
+    vendor_id = Column(Integer, ForeignKey("vendors.id"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+    purchase_id = Column(Integer, ForeignKey("purchases.id", ondelete="SET NULL"), nullable=True)
+
+    quantity = Column(Float, nullable=False)  # remaining in this lot
+    received_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expiry_date = Column(DateTime, nullable=True)
+    unit_cost = Column(Float, nullable=True)
+
+    # expiring-soon lookups are a range scan on (vendor_id, expiry_date)
+    __table_args__ = (
+        Index("ix_inventory_lots_vendor_expiry", "vendor_id", "expiry_date"),
+        Index("ix_inventory_lots_vendor_product", "vendor_id", "product_id"),
+    )
+
+    # relationships
+    vendor = relationship("Vendor")
+    product = relationship("Product", back_populates="lots")
+    purchase = relationship("Purchase")
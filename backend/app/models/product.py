@@ -1,5 +1,5 @@
 # backend/app/models/product.py
-from sqlalchemy import Column, Integer, String, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, Float
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -15,6 +15,10 @@ class Product(Base):
     sale_type = Column(String(50), nullable=False)     # quick-sell or manual
     is_active = Column(Boolean, default=True)
 
+    # moving-average cost basis, updated by purchases, sales and spoilage
+    avg_unit_cost = Column(Float, nullable=True)
+    cost_basis_quantity = Column(Float, default=0, nullable=False)
+
     # relationships
     vendor = relationship("Vendor", back_populates="products")
     sales = relationship("Sale", back_populates="product", cascade="all, delete-orphan")
@@ -22,6 +26,7 @@ class Product(Base):
     inventories = relationship("Inventory", back_populates="product", cascade="all, delete-orphan")
     mpesa_transactions = relationship("MpesaTransaction", back_populates="product", cascade="all, delete-orphan")
     spoilage_entries = relationship("SpoilageEntry", back_populates="product", cascade="all, delete-orphan")
+    lots = relationship("InventoryLot", back_populates="product", cascade="all, delete-orphan")
 
     pricings = relationship(
         "ProductPricing",
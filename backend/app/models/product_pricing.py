@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, Float, String, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 from datetime import datetime
@@ -14,3 +14,6 @@ class ProductPricing(Base):
     effective_to = Column(DateTime, nullable=True)
 
     product = relationship("Product", back_populates="pricings")
+
+# Newest window first per product, so resolving the active price is an index scan
+Index("ix_product_pricing_product_effective_from", ProductPricing.product_id, ProductPricing.effective_from.desc())
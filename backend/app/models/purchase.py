@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float, Index, func
 from sqlalchemy.orm import relationship
 from app.database import Base
 from datetime import datetime
@@ -16,7 +16,12 @@ class Purchase(Base):
 
     source = Column(String(255), nullable=True)  # optional supplier or location
     timestamp = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=func.now())
 
     # relationships
     vendor = relationship("Vendor", back_populates="purchases")
     product = relationship("Product", back_populates="purchases")
+
+    __table_args__ = (
+        Index("ix_purchases_vendor_timestamp", "vendor_id", "timestamp"),
+    )
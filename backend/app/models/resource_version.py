@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from app.database import Base
+
+class ResourceVersion(Base):
+    """Per-vendor change counter for a cacheable resource (products, inventory, ...)."""
+    __tablename__ = "resource_versions"
+
+    vendor_id = Column(Integer, ForeignKey("vendors.id", ondelete="CASCADE"), primary_key=True)
+    resource = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -20,10 +20,17 @@ class Sale(Base):
     applied_bonus_rule_id = Column(Integer, ForeignKey("bonus_rules.id"), nullable=True)
     
     total_price = Column(Float, nullable=False)
+    cost_of_goods = Column(Float, nullable=True)  # quantity x moving-average unit cost at sale time
     reference_no = Column(String, nullable=True)
     payment_type = Column(String, nullable=True)
     cart_id = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=func.now())
+
+    # reports and analytics read one vendor's sales over a time range
+    __table_args__ = (
+        Index("ix_sales_vendor_created_at", "vendor_id", "created_at"),
+    )
 
     # Relationships
     vendor = relationship("Vendor", back_populates="sales")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, Float, String, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from app.database import Base
 from datetime import datetime
@@ -12,6 +12,11 @@ class SpoilageEntry(Base):
     quantity = Column(Float, nullable=False)
     reason = Column(String(255), nullable=True)
     timestamp = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_spoilage_entries_vendor_timestamp", "vendor_id", "timestamp"),
+    )
 
     # relationships
     vendor = relationship("Vendor", back_populates="spoilage_entries")
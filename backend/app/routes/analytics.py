@@ -0,0 +1,56 @@
+# backend/app/routes/analytics.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Literal, Optional
+from datetime import date, timedelta
+
+from app.core.buckets import local_today
+from app.schemas.analytics import AnalyticsOverviewOut, ForecastOut, SalesSeriesOut
+from app.services import analytics as analytics_service
+from app.services import forecast as forecast_service
+from app.dependencies import get_db
+from app.routes.auth import get_current_vendor
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+
+@router.get("/overview", response_model=AnalyticsOverviewOut)
+def analytics_overview(
+    period: Literal["week", "month", "quarter", "year"] = "week",
+    width: Optional[int] = Query(None, ge=3, le=4000, description="Chart width in pixels; switches the series to daily points, at most this many"),
+    method: Literal["lttb", "minmax"] = "lttb",
+    db: Session = Depends(get_db),
+    current_vendor=Depends(get_current_vendor)
+):
+    """Totals, sales series, product shares, EAT hourly pattern and insights for the period."""
+    return analytics_service.analytics_overview(db, current_vendor.id, period, width, method)
+
+
+@router.get("/series", response_model=SalesSeriesOut)
+def sales_series(
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    width: Optional[int] = Query(None, ge=3, le=4000, description="Chart width in pixels; at most this many points are returned"),
+    method: Literal["lttb", "minmax"] = "lttb",
+    metric: Literal["revenue", "units", "profit"] = "revenue",
+    db: Session = Depends(get_db),
+    current_vendor=Depends(get_current_vendor)
+):
+    """Daily revenue, units and profit between two EAT days (default: the last year)."""
+    last_day = date_to or local_today()
+    first_day = date_from or last_day - timedelta(days=364)
+    if first_day > last_day:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+    if (last_day - first_day).days >= analytics_service.MAX_SERIES_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range is limited to {analytics_service.MAX_SERIES_DAYS} days")
+    return analytics_service.sales_timeseries(db, current_vendor.id, first_day, last_day, width, method, metric)
+
+
+@router.get("/forecast", response_model=ForecastOut)
+def demand_forecast(
+    horizon: int = Query(7, ge=1, le=28),
+    db: Session = Depends(get_db),
+    current_vendor=Depends(get_current_vendor)
+):
+    """Expected daily units per product for the next `horizon` days, with stock cover and reorder hints."""
+    return forecast_service.demand_forecast(db, current_vendor.id, horizon)
@@ -1,22 +1,21 @@
 from fastapi import APIRouter, HTTPException, Depends, status
-from app.core.security import verify_password, create_access_token
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from jose import jwt, JWTError
 from datetime import timedelta
 import os
-from dotenv import load_dotenv
 
-from app.database import SessionLocal
+from app.dependencies import get_db
 from app.models.vendor import Vendor
 from app.models.vendor_preference import VendorPreference
 from app.schemas.vendor import VendorCreate, VendorOut
 from app.schemas.auth import AuthResponse
 from app.schemas.onboarding import OnboardingData
-from app.core.security import get_password_hash, create_access_token
-
-load_dotenv()
+from app.services.resource_version import bump_resource_version, VENDOR_PREFERENCES
+from app.core.passwords import hash_password, verify_password
+from app.core.security import create_access_token
 
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
@@ -25,20 +24,20 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+def _find_vendor(db: Session, email: str):
+    """The vendor with this email, detached with its columns loaded.
+
+    Ends the session's transaction, so the pooled connection goes back before
+    the caller awaits a password hash (which can queue behind a login burst).
+    """
+    vendor = db.query(Vendor).filter(Vendor.email == email).first()
+    if vendor is not None:
+        db.expunge(vendor)
+    db.rollback()
+    return vendor
 
-@router.post("/register", response_model=VendorOut)
-def register_vendor(vendor: VendorCreate, db: Session = Depends(get_db)):
-    existing = db.query(Vendor).filter(Vendor.email == vendor.email).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
 
-    hashed_pw = get_password_hash(vendor.password)
+def _create_vendor(db: Session, vendor: VendorCreate, hashed_pw: str) -> Vendor:
     new_vendor = Vendor(
         name=vendor.name,
         email=vendor.email,
@@ -54,9 +53,30 @@ def register_vendor(vendor: VendorCreate, db: Session = Depends(get_db)):
     default_preferences = VendorPreference(vendor_id=new_vendor.id)
     db.add(default_preferences)
     db.commit()
+    db.refresh(new_vendor)
 
     return new_vendor
 
+
+def _store_password_hash(db: Session, vendor: Vendor, password_hash: str) -> None:
+    # vendor is detached (see _find_vendor): update by id, then mirror the change
+    db.query(Vendor).filter(Vendor.id == vendor.id).update({Vendor.password_hash: password_hash})
+    db.commit()
+    vendor.password_hash = password_hash
+
+
+# Hashing runs in the password process pool; DB work stays on the threadpool.
+# No transaction is open while a hash is awaited, so waiting logins hold no
+# pooled connection; register writes the vendor only once the hash is done.
+@router.post("/register", response_model=VendorOut)
+async def register_vendor(vendor: VendorCreate, db: Session = Depends(get_db)):
+    existing = await run_in_threadpool(_find_vendor, db, vendor.email)
+    if existing:
+        raise HTTPException(status_code=400, detail="Email already registered")
+
+    hashed_pw = await hash_password(vendor.password)
+    return await run_in_threadpool(_create_vendor, db, vendor, hashed_pw)
+
 # Add this for token-based vendor authentication
 def get_current_vendor(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Vendor:
     credentials_exception = HTTPException(
@@ -77,10 +97,16 @@ def get_current_vendor(token: str = Depends(oauth2_scheme), db: Session = Depend
         raise credentials_exception
     return vendor
 @router.post("/login", response_model=AuthResponse)
-def login_vendor(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    vendor = db.query(Vendor).filter(Vendor.email == form_data.username).first()
-    if not vendor or not verify_password(form_data.password, vendor.password_hash):
+async def login_vendor(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+    vendor = await run_in_threadpool(_find_vendor, db, form_data.username)
+    if not vendor:
+        raise HTTPException(status_code=404, detail="Invalid credentials")
+    valid, new_hash = await verify_password(form_data.password, vendor.password_hash)
+    if not valid:
         raise HTTPException(status_code=404, detail="Invalid credentials")
+    if new_hash:
+        # Stored with another BCRYPT_ROUNDS; upgrade it now that we have the password.
+        await run_in_threadpool(_store_password_hash, db, vendor, new_hash)
 
     access_token_expires = timedelta(minutes=60)
     access_token = create_access_token(
@@ -125,6 +151,7 @@ def complete_onboarding(
 
     # Mark onboarding as completed
     current_vendor.onboarding_completed = True
+    bump_resource_version(db, current_vendor.id, VENDOR_PREFERENCES)
 
     db.commit()
     db.refresh(current_vendor)
@@ -1,20 +1,16 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
-from app.database import SessionLocal
+from app.dependencies import get_db
 from app.schemas.bonus_rule import BonusRuleCreate, BonusRuleOut, BonusRuleUpdate
 from app.services import bonus_rule as bonus_rule_service
 from app.models.vendor import Vendor
 from app.routes.auth import get_current_vendor
+from app.core.etag import not_modified
+from app.core.query_budget import query_budget
+from app.services.resource_version import resource_etag, BONUS_RULES
 
 router = APIRouter(prefix="/bonus-rules", tags=["Bonus Rules"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/", response_model=BonusRuleOut)
 def create_bonus_rule(
     rule: BonusRuleCreate,
@@ -25,20 +21,28 @@ def create_bonus_rule(
     return bonus_rule_service.format_bonus_rule_response(result)
 
 @router.get("/", response_model=list[BonusRuleOut])
+@query_budget(3)
 def list_all_bonus_rules(
+    request: Request,
+    response: Response,
     current_vendor: Vendor = Depends(get_current_vendor),
     db: Session = Depends(get_db)
 ):
     """List all bonus rules for the authenticated vendor's products."""
+    cached = not_modified(request, response, resource_etag(db, current_vendor.id, BONUS_RULES))
+    if cached:
+        return cached
     rules = bonus_rule_service.list_all_vendor_bonus_rules(db, current_vendor.id)
     return [bonus_rule_service.format_bonus_rule_response(rule) for rule in rules]
 
 @router.get("/{rule_id}", response_model=BonusRuleOut)
+@query_budget(2)
 def get_bonus_rule(rule_id: int, db: Session = Depends(get_db)):
     rule = bonus_rule_service.get_bonus_rule(db, rule_id)
     return bonus_rule_service.format_bonus_rule_response(rule)
 
 @router.get("/product/{product_id}", response_model=list[BonusRuleOut])
+@query_budget(2)
 def list_bonus_rules(product_id: int, db: Session = Depends(get_db)):
     rules = bonus_rule_service.list_bonus_rules(db, product_id)
     return [bonus_rule_service.format_bonus_rule_response(rule) for rule in rules]
@@ -1,19 +1,12 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from app.database import SessionLocal
+from app.dependencies import get_db
 from app.schemas.cart import CartCreate, CartOut, CartUpdate
 from app.services import cart as cart_service
 from app.routes.auth import get_current_vendor
 
 router = APIRouter(prefix="/carts", tags=["Carts"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/", response_model=CartOut)
 def create_cart(cart: CartCreate, db: Session = Depends(get_db)):
     return cart_service.create_cart(db, cart)
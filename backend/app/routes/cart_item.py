@@ -1,18 +1,11 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from app.database import SessionLocal
+from app.dependencies import get_db
 from app.schemas.cart_item import CartItemCreate, CartItemOut, CartItemUpdate
 from app.services import cart_item as cart_item_service
 
 router = APIRouter(prefix="/cart-items", tags=["Cart Items"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/", response_model=CartItemOut)
 def create_cart_item(item: CartItemCreate, db: Session = Depends(get_db)):
     return cart_item_service.create_cart_item(db, item)
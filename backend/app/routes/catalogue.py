@@ -0,0 +1,19 @@
+# backend/app/routes/catalogue.py
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.schemas.catalogue import CatalogueItem
+from app.services import catalogue as catalogue_service
+from app.dependencies import get_db
+from app.routes.auth import get_current_vendor
+
+router = APIRouter(prefix="/catalogue", tags=["Catalogue"])
+
+
+@router.get("/", response_model=list[CatalogueItem])
+def get_catalogue(
+    db: Session = Depends(get_db),
+    current_vendor=Depends(get_current_vendor)
+):
+    """Active products with current price, stock on hand and active bonus rules, for the POS."""
+    return catalogue_service.get_catalogue(db, current_vendor.id)
@@ -1,19 +1,78 @@
 # backend/app/routes/inventory.py
-from fastapi import APIRouter, Depends, HTTPException
+import codecs
+import csv
+import re
+from datetime import timedelta
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
-from app.database import SessionLocal
-from app.schemas.inventory import InventoryCreate, InventoryOut
+from app.dependencies import get_db
+from app.schemas.inventory import InventoryCreate, InventoryOut, InventoryBulkRow, InventoryBulkResponse, InventoryLotOut
 from app.services import inventory as inventory_service
+from app.services import inventory_lot as inventory_lot_service
 from app.routes.auth import get_current_vendor
+from app.core.etag import not_modified
+from app.core.query_budget import query_budget
+from app.services.resource_version import resource_etag, INVENTORY
 
 router = APIRouter(prefix="/inventory", tags=["Inventory"])
 
-def get_db():
-    db = SessionLocal()
+MAX_BULK_ROWS = 5000
+WINDOW_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+MAX_WINDOW = timedelta(days=365)
+
+async def _iter_csv_records(request: Request):
+    """Yield CSV records as dicts while the body is still streaming in.
+
+    Lines are joined until their quotes balance, so a quoted field may
+    contain newlines; each complete record is then parsed by csv.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    header = None
+    pending = ""
+    record, quotes = "", 0
+
+    def parse(text):
+        nonlocal header
+        values = next(csv.reader([text]), None)
+        if not values:
+            return None
+        if header is None:
+            header = [value.strip().lower() for value in values]
+            return None
+        return dict(zip(header, values))
+
+    async for chunk in request.stream():
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            record += line + "\n"
+            quotes += line.count('"')
+            if quotes % 2:
+                continue  # inside a quoted field: the newline is data
+            parsed = parse(record)
+            record, quotes = "", 0
+            if parsed is not None:
+                yield parsed
+    record += pending + decoder.decode(b"", final=True)
+    if record.strip():
+        parsed = parse(record)
+        if parsed is not None:
+            yield parsed
+
+def _parse_window(value: str) -> timedelta:
+    """Parse windows such as "48h", "3d" or "90m", up to MAX_WINDOW."""
+    match = re.fullmatch(r"\s*(\d+)\s*([mhdw])\s*", value.lower())
+    if not match:
+        raise HTTPException(status_code=400, detail="within must look like 48h, 3d, 90m or 1w")
     try:
-        yield db
-    finally:
-        db.close()
+        window = timedelta(**{WINDOW_UNITS[match.group(2)]: int(match.group(1))})
+    except OverflowError:
+        window = None
+    if window is None or window > MAX_WINDOW:
+        raise HTTPException(status_code=400, detail=f"within can be at most {MAX_WINDOW.days}d")
+    return window
 
 @router.post("/", response_model=InventoryOut)
 def add_inventory(
@@ -23,9 +82,73 @@ def add_inventory(
 ):
     return inventory_service.add_inventory(db, current_vendor.id, inventory)
 
+@router.post("/bulk", response_model=InventoryBulkResponse)
+@query_budget(10)
+async def bulk_import_inventory(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_vendor = Depends(get_current_vendor)
+):
+    """
+    Stock-take import: a JSON array or a text/csv body of
+    product_id,quantity,mode rows (mode is "set" or "add", default "set").
+    Valid rows are applied in a single transaction; invalid rows are reported.
+    """
+    too_many = HTTPException(status_code=413, detail=f"At most {MAX_BULK_ROWS} rows per request")
+    if request.headers.get("content-type", "").startswith("text/csv"):
+        records = []
+        async for record in _iter_csv_records(request):
+            if len(records) == MAX_BULK_ROWS:
+                raise too_many  # stop reading as soon as the limit is passed
+            records.append(record)
+    else:
+        try:
+            records = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Body is not valid JSON")
+        if not isinstance(records, list):
+            raise HTTPException(status_code=400, detail="Expected a JSON array of rows")
+        if len(records) > MAX_BULK_ROWS:
+            raise too_many
+
+    rows, errors = [], []
+    for row_no, record in enumerate(records, start=1):
+        if not isinstance(record, dict):
+            errors.append({"row": row_no, "status": "error", "detail": "Row must be an object"})
+            continue
+        try:
+            rows.append((row_no, InventoryBulkRow(**{
+                key: value for key, value in record.items() if value not in ("", None)
+            })))
+        except ValidationError as e:
+            detail = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+            errors.append({"row": row_no, "status": "error", "detail": detail})
+
+    results = await run_in_threadpool(inventory_service.bulk_upsert_inventory, db, current_vendor.id, rows)
+    results = sorted(results + errors, key=lambda result: result["row"])
+    failed = sum(1 for result in results if result["status"] == "error")
+    return {"applied": len(results) - failed, "failed": failed, "results": results}
+
 @router.get("/", response_model=list[InventoryOut])
 def list_inventory(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_vendor = Depends(get_current_vendor)
 ):
+    cached = not_modified(request, response, resource_etag(db, current_vendor.id, INVENTORY))
+    if cached:
+        return cached
     return inventory_service.list_inventory(db, current_vendor.id)
+
+@router.get("/expiring", response_model=list[InventoryLotOut])
+def list_expiring_lots(
+    within: str = "48h",
+    include_expired: bool = False,
+    db: Session = Depends(get_db),
+    current_vendor = Depends(get_current_vendor)
+):
+    """Stocked lots whose expiry falls within the window, soonest first."""
+    return inventory_lot_service.list_expiring_lots(
+        db, current_vendor.id, _parse_window(within), include_expired
+    )
@@ -1,22 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from app.database import SessionLocal
-from app.schemas.inventory_history import InventoryHistoryCreate, InventoryHistoryOut
-from app.services import inventory_history
+from typing import Optional
+from datetime import datetime
+from app.dependencies import get_db
+from app.schemas.inventory_history import InventoryHistoryCreate, InventoryHistoryOut, InventoryHistoryPage
+from app.services import inventory_history as inventory_history_service
+from app.services import inventory as inventory_service
+from app.routes.auth import get_current_vendor
 
 router = APIRouter(prefix="/inventory-history", tags=["InventoryHistory"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/", response_model=InventoryHistoryOut)
-def add_inventory_history(history: InventoryHistoryCreate, db: Session = Depends(get_db)):
+def add_inventory_history(
+    history: InventoryHistoryCreate,
+    db: Session = Depends(get_db),
+    current_vendor = Depends(get_current_vendor)
+):
+    if not inventory_service.get_inventory_item(db, current_vendor.id, history.inventory_id):
+        raise HTTPException(status_code=404, detail="Inventory item not found or not yours")
     return inventory_history_service.create_inventory_history(db, history)
 
-@router.get("/{inventory_id}", response_model=list[InventoryHistoryOut])
-def get_inventory_history(inventory_id: int, db: Session = Depends(get_db)):
-    return inventory_history_service.list_inventory_history(db, inventory_id)
+@router.get("/{inventory_id}", response_model=InventoryHistoryPage)
+def get_inventory_history(
+    inventory_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    change_type: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_vendor = Depends(get_current_vendor)
+):
+    """Newest-first ledger page; pass next_cursor back as cursor for the following page."""
+    items, next_cursor = inventory_history_service.list_inventory_history(
+        db, current_vendor.id, inventory_id, limit, cursor, date_from, date_to, change_type
+    )
+    return {"items": items, "next_cursor": next_cursor}
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session, joinedload
-from app.database import SessionLocal
+from sqlalchemy.orm import Session
+from app.dependencies import get_db
 from app.services import mpesa as mpesa_service
 from app.schemas.mpesa import STKPushRequest, STKPushResponse, MpesaHistoryOut
 from app.routes.auth import get_current_vendor
+from app.core.query_budget import query_budget
+from app.core.responses import ORJSONResponse
 from app.models.mpesa_transaction import MpesaTransaction
 from app.models.sale import Sale
 from app.models.inventory import Inventory
@@ -16,13 +18,6 @@ from logging.handlers import RotatingFileHandler
 
 router = APIRouter(prefix="/mpesa", tags=["mpesa"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # Logging setup (rotating file)
 LOG_DIR = os.getenv("LOG_DIR", "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -205,6 +200,7 @@ async def mpesa_callback(request: Request, db: Session = Depends(get_db)):
 
 # Basic history endpoint (keeps previous shape)
 @router.get("/history", response_model=List[MpesaHistoryOut])
+@query_budget(2)
 def get_mpesa_history(
     db: Session = Depends(get_db),
     current_vendor=Depends(get_current_vendor),
@@ -216,13 +212,22 @@ def get_mpesa_history(
         .all()
     )
 
-    history = []
-    for tx in transactions:
-        sale = (
+    # One query for all linked sales instead of one per transaction
+    receipts = {tx.mpesa_receipt for tx in transactions if tx.mpesa_receipt}
+    sales_by_receipt = {}
+    if receipts:
+        sales = (
             db.query(Sale)
-            .filter(Sale.reference_no == tx.mpesa_receipt)
-            .first()
+            .filter(Sale.vendor_id == current_vendor.id, Sale.reference_no.in_(receipts))
+            .order_by(Sale.id)
+            .all()
         )
+        for sale in sales:
+            sales_by_receipt.setdefault(sale.reference_no, sale)
+
+    history = []
+    for tx in transactions:
+        sale = sales_by_receipt.get(tx.mpesa_receipt)
         history.append({
             "transaction_id": tx.id,
             "amount": tx.amount,
@@ -238,7 +243,7 @@ def get_mpesa_history(
             "quantity": sale.quantity if sale else None,
             "unit_price": sale.unit_price if sale else None,
             "total_price": sale.total_price if sale else None,
-            "sale_timestamp": sale.timestamp if sale else None,
+            "sale_timestamp": sale.created_at if sale else None,
         })
 
     return history
@@ -246,35 +251,43 @@ def get_mpesa_history(
 
 # Enhanced history (product+vendor names)
 @router.get("/history/enhanced")
+@query_budget(1)
 def get_enhanced_mpesa_history(
     db: Session = Depends(get_db),
     current_vendor=Depends(get_current_vendor)
 ):
-    txs = (
-        db.query(MpesaTransaction)
-        .options(joinedload(MpesaTransaction.product), joinedload(MpesaTransaction.vendor))
+    # Read-only list: column tuples straight to orjson, no ORM objects.
+    # Every row belongs to the current vendor, so its name needs no join.
+    rows = (
+        db.query(
+            MpesaTransaction.id,
+            MpesaTransaction.merchant_request_id,
+            MpesaTransaction.checkout_request_id,
+            MpesaTransaction.amount,
+            MpesaTransaction.phone_number,
+            MpesaTransaction.account_reference,
+            MpesaTransaction.response_code,
+            MpesaTransaction.response_description,
+            MpesaTransaction.result_code,
+            MpesaTransaction.result_desc,
+            MpesaTransaction.mpesa_receipt,
+            Product.name,
+            MpesaTransaction.created_at,
+        )
+        .outerjoin(Product, Product.id == MpesaTransaction.product_id)
         .filter(MpesaTransaction.vendor_id == current_vendor.id)
         .order_by(MpesaTransaction.created_at.desc())
         .all()
     )
 
-    history = []
-    for tx in txs:
-        history.append({
-            "transaction_id": tx.id,
-            "merchant_request_id": tx.merchant_request_id,
-            "checkout_request_id": tx.checkout_request_id,
-            "amount": tx.amount,
-            "phone_number": tx.phone_number,
-            "account_reference": tx.account_reference,
-            "response_code": tx.response_code,
-            "response_description": tx.response_description,
-            "result_code": tx.result_code,
-            "result_desc": tx.result_desc,
-            "mpesa_receipt": tx.mpesa_receipt,
-            "product": tx.product.name if tx.product else None,
-            "vendor": tx.vendor.name if tx.vendor else None,
-            "created_at": tx.created_at,
-        })
+    keys = (
+        "transaction_id", "merchant_request_id", "checkout_request_id", "amount", "phone_number",
+        "account_reference", "response_code", "response_description", "result_code", "result_desc",
+        "mpesa_receipt", "product",
+    )
+    history = [
+        {**dict(zip(keys, row)), "vendor": current_vendor.name, "created_at": row.created_at}
+        for row in rows
+    ]
 
-    return {"history": history}
+    return ORJSONResponse({"history": history})
@@ -1,22 +1,17 @@
 # backend/app/routes/payment.py
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from app.database import SessionLocal
+from app.dependencies import get_db
 from app.schemas.payment import PaymentCreate, PaymentOut
 from app.services import payment as payment_service
 from app.routes.auth import get_current_vendor
+from app.core.query_budget import query_budget
 from app.models.sale import Sale
 
 router = APIRouter(prefix="/payments", tags=["Payments"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/", response_model=PaymentOut)
+@query_budget(4)
 def create_payment(
     payment: PaymentCreate,
     db: Session = Depends(get_db),
@@ -33,6 +28,7 @@ def create_payment(
     return payment_service.create_payment(db, payment)
 
 @router.get("/sale/{sale_id}", response_model=list[PaymentOut])
+@query_budget(2)
 def list_payments_for_sale(
     sale_id: int,
     db: Session = Depends(get_db),
@@ -48,16 +44,17 @@ def list_payments_for_sale(
     return payment_service.get_payments_for_sale(db, sale_id)
 
 @router.delete("/{payment_id}")
+@query_budget(3)
 def delete_payment(
     payment_id: int,
     db: Session = Depends(get_db),
     current_vendor = Depends(get_current_vendor)
 ):
-    payment = payment_service.get_payment_by_id(db, payment_id)
+    payment, owner_id = payment_service.get_payment_with_owner(db, payment_id)
     if not payment:
         raise HTTPException(status_code=404, detail="Payment not found")
 
-    if payment.sale.vendor_id != current_vendor.id:
+    if owner_id != current_vendor.id:
         raise HTTPException(status_code=403, detail="Not allowed")
 
     success = payment_service.delete_payment(db, payment_id)
@@ -1,21 +1,16 @@
 # backend/app/routes/product.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 from typing import List
-from app.database import SessionLocal
+from app.dependencies import get_db
 from app.schemas.product import ProductCreate, ProductOut
 from app.services import product as product_service
 from app.routes.auth import get_current_vendor
+from app.core.etag import not_modified
+from app.services.resource_version import resource_etag, PRODUCTS
 
 router = APIRouter(prefix="/products", tags=["products"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/", response_model=ProductOut, status_code=status.HTTP_201_CREATED)
 def create_product(
     product_in: ProductCreate,
@@ -26,9 +21,14 @@ def create_product(
 
 @router.get("/", response_model=List[ProductOut])
 def list_products(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_vendor=Depends(get_current_vendor),
 ):
+    cached = not_modified(request, response, resource_etag(db, current_vendor.id, PRODUCTS))
+    if cached:
+        return cached
     return product_service.get_products_by_vendor(db, vendor_id=current_vendor.id)
 
 @router.get("/{product_id}", response_model=ProductOut)
@@ -1,21 +1,17 @@
 # backend/app/routes/product_pricing.py
+from datetime import datetime
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from app.database import SessionLocal
-from app.schemas.product_pricing import ProductPricingCreate, ProductPricingOut
+from app.dependencies import get_db
+from app.schemas.product_pricing import ProductPricingCreate, ProductPricingOut, PriceSuggestionsOut, CurrentPriceOut
 from app.services import product_pricing as pricing_service
+from app.services import price_suggestion as suggestion_service
 from app.routes.auth import get_current_vendor
 from app.models.product import Product
 
 router = APIRouter(prefix="/product-pricings", tags=["Product Pricing"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/", response_model=ProductPricingOut)
 def create_product_pricing(
     pricing: ProductPricingCreate,
@@ -32,6 +28,23 @@ def create_product_pricing(
 
     return pricing_service.create_product_pricing(db, pricing)
 
+@router.get("/current", response_model=list[CurrentPriceOut])
+def get_current_prices(
+    at: Optional[datetime] = None,
+    db: Session = Depends(get_db),
+    current_vendor = Depends(get_current_vendor)
+):
+    """Active price of every product at `at` (UTC, default now) - the POS price list."""
+    return pricing_service.resolve_current_prices(db, current_vendor.id, at)
+
+@router.get("/suggestions", response_model=PriceSuggestionsOut)
+def get_price_suggestions(
+    db: Session = Depends(get_db),
+    current_vendor = Depends(get_current_vendor)
+):
+    """Suggested prices for all products from recent costs, pricing_margin and sell-through."""
+    return suggestion_service.price_suggestions(db, current_vendor.id)
+
 @router.get("/{product_id}", response_model=list[ProductPricingOut])
 def get_pricings_for_product(
     product_id: int,
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
 
+from app.core.responses import ORJSONResponse, column_rows
 from app.schemas.purchase import PurchaseCreate, PurchaseOut, PurchaseUpdate
 from app.services import purchase as purchase_service
 from app.dependencies import get_db
@@ -24,7 +25,8 @@ def get_all_purchases(
     db: Session = Depends(get_db),
     current_vendor=Depends(get_current_vendor)
 ):
-    return purchase_service.get_purchases_by_vendor(db, vendor_id=current_vendor.id)
+    rows = purchase_service.get_purchase_rows(db, vendor_id=current_vendor.id)
+    return ORJSONResponse(column_rows(rows, PurchaseOut))
 
 
 @router.get("/{purchase_id}", response_model=PurchaseOut)
@@ -0,0 +1,37 @@
+# backend/app/routes/report.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Literal, Optional
+from datetime import date, datetime
+
+from app.schemas.report import MarginReportOut, PnlReportOut
+from app.services import report as report_service
+from app.dependencies import get_db
+from app.routes.auth import get_current_vendor
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+
+@router.get("/margin", response_model=MarginReportOut)
+def margin_report(
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    db: Session = Depends(get_db),
+    current_vendor=Depends(get_current_vendor)
+):
+    """Gross margin per product over [from, to), from cost of goods stamped at sale time."""
+    return report_service.margin_report(db, current_vendor.id, date_from, date_to)
+
+
+@router.get("/pnl", response_model=PnlReportOut)
+def pnl_report(
+    period: Literal["day", "week", "month"] = "week",
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    db: Session = Depends(get_db),
+    current_vendor=Depends(get_current_vendor)
+):
+    """Revenue, discounts, purchase cost, spoilage cost and net per EAT day/week/month (inclusive dates)."""
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+    return report_service.pnl_report(db, current_vendor.id, period, date_from, date_to)
@@ -1,10 +1,11 @@
 # backend/app/routes/sale.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel
 
-from app.schemas.sale import SaleCreate, SaleOut, SaleUpdate
+from app.core.responses import ORJSONResponse, column_rows
+from app.schemas.sale import SaleCreate, SaleOut, SaleUpdate, TopSellerOut
 from app.services import sale as sale_service
 from app.dependencies import get_db
 from app.routes.auth import get_current_vendor
@@ -89,7 +90,20 @@ def get_sales(
     current_vendor=Depends(get_current_vendor)
 ):
     """Get all sales for the vendor"""
-    return sale_service.get_sales_by_vendor(db, vendor_id=current_vendor.id)
+    rows = sale_service.get_sale_rows(db, vendor_id=current_vendor.id)
+    return ORJSONResponse(column_rows(rows, SaleOut))
+
+
+@router.get("/top", response_model=List[TopSellerOut])
+def get_top_sellers(
+    k: int = Query(5, ge=1, le=50),
+    period: Literal["week", "month", "quarter", "year"] = "week",
+    by: Literal["units", "revenue"] = "units",
+    db: Session = Depends(get_db),
+    current_vendor=Depends(get_current_vendor)
+):
+    """Top k products for the period, with rank movement against the previous period"""
+    return sale_service.top_sellers(db, current_vendor.id, k, period, by)
 
 
 @router.get("/{sale_id}", response_model=SaleOut)
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Optional
+from datetime import datetime
 
-from app.schemas.spoilage_entry import SpoilageEntryCreate, SpoilageEntryOut, SpoilageEntryUpdate
+from app.schemas.spoilage_entry import SpoilageEntryCreate, SpoilageEntryOut, SpoilageEntryUpdate, SpoilageSummaryOut
 from app.services import spoilage_entry as spoilage_service
 from app.dependencies import get_db
 from app.routes.auth import get_current_vendor
@@ -22,9 +23,21 @@ def create_entry(
     return spoilage_service.create_spoilage_entry(db, current_vendor.id, entry)
 
 
+@router.get("/summary", response_model=List[SpoilageSummaryOut], response_model_exclude_none=True)
+def spoilage_summary(
+    group_by: Literal["product", "day", "reason"] = "product",
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    db: Session = Depends(get_db),
+    current_vendor = Depends(get_current_vendor)
+):
+    """Spoiled quantity totals grouped by product, day (EAT) or reason over [from, to)."""
+    return spoilage_service.summarize_spoilage(db, current_vendor.id, group_by, date_from, date_to)
+
+
 @router.get("/{entry_id}", response_model=SpoilageEntryOut)
-def get_entry(entry_id: int, db: Session = Depends(get_db)):
-    db_entry = spoilage_service.get_spoilage_entry(db, entry_id)
+def get_entry(entry_id: int, db: Session = Depends(get_db), current_vendor = Depends(get_current_vendor)):
+    db_entry = spoilage_service.get_spoilage_entry(db, current_vendor.id, entry_id)
     if not db_entry:
         raise HTTPException(status_code=404, detail="Spoilage entry not found")
     return db_entry
@@ -41,16 +54,21 @@ def list_entries(
 
 
 @router.put("/{entry_id}", response_model=SpoilageEntryOut)
-def update_entry(entry_id: int, entry_update: SpoilageEntryUpdate, db: Session = Depends(get_db)):
-    updated_entry = spoilage_service.update_spoilage_entry(db, entry_id, entry_update)
+def update_entry(
+    entry_id: int,
+    entry_update: SpoilageEntryUpdate,
+    db: Session = Depends(get_db),
+    current_vendor = Depends(get_current_vendor)
+):
+    updated_entry = spoilage_service.update_spoilage_entry(db, current_vendor.id, entry_id, entry_update)
     if not updated_entry:
         raise HTTPException(status_code=404, detail="Spoilage entry not found")
     return updated_entry
 
 
 @router.delete("/{entry_id}", response_model=dict)
-def delete_entry(entry_id: int, db: Session = Depends(get_db)):
-    deleted = spoilage_service.delete_spoilage_entry(db, entry_id)
+def delete_entry(entry_id: int, db: Session = Depends(get_db), current_vendor = Depends(get_current_vendor)):
+    deleted = spoilage_service.delete_spoilage_entry(db, current_vendor.id, entry_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Spoilage entry not found")
     return {"ok": True}
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List
 from app.dependencies import get_db
 
+from app.core.passwords import hash_password
 from app.schemas.vendor import VendorCreate, VendorUpdate, VendorOut
 from app.services import vendor as vendor_service
 from app.dependencies import get_db
@@ -11,11 +13,12 @@ router = APIRouter(prefix="/vendors", tags=["Vendors"])
 
 
 @router.post("/", response_model=VendorOut)
-def create_vendor(vendor_in: VendorCreate, db: Session = Depends(get_db)):
-    existing_vendor = vendor_service.get_vendor_by_email(db, vendor_in.email)
+async def create_vendor(vendor_in: VendorCreate, db: Session = Depends(get_db)):
+    existing_vendor = await run_in_threadpool(vendor_service.get_vendor_by_email, db, vendor_in.email)
     if existing_vendor:
         raise HTTPException(status_code=400, detail="Email already registered")
-    return vendor_service.create_vendor(db, vendor_in)
+    password_hash = await hash_password(vendor_in.password)
+    return await run_in_threadpool(vendor_service.create_vendor, db, vendor_in, password_hash)
 
 
 @router.get("/{vendor_id}", response_model=VendorOut)
@@ -32,8 +35,9 @@ def get_all_vendors(skip: int = 0, limit: int = 10, db: Session = Depends(get_db
 
 
 @router.put("/{vendor_id}", response_model=VendorOut)
-def update_vendor(vendor_id: int, vendor_in: VendorUpdate, db: Session = Depends(get_db)):
-    updated = vendor_service.update_vendor(db, vendor_id, vendor_in)
+async def update_vendor(vendor_id: int, vendor_in: VendorUpdate, db: Session = Depends(get_db)):
+    password_hash = await hash_password(vendor_in.password) if vendor_in.password is not None else None
+    updated = await run_in_threadpool(vendor_service.update_vendor, db, vendor_id, vendor_in, password_hash)
     if not updated:
         raise HTTPException(status_code=404, detail="Vendor not found")
     return updated
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from app.dependencies import get_db
 from app.schemas.vendor_preference import VendorPreferenceCreate, VendorPreferenceUpdate, VendorPreferenceOut
 from app.services import vendor_preference
 from app.routes.auth import get_current_vendor
+from app.core.etag import not_modified
+from app.services.resource_version import resource_etag, VENDOR_PREFERENCES
 
 router = APIRouter(prefix="/vendor-preferences", tags=["Vendor Preferences"])
 
@@ -18,9 +20,14 @@ def create_pref(
 
 @router.get("/", response_model=VendorPreferenceOut)
 def read_pref(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_vendor = Depends(get_current_vendor)
 ):
+    cached = not_modified(request, response, resource_etag(db, current_vendor.id, VENDOR_PREFERENCES))
+    if cached:
+        return cached
     pref = vendor_preference.get_vendor_preference(db, current_vendor.id)
     if not pref:
         # Return default preferences if none exist
@@ -0,0 +1,93 @@
+from pydantic import BaseModel
+from datetime import date, datetime
+from typing import List, Optional
+
+
+class AnalyticsTotals(BaseModel):
+    revenue: float
+    units: float
+    transactions: int
+    discounts: float
+    cost_of_goods: float
+    gross_profit: float
+    margin_pct: Optional[float] = None
+    cash_revenue: float
+    mpesa_revenue: float
+    spoilage_quantity: float
+    spoilage_rate: float
+    inventory_items: int
+    inventory_units: float
+    inventory_value: float
+
+
+class SalesBucket(BaseModel):
+    bucket: date
+    revenue: float
+    units: float
+    profit: float
+
+
+class ProductShare(BaseModel):
+    product_id: int
+    product_name: str
+    revenue: float
+    share: float
+
+
+class HourlyPoint(BaseModel):
+    hour: int
+    units: float
+    revenue: float
+
+
+class Insight(BaseModel):
+    id: str
+    title: str
+    detail: str
+    tone: str  # info / success / alert
+
+
+class AnalyticsOverviewOut(BaseModel):
+    period: str
+    bucket: str
+    date_from: datetime
+    date_to: datetime
+    totals: AnalyticsTotals
+    source_points: int  # buckets before downsampling
+    sales_performance: List[SalesBucket]
+    product_shares: List[ProductShare]
+    hourly_pattern: List[HourlyPoint]
+    insights: List[Insight]
+
+
+class SalesSeriesOut(BaseModel):
+    bucket: str
+    date_from: datetime
+    date_to: datetime
+    source_points: int  # days before downsampling
+    series: List[SalesBucket]
+
+
+class ForecastPoint(BaseModel):
+    day: date
+    quantity: float
+
+
+class ProductForecast(BaseModel):
+    product_id: int
+    product_name: str
+    daily: List[ForecastPoint]
+    total: float
+    on_hand: float
+    days_of_cover: Optional[int] = None  # None = stock outlasts the horizon
+    reorder_quantity: float
+    alpha: float
+    gamma: float
+    rmse: float
+
+
+class ForecastOut(BaseModel):
+    generated_for: date
+    horizon: int
+    history_days: int
+    products: List[ProductForecast]
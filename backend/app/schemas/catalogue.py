@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class CatalogueBonusRule(BaseModel):
+    id: int
+    rule_name: str
+    condition_type: str
+    condition_value: float
+    bonus_type: str
+    bonus_value: float
+
+
+class CatalogueItem(BaseModel):
+    id: int
+    name: str
+    unit: str
+    variation: Optional[str] = None
+    sale_type: str
+    price: Optional[float] = None  # None until a price is set
+    price_type: Optional[str] = None
+    on_hand: float
+    bonus_rules: List[CatalogueBonusRule]
@@ -1,5 +1,6 @@
 from pydantic import BaseModel
-from typing import Optional
+from datetime import datetime
+from typing import Optional, List, Literal
 
 class InventoryBase(BaseModel):
     product_id: int
@@ -13,3 +14,30 @@ class InventoryOut(InventoryBase):
 
     class Config:
         from_attributes = True
+
+class InventoryBulkRow(InventoryBase):
+    mode: Literal["set", "add"] = "set"  # set = counted stock, add = top-up
+
+class InventoryBulkResult(BaseModel):
+    row: int
+    product_id: Optional[int] = None
+    status: str  # created / updated / error
+    quantity: Optional[float] = None
+    detail: Optional[str] = None
+
+class InventoryBulkResponse(BaseModel):
+    applied: int
+    failed: int
+    results: List[InventoryBulkResult]
+
+class InventoryLotOut(BaseModel):
+    id: int
+    product_id: int
+    product_name: Optional[str] = None
+    quantity: float
+    received_at: datetime
+    expiry_date: Optional[datetime] = None
+    unit_cost: Optional[float] = None
+
+    class Config:
+        from_attributes = True
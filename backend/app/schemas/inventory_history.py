@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
+from typing import List, Optional
 
 class InventoryHistoryBase(BaseModel):
     inventory_id: int
@@ -15,3 +16,7 @@ class InventoryHistoryOut(InventoryHistoryBase):
 
     class Config:
         from_attributes = True
+
+class InventoryHistoryPage(BaseModel):
+    items: List[InventoryHistoryOut]
+    next_cursor: Optional[str] = None
@@ -1,6 +1,6 @@
 # backend/app/schemas/product_pricing.py
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class ProductPricingBase(BaseModel):
@@ -18,3 +18,26 @@ class ProductPricingOut(ProductPricingBase):
 
     class Config:
         from_attributes = True
+
+class CurrentPriceOut(ProductPricingOut):
+    product_name: str
+
+class PriceSuggestion(BaseModel):
+    product_id: int
+    product_name: str
+    variation: Optional[str] = None
+    unit_cost: Optional[float] = None
+    cost_source: Optional[str] = None  # recent_purchases / average_cost
+    last_purchase_at: Optional[datetime] = None
+    current_price: Optional[float] = None
+    current_margin_pct: Optional[float] = None
+    sell_through: Optional[float] = None
+    suggested_price: Optional[float] = None
+    suggested_margin_pct: Optional[float] = None
+    reason: str
+
+class PriceSuggestionsOut(BaseModel):
+    pricing_margin: float
+    auto_suggest: bool
+    quick_pricing: bool
+    suggestions: List[PriceSuggestion]
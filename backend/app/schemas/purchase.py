@@ -12,7 +12,7 @@ class PurchaseBase(BaseModel):
 
 
 class PurchaseCreate(PurchaseBase):
-    pass
+    expiry_date: Optional[datetime] = None  # best-before of this delivery, tracked on its lot
 
 
 class PurchaseUpdate(BaseModel):
@@ -0,0 +1,41 @@
+from pydantic import BaseModel
+from datetime import date, datetime
+from typing import Optional, List
+
+
+class MarginLine(BaseModel):
+    product_id: Optional[int] = None
+    product_name: Optional[str] = None
+    units_sold: float
+    revenue: float
+    cost_of_goods: float
+    gross_margin: float
+    margin_pct: Optional[float] = None
+    uncosted_units: float = 0  # sold before the product had any purchase cost
+
+
+class MarginReportOut(BaseModel):
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    totals: MarginLine
+    products: List[MarginLine]
+
+
+class PnlLine(BaseModel):
+    bucket: Optional[date] = None  # start of the EAT day/week/month; None on totals
+    revenue: float  # after discounts
+    discounts: float
+    purchase_cost: float
+    cost_of_goods: float
+    spoilage_cost: float
+    gross_profit: float
+    net: float  # gross profit less spoilage
+    cash_flow: float  # revenue less purchases
+
+
+class PnlReportOut(BaseModel):
+    period: str
+    date_from: date
+    date_to: date
+    totals: PnlLine
+    buckets: List[PnlLine]
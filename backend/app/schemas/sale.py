@@ -32,3 +32,13 @@ class SaleOut(SaleBase):
 
     class Config:
         from_attributes = True
+
+
+class TopSellerOut(BaseModel):
+    product_id: int
+    product_name: str
+    units: float
+    revenue: float
+    rank: int
+    previous_rank: Optional[int] = None  # None when nothing sold last period
+    rank_change: Optional[int] = None  # positive = climbed
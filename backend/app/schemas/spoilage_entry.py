@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import datetime, date
 from typing import Optional
 
 
@@ -24,3 +24,12 @@ class SpoilageEntryOut(SpoilageEntryBase):
 
     class Config:
         from_attributes = True
+
+
+class SpoilageSummaryOut(BaseModel):
+    product_id: Optional[int] = None
+    product_name: Optional[str] = None
+    day: Optional[date] = None
+    reason: Optional[str] = None
+    total_quantity: float
+    entry_count: int
@@ -0,0 +1,304 @@
+# backend/app/services/analytics.py
+from datetime import timedelta
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+from app.core.buckets import (
+    as_date, bucket_range, date_bucket, dialect_name, local_hour, local_today, utc_start_of,
+)
+from app.core.downsample import downsample
+from app.models.inventory import Inventory
+from app.models.product import Product
+from app.models.sale import Sale
+from app.models.spoilage_entry import SpoilageEntry
+
+# period -> (days covered, chart bucket)
+PERIODS = {
+    "week": (7, "day"),
+    "month": (30, "day"),
+    "quarter": (91, "week"),
+    "year": (365, "month"),
+}
+
+MAX_SERIES_DAYS = 366 * 5
+
+TOP_PRODUCTS = 8
+LOW_STOCK_THRESHOLD = 5
+
+
+def period_window(period: str):
+    """UTC bounds of the last N local (EAT) days, ending at the end of today."""
+    days, bucket = PERIODS[period]
+    today = local_today()
+    first_day = today - timedelta(days=days - 1)
+    return first_day, today, utc_start_of(first_day), utc_start_of(today + timedelta(days=1)), bucket
+
+
+def _format_currency(value: float) -> str:
+    return f"KSh {value:,.0f}"
+
+
+def _sales_totals(db: Session, vendor_id: int, date_from, date_to) -> dict:
+    payment = func.lower(Sale.payment_type)
+    row = db.query(
+        func.coalesce(func.sum(Sale.total_price), 0),
+        func.coalesce(func.sum(Sale.quantity), 0),
+        func.count(Sale.id),
+        func.coalesce(func.sum(Sale.discount_amount), 0),
+        func.coalesce(func.sum(Sale.cost_of_goods), 0),
+        func.coalesce(func.sum(case((payment == "cash", Sale.total_price), else_=0)), 0),
+        func.coalesce(func.sum(case((payment == "mpesa", Sale.total_price), else_=0)), 0),
+    ).filter(
+        Sale.vendor_id == vendor_id,
+        Sale.created_at >= date_from,
+        Sale.created_at < date_to
+    ).one()
+    revenue, units, transactions, discounts, cogs, cash, mpesa = row
+    return {
+        "revenue": float(revenue),
+        "units": float(units),
+        "transactions": int(transactions),
+        "discounts": float(discounts),
+        "cost_of_goods": float(cogs),
+        "cash_revenue": float(cash),
+        "mpesa_revenue": float(mpesa),
+    }
+
+
+def sales_series(db: Session, vendor_id: int, date_from, date_to, first_day, last_day, bucket: str) -> list[dict]:
+    """Revenue, units and profit per EAT bucket, with empty buckets filled in."""
+    key = date_bucket(Sale.created_at, bucket, dialect_name(db))
+    rows = db.query(
+        key,
+        func.sum(Sale.total_price),
+        func.sum(Sale.quantity),
+        func.sum(Sale.total_price - func.coalesce(Sale.cost_of_goods, 0)),
+    ).filter(
+        Sale.vendor_id == vendor_id,
+        Sale.created_at >= date_from,
+        Sale.created_at < date_to
+    ).group_by(key).all()
+    by_bucket = {as_date(start): (revenue, units, profit) for start, revenue, units, profit in rows}
+
+    series = []
+    for start in bucket_range(first_day, last_day, bucket):
+        revenue, units, profit = by_bucket.get(start, (0, 0, 0))
+        series.append({
+            "bucket": start,
+            "revenue": float(revenue or 0),
+            "units": float(units or 0),
+            "profit": float(profit or 0),
+        })
+    return series
+
+
+def downsampled_series(series: list[dict], width, method: str = "lttb", metric: str = "revenue") -> list[dict]:
+    """At most `width` points of `series`, chosen by the shape of `metric`."""
+    return downsample(series, lambda point: point[metric], width, method)
+
+
+def sales_timeseries(
+    db: Session,
+    vendor_id: int,
+    first_day,
+    last_day,
+    width=None,
+    method: str = "lttb",
+    metric: str = "revenue",
+) -> dict:
+    """Daily sales between two EAT days, reduced to `width` points when given."""
+    date_from, date_to = utc_start_of(first_day), utc_start_of(last_day + timedelta(days=1))
+    series = sales_series(db, vendor_id, date_from, date_to, first_day, last_day, "day")
+    points = downsampled_series(series, width, method, metric)
+    return {
+        "bucket": "day",
+        "date_from": date_from,
+        "date_to": date_to,
+        "source_points": len(series),
+        "series": points,
+    }
+
+
+def _product_shares(db: Session, vendor_id: int, date_from, date_to, total_revenue: float) -> list[dict]:
+    revenue = func.sum(Sale.total_price)
+    rows = db.query(Sale.product_id, Product.name, revenue).join(
+        Product, Product.id == Sale.product_id
+    ).filter(
+        Sale.vendor_id == vendor_id,
+        Sale.created_at >= date_from,
+        Sale.created_at < date_to
+    ).group_by(Sale.product_id, Product.name).order_by(revenue.desc()).limit(TOP_PRODUCTS).all()
+    return [
+        {
+            "product_id": product_id,
+            "product_name": name,
+            "revenue": float(value or 0),
+            "share": round(float(value or 0) / total_revenue * 100, 2) if total_revenue else 0,
+        }
+        for product_id, name, value in rows
+    ]
+
+
+def _hourly_pattern(db: Session, vendor_id: int, date_from, date_to) -> list[dict]:
+    hour = local_hour(Sale.created_at, dialect_name(db))
+    rows = db.query(hour, func.sum(Sale.quantity), func.sum(Sale.total_price)).filter(
+        Sale.vendor_id == vendor_id,
+        Sale.created_at >= date_from,
+        Sale.created_at < date_to
+    ).group_by(hour).all()
+    by_hour = {int(h): (units, revenue) for h, units, revenue in rows if h is not None}
+    return [
+        {"hour": h, "units": float(by_hour.get(h, (0, 0))[0] or 0), "revenue": float(by_hour.get(h, (0, 0))[1] or 0)}
+        for h in range(24)
+    ]
+
+
+def _spoilage_quantity(db: Session, vendor_id: int, date_from, date_to) -> float:
+    total = db.query(func.coalesce(func.sum(SpoilageEntry.quantity), 0)).filter(
+        SpoilageEntry.vendor_id == vendor_id,
+        SpoilageEntry.timestamp >= date_from,
+        SpoilageEntry.timestamp < date_to
+    ).scalar()
+    return float(total or 0)
+
+
+def _inventory_position(db: Session, vendor_id: int) -> dict:
+    items, units, value = db.query(
+        func.count(Inventory.id),
+        func.coalesce(func.sum(Inventory.quantity), 0),
+        func.coalesce(func.sum(Inventory.quantity * func.coalesce(Product.avg_unit_cost, 0)), 0),
+    ).join(Product, Product.id == Inventory.product_id).filter(
+        Inventory.vendor_id == vendor_id
+    ).one()
+    low_stock = db.query(Product.name).join(
+        Inventory, Inventory.product_id == Product.id
+    ).filter(
+        Inventory.vendor_id == vendor_id,
+        Inventory.quantity < LOW_STOCK_THRESHOLD
+    ).order_by(Inventory.quantity).all()
+    return {
+        "inventory_items": int(items),
+        "inventory_units": float(units),
+        "inventory_value": float(value),
+        "low_stock": [name for (name,) in low_stock],
+    }
+
+
+def _insights(totals: dict, low_stock: list[str], shares: list[dict], hourly: list[dict]) -> list[dict]:
+    """Server-side port of the rules the analytics page used to evaluate in the browser."""
+    if totals["transactions"] == 0:
+        return [{
+            "id": "no-sales",
+            "title": "No Sales Yet",
+            "detail": "Start recording sales to see insights and analytics.",
+            "tone": "info",
+        }]
+
+    insights = []
+    spoilage_rate = totals["spoilage_rate"]
+    if spoilage_rate > 10:
+        insights.append({
+            "id": "high-spoilage",
+            "title": "High Spoilage Alert",
+            "detail": f"{spoilage_rate:.1f}% spoilage rate detected. Review inventory management and ordering practices.",
+            "tone": "alert",
+        })
+    elif spoilage_rate > 5:
+        insights.append({
+            "id": "moderate-spoilage",
+            "title": "Monitor Spoilage",
+            "detail": f"{spoilage_rate:.1f}% spoilage rate. Consider reducing order quantities for slow-moving items.",
+            "tone": "alert",
+        })
+
+    if low_stock:
+        names = ", ".join(low_stock[:3]) + ("..." if len(low_stock) > 3 else "")
+        insights.append({
+            "id": "low-stock",
+            "title": "Low Stock Alert",
+            "detail": f"{len(low_stock)} item(s) running low: {names}",
+            "tone": "alert",
+        })
+
+    if shares:
+        insights.append({
+            "id": "best-seller",
+            "title": "Top Performer",
+            "detail": f"{shares[0]['product_name']} generates {_format_currency(shares[0]['revenue'])} in revenue.",
+            "tone": "success",
+        })
+
+    margin = totals["margin_pct"]
+    if margin is not None and margin < 15:
+        insights.append({
+            "id": "low-margin",
+            "title": "Low Profit Margin",
+            "detail": f"Current margin at {margin:.1f}%. Consider adjusting prices or reducing costs.",
+            "tone": "alert",
+        })
+    elif margin is not None and margin > 30:
+        insights.append({
+            "id": "healthy-margin",
+            "title": "Healthy Margins",
+            "detail": f"Excellent {margin:.1f}% profit margin maintained.",
+            "tone": "success",
+        })
+
+    peak = max(hourly, key=lambda point: point["units"])
+    if peak["units"] > 0:
+        insights.append({
+            "id": "peak-hours",
+            "title": "Peak Sales Hours",
+            "detail": f"Busiest period around {peak['hour']:02d}:00. Ensure adequate staffing and stock.",
+            "tone": "info",
+        })
+
+    if totals["mpesa_revenue"] > totals["cash_revenue"] * 1.5 and totals["revenue"]:
+        insights.append({
+            "id": "mpesa-preference",
+            "title": "M-Pesa Preference",
+            "detail": f"{totals['mpesa_revenue'] / totals['revenue'] * 100:.0f}% of sales via M-Pesa. Ensure service is always available.",
+            "tone": "info",
+        })
+    return insights
+
+
+def analytics_overview(db: Session, vendor_id: int, period: str = "week", width=None, method: str = "lttb") -> dict:
+    """
+    Everything the analytics page shows, aggregated in SQL over the selected period.
+
+    With `width`, the sales series is daily whatever the period and reduced to
+    at most `width` points, instead of the period's coarser fixed bucket.
+    """
+    first_day, last_day, date_from, date_to, bucket = period_window(period)
+    if width is not None:
+        bucket = "day"
+
+    totals = _sales_totals(db, vendor_id, date_from, date_to)
+    totals["gross_profit"] = totals["revenue"] - totals["cost_of_goods"]
+    totals["margin_pct"] = (
+        round(totals["gross_profit"] / totals["revenue"] * 100, 2) if totals["revenue"] else None
+    )
+    spoiled = _spoilage_quantity(db, vendor_id, date_from, date_to)
+    totals["spoilage_quantity"] = spoiled
+    totals["spoilage_rate"] = (
+        round(spoiled / (totals["units"] + spoiled) * 100, 2) if totals["units"] + spoiled else 0
+    )
+    inventory = _inventory_position(db, vendor_id)
+    low_stock = inventory.pop("low_stock")
+    totals.update(inventory)
+
+    shares = _product_shares(db, vendor_id, date_from, date_to, totals["revenue"])
+    hourly = _hourly_pattern(db, vendor_id, date_from, date_to)
+    series = sales_series(db, vendor_id, date_from, date_to, first_day, last_day, bucket)
+    return {
+        "period": period,
+        "bucket": bucket,
+        "date_from": date_from,
+        "date_to": date_to,
+        "totals": totals,
+        "source_points": len(series),
+        "sales_performance": downsampled_series(series, width, method),
+        "product_shares": shares,
+        "hourly_pattern": hourly,
+        "insights": _insights(totals, low_stock, shares, hourly),
+    }
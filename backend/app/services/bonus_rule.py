@@ -1,9 +1,10 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_
 from fastapi import HTTPException
 from app.models.bonus_rule import BonusRule
 from app.models.product import Product
 from app.schemas.bonus_rule import BonusRuleCreate, BonusRuleUpdate
+from app.services.resource_version import bump_resource_version, BONUS_RULES
 
 def create_bonus_rule(db: Session, rule: BonusRuleCreate, vendor_id: int):
     """Create a new bonus rule for the vendor."""
@@ -29,26 +30,29 @@ def create_bonus_rule(db: Session, rule: BonusRuleCreate, vendor_id: int):
         new_rule.products = products
     
     db.add(new_rule)
+    bump_resource_version(db, vendor_id, BONUS_RULES)
     db.commit()
     db.refresh(new_rule)
     return new_rule
 
 def get_bonus_rule(db: Session, rule_id: int):
     """Get a bonus rule by ID."""
-    rule = db.query(BonusRule).filter(BonusRule.id == rule_id).first()
+    rule = db.query(BonusRule).options(selectinload(BonusRule.products)).filter(BonusRule.id == rule_id).first()
     if not rule:
         raise HTTPException(status_code=404, detail="Bonus rule not found")
     return rule
 
 def list_all_vendor_bonus_rules(db: Session, vendor_id: int):
-    """List all bonus rules for a vendor."""
-    return db.query(BonusRule).filter(BonusRule.vendor_id == vendor_id).all()
+    """List all bonus rules for a vendor, with their products loaded in one extra query."""
+    return db.query(BonusRule).options(
+        selectinload(BonusRule.products)
+    ).filter(BonusRule.vendor_id == vendor_id).all()
 
 def list_bonus_rules(db: Session, product_id: int):
     """List all bonus rules for a specific product."""
     rules = db.query(BonusRule).join(
         BonusRule.products
-    ).filter(Product.id == product_id).all()
+    ).options(selectinload(BonusRule.products)).filter(Product.id == product_id).all()
     
     return rules
 
@@ -87,6 +91,7 @@ def update_bonus_rule(db: Session, rule_id: int, rule_data: BonusRuleUpdate, ven
             # Clear products if empty list provided
             rule.products = []
     
+    bump_resource_version(db, vendor_id, BONUS_RULES)
     db.commit()
     db.refresh(rule)
     return rule
@@ -100,6 +105,7 @@ def toggle_bonus_rule(db: Session, rule_id: int, vendor_id: int):
     if not rule:
         raise HTTPException(status_code=404, detail="Bonus rule not found")
     rule.is_active = not rule.is_active
+    bump_resource_version(db, vendor_id, BONUS_RULES)
     db.commit()
     db.refresh(rule)
     return rule
@@ -113,6 +119,7 @@ def delete_bonus_rule(db: Session, rule_id: int, vendor_id: int):
     if not rule:
         raise HTTPException(status_code=404, detail="Bonus rule not found")
     db.delete(rule)
+    bump_resource_version(db, vendor_id, BONUS_RULES)
     db.commit()
     return {"detail": "Bonus rule deleted"}
 
@@ -0,0 +1,91 @@
+# backend/app/services/catalogue.py
+"""
+Everything the POS sell screen needs in one payload: active products with
+their current price, on-hand stock and active bonus rules.
+
+The result is cached per vendor under the versions of the resources it is
+built from (products, bonus rules, inventory, prices). Every write through
+those services bumps its version in the same transaction, so the next read
+sees a new key and rebuilds - in every worker, without explicit messages.
+Scheduled price changes are honoured by expiring the entry at the next
+effective_from/effective_to boundary.
+"""
+from datetime import datetime
+
+from sqlalchemy import case, func, or_
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.cache import VendorCache
+from app.models.product import Product
+from app.models.product_pricing import ProductPricing
+from app.services.product_pricing import resolve_current_prices
+from app.services.resource_version import (
+    get_resource_versions, BONUS_RULES, INVENTORY, PRICES, PRODUCTS,
+)
+
+CATALOGUE_RESOURCES = (PRODUCTS, BONUS_RULES, INVENTORY, PRICES)
+
+_catalogues = VendorCache(maxsize=1024)
+
+
+def _next_price_change(db: Session, vendor_id: int, now: datetime):
+    """Earliest future instant at which some product's effective price changes."""
+    starts, ends = db.query(
+        func.min(case((ProductPricing.effective_from > now, ProductPricing.effective_from))),
+        func.min(case((ProductPricing.effective_to > now, ProductPricing.effective_to))),
+    ).join(Product, Product.id == ProductPricing.product_id).filter(
+        Product.vendor_id == vendor_id
+    ).one()
+    return min((boundary for boundary in (starts, ends) if boundary), default=None)
+
+
+def _build_catalogue(db: Session, vendor_id: int, now: datetime) -> list[dict]:
+    products = db.query(Product).options(
+        selectinload(Product.inventories),
+        selectinload(Product.bonus_rules),
+    ).filter(
+        Product.vendor_id == vendor_id,
+        or_(Product.is_active.is_(None), Product.is_active == True)
+    ).order_by(Product.name).all()
+    prices = {row["product_id"]: row for row in resolve_current_prices(db, vendor_id, now)}
+
+    catalogue = []
+    for product in products:
+        price = prices.get(product.id)
+        catalogue.append({
+            "id": product.id,
+            "name": product.name,
+            "unit": product.unit,
+            "variation": product.variation,
+            "sale_type": product.sale_type,
+            "price": price["price"] if price else None,
+            "price_type": price["price_type"] if price else None,
+            "on_hand": sum(inv.quantity or 0 for inv in product.inventories),
+            "bonus_rules": [
+                {
+                    "id": rule.id,
+                    "rule_name": rule.rule_name,
+                    "condition_type": rule.condition_type,
+                    "condition_value": rule.condition_value,
+                    "bonus_type": rule.bonus_type,
+                    "bonus_value": rule.bonus_value,
+                }
+                for rule in product.bonus_rules if rule.is_active and rule.vendor_id == vendor_id
+            ],
+        })
+    return catalogue
+
+
+def get_catalogue(db: Session, vendor_id: int) -> list[dict]:
+    now = datetime.utcnow()
+    versions = get_resource_versions(db, vendor_id, CATALOGUE_RESOURCES)
+    cached = _catalogues.get(vendor_id, versions)
+    if cached is not None:
+        expires_at, catalogue = cached
+        if expires_at is None or now < expires_at:
+            return catalogue
+
+    _catalogues.invalidate(vendor_id)  # entries for older versions
+    catalogue = _build_catalogue(db, vendor_id, now)
+    _catalogues.set(vendor_id, versions, (_next_price_change(db, vendor_id, now), catalogue))
+    return catalogue
@@ -0,0 +1,47 @@
+# backend/app/services/cost_basis.py
+"""
+Perpetual moving-average cost per product.
+
+Each purchase folds its unit cost into Product.avg_unit_cost weighted by the
+quantity still on hand (Product.cost_basis_quantity). Sales are stamped with
+quantity x average at insert time, so margin reports only sum stored columns.
+All helpers stage changes on the session; the caller commits.
+"""
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.models.product import Product
+
+
+def _locked_product(db: Session, product_id: int) -> Optional[Product]:
+    return db.query(Product).filter(Product.id == product_id).with_for_update().first()
+
+
+def apply_purchase_cost(db: Session, product_id: int, quantity: float, unit_cost: float) -> None:
+    """Blend a delivery into the product's moving-average unit cost."""
+    product = _locked_product(db, product_id)
+    if not product or quantity <= 0:
+        return
+    on_hand = max(product.cost_basis_quantity or 0, 0)
+    if product.avg_unit_cost is None or on_hand == 0:
+        product.avg_unit_cost = unit_cost
+    else:
+        product.avg_unit_cost = (on_hand * product.avg_unit_cost + quantity * unit_cost) / (on_hand + quantity)
+    product.cost_basis_quantity = on_hand + quantity
+
+
+def cost_of_goods_sold(db: Session, product_id: int, quantity: float) -> Optional[float]:
+    """Cost of `quantity` units at the current average; removes them from the cost basis."""
+    product = _locked_product(db, product_id)
+    if not product:
+        return None
+    product.cost_basis_quantity = max((product.cost_basis_quantity or 0) - quantity, 0)
+    if product.avg_unit_cost is None:
+        return None
+    return quantity * product.avg_unit_cost
+
+
+def adjust_cost_basis_quantity(db: Session, product_id: int, delta: float) -> None:
+    """Add or remove units at the current average (e.g. spoilage write-offs)."""
+    product = _locked_product(db, product_id)
+    if product:
+        product.cost_basis_quantity = max((product.cost_basis_quantity or 0) + delta, 0)
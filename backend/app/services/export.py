@@ -0,0 +1,198 @@
+# backend/app/services/export.py
+"""
+Columnar export of vendor activity for offline analysis.
+
+Each table is written as Parquet under a hive-style layout that pandas,
+pyarrow and DuckDB read as partitions:
+
+    <out_dir>/<table>/vendor_id=<id>/month=<YYYY-MM>/part-<run>.parquet
+
+vendor_id lives only in the directory name, as hive partitioning expects.
+Rows are streamed from the database in record batches ordered by vendor and
+time, so only one partition file is open at a time. A watermark file in
+<out_dir> remembers how far each table has been exported; the next run only
+appends rows created or updated since then as new part files.
+"""
+import json
+import os
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Boolean, DateTime, Float, Integer, or_, and_, select
+from sqlalchemy.orm import Session
+
+from app.core.buckets import EAT_OFFSET
+from app.models.mpesa_transaction import MpesaTransaction
+from app.models.purchase import Purchase
+from app.models.sale import Sale
+from app.models.spoilage_entry import SpoilageEntry
+
+BATCH_SIZE = 10_000
+WATERMARK_FILE = "_watermark.json"
+
+# table -> (model, time column used for the month partition, watermark column, excluded columns)
+# Every exported table can be edited after insert (PUT endpoints, the Daraja
+# callback), so rows are tracked by updated_at; a re-exported row supersedes
+# the earlier copy with the same id. Deleted rows are not propagated.
+EXPORTS = {
+    "sales": (Sale, "created_at", "updated_at", ()),
+    "purchases": (Purchase, "timestamp", "updated_at", ()),
+    "spoilage": (SpoilageEntry, "timestamp", "updated_at", ()),
+    "mpesa_transactions": (MpesaTransaction, "created_at", "updated_at", ("raw_payload",)),
+}
+
+
+def _arrow_type(column) -> pa.DataType:
+    if isinstance(column.type, Boolean):
+        return pa.bool_()
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, Float):
+        return pa.float64()
+    if isinstance(column.type, DateTime):
+        return pa.timestamp("us")
+    return pa.string()
+
+
+def _columns(model, excluded) -> list:
+    return [column for column in model.__table__.columns if column.name not in excluded]
+
+
+def _schema(columns) -> pa.Schema:
+    return pa.schema([pa.field(column.name, _arrow_type(column)) for column in columns])
+
+
+def load_watermarks(out_dir: str) -> dict:
+    path = os.path.join(out_dir, WATERMARK_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_watermarks(out_dir: str, watermarks: dict) -> None:
+    path = os.path.join(out_dir, WATERMARK_FILE)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(watermarks, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _after_watermark(model, watermark_column: str, mark):
+    """Rows strictly after the stored watermark ({"value", "id"})."""
+    if not mark or "value" not in mark:
+        # none yet, or an id-only mark from before updated_at tracking: export everything
+        return None
+    value = datetime.fromisoformat(mark["value"])
+    column = getattr(model, watermark_column)
+    return or_(column > value, and_(column == value, model.id > mark["id"]))
+
+
+class _PartitionWriter:
+    """Writes to one partition at a time; files only appear once complete."""
+
+    def __init__(self, root: str, schema: pa.Schema, run_id: str):
+        self.root = root
+        self.schema = schema
+        self.run_id = run_id
+        self.key = None
+        self.writer = None
+        self.path = None
+        self.files = []
+
+    def write(self, key, rows: list[dict]) -> None:
+        if key != self.key:
+            self.close()
+            vendor_id, month = key
+            directory = os.path.join(self.root, f"vendor_id={vendor_id}", f"month={month}")
+            os.makedirs(directory, exist_ok=True)
+            self.path = os.path.join(directory, f"part-{self.run_id}.parquet")
+            self.writer = pq.ParquetWriter(self.path + ".tmp", self.schema, compression="zstd")
+            self.key = key
+        self.writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=self.schema))
+
+    def close(self) -> None:
+        if self.writer is None:
+            return
+        self.writer.close()
+        os.replace(self.path + ".tmp", self.path)
+        self.files.append(self.path)
+        self.writer = None
+        self.key = None
+
+
+def export_table(
+    db: Session,
+    table: str,
+    out_dir: str,
+    watermark: dict | None = None,
+    vendor_id: int | None = None,
+    run_id: str | None = None,
+) -> dict:
+    """
+    Stream one table into partitioned Parquet files.
+
+    Returns {"rows", "files", "watermark"}; the caller persists the watermark
+    once the whole run has succeeded.
+    """
+    model, time_column, watermark_column, excluded = EXPORTS[table]
+    columns = _columns(model, excluded)
+    names = [column.name for column in columns]
+    schema = _schema([column for column in columns if column.name != "vendor_id"])
+    time_attr = getattr(model, time_column)
+    run_id = run_id or datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+
+    query = select(*columns).where(model.vendor_id.isnot(None))
+    after = _after_watermark(model, watermark_column, watermark)
+    if after is not None:
+        query = query.where(after)
+    if vendor_id is not None:
+        query = query.where(model.vendor_id == vendor_id)
+    query = query.order_by(model.vendor_id, time_attr, model.id).execution_options(yield_per=BATCH_SIZE)
+
+    writer = _PartitionWriter(os.path.join(out_dir, table), schema, run_id)
+    exported = 0
+    new_mark = watermark
+    try:
+        for batch in db.execute(query).partitions():
+            pending_key, pending = None, []
+            for row in batch:
+                record = dict(zip(names, row))
+                stamp = record[time_column]
+                month = (stamp + EAT_OFFSET).strftime("%Y-%m") if stamp else "unknown"
+                key = (record.pop("vendor_id"), month)
+                if key != pending_key and pending:
+                    writer.write(pending_key, pending)
+                    pending = []
+                pending_key = key
+                pending.append(record)
+
+                mark_value = record[watermark_column]
+                if mark_value is not None:
+                    candidate = (mark_value.isoformat(), record["id"])
+                    if not new_mark or "value" not in new_mark or candidate > (new_mark["value"], new_mark["id"]):
+                        new_mark = {"value": candidate[0], "id": record["id"]}
+            if pending:
+                writer.write(pending_key, pending)
+            exported += len(batch)
+    finally:
+        writer.close()
+
+    return {"rows": exported, "files": writer.files, "watermark": new_mark}
+
+
+def export_all(db: Session, out_dir: str, tables=None, vendor_id: int | None = None, full: bool = False) -> dict:
+    """Export the given tables (default: all) since their last watermark."""
+    os.makedirs(out_dir, exist_ok=True)
+    watermarks = {} if full else load_watermarks(out_dir)
+    run_id = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+    summary = {}
+    for table in tables or EXPORTS:
+        mark_key = table if vendor_id is None else f"{table}:vendor_id={vendor_id}"
+        result = export_table(db, table, out_dir, watermarks.get(mark_key), vendor_id, run_id)
+        if result["watermark"]:
+            watermarks[mark_key] = result["watermark"]
+        summary[table] = {"rows": result["rows"], "files": len(result["files"])}
+    save_watermarks(out_dir, watermarks)
+    return summary
@@ -0,0 +1,172 @@
+# backend/app/services/forecast.py
+"""
+Daily demand forecast per product.
+
+Each vendor's recent daily unit sales are loaded as one products x days
+matrix and smoothed with additive exponential smoothing plus a weekly
+seasonal term (Holt-Winters without trend). All products, and a small grid
+of smoothing parameters, are fitted together: the only Python loop is over
+days, every step updates the whole (params x products) array at once. Each
+product then keeps the parameters with the lowest one-step-ahead error.
+"""
+from datetime import timedelta
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.buckets import as_date, date_bucket, dialect_name, local_today, utc_start_of
+from app.core.cache import VendorCache
+from app.models.inventory import Inventory
+from app.models.product import Product
+from app.models.sale import Sale
+
+HISTORY_DAYS = 56  # eight full weeks
+SEASON = 7
+ALPHAS = np.array([0.1, 0.2, 0.3, 0.5, 0.7])
+GAMMAS = np.array([0.05, 0.1, 0.2, 0.3])
+
+_forecasts = VendorCache(maxsize=512)
+
+
+def _daily_matrix(db: Session, vendor_id: int, first_day, last_day):
+    """Units sold per product per EAT day as a (products, days) float matrix."""
+    day = date_bucket(Sale.created_at, "day", dialect_name(db))
+    rows = db.query(Sale.product_id, day, func.sum(Sale.quantity)).filter(
+        Sale.vendor_id == vendor_id,
+        Sale.created_at >= utc_start_of(first_day),
+        Sale.created_at < utc_start_of(last_day + timedelta(days=1))
+    ).group_by(Sale.product_id, day).all()
+
+    product_ids = sorted({product_id for product_id, _, _ in rows})
+    position = {product_id: i for i, product_id in enumerate(product_ids)}
+    days = (last_day - first_day).days + 1
+    matrix = np.zeros((len(product_ids), days))
+    if rows:
+        rows_idx = np.fromiter((position[product_id] for product_id, _, _ in rows), dtype=np.intp, count=len(rows))
+        day_idx = np.fromiter(((as_date(d) - first_day).days for _, d, _ in rows), dtype=np.intp, count=len(rows))
+        units = np.fromiter((float(q or 0) for _, _, q in rows), dtype=float, count=len(rows))
+        np.add.at(matrix, (rows_idx, day_idx), units)
+    return product_ids, matrix
+
+
+def fit_seasonal_smoothing(series: np.ndarray, alphas=ALPHAS, gammas=GAMMAS):
+    """
+    Fit additive level + weekly season smoothing to every row of `series`.
+
+    Returns (level, season, alpha, gamma, sse) with one entry per row; season
+    has shape (rows, 7) and is indexed by day offset modulo 7 from the start
+    of the series.
+    """
+    n_products, n_days = series.shape
+    alpha = np.repeat(alphas, len(gammas))[:, None]
+    gamma = np.tile(gammas, len(alphas))[:, None]
+    n_params = alpha.shape[0]
+
+    # Initialise from the first week: its mean as the level, deviations as the season.
+    first_week = series[:, :SEASON]
+    level = np.broadcast_to(first_week.mean(axis=1), (n_params, n_products)).copy()
+    season = np.broadcast_to(
+        (first_week - first_week.mean(axis=1, keepdims=True))[None, :, :], (n_params, n_products, SEASON)
+    ).copy()
+    sse = np.zeros((n_params, n_products))
+
+    for t in range(SEASON, n_days):
+        observed = series[:, t]
+        slot = t % SEASON
+        seasonal = season[:, :, slot]
+        sse += (observed - (level + seasonal)) ** 2
+        new_level = alpha * (observed - seasonal) + (1 - alpha) * level
+        season[:, :, slot] = gamma * (observed - new_level) + (1 - gamma) * seasonal
+        level = new_level
+
+    best = sse.argmin(axis=0)
+    products = np.arange(n_products)
+    return (
+        level[best, products],
+        season[best, products, :],
+        alpha[best, 0],
+        gamma[best, 0],
+        sse[best, products],
+    )
+
+
+def _fit_for_vendor(db: Session, vendor_id: int, horizon: int) -> dict:
+    """The fitted forecast series; stock-dependent figures are added per request."""
+    today = local_today()
+    last_day = today - timedelta(days=1)  # only complete days
+    first_day = last_day - timedelta(days=HISTORY_DAYS - 1)
+    product_ids, matrix = _daily_matrix(db, vendor_id, first_day, last_day)
+
+    fit = {"today": today, "horizon": horizon, "product_ids": product_ids}
+    if not product_ids:
+        return fit
+
+    level, season, alpha, gamma, sse = fit_seasonal_smoothing(matrix)
+    steps = np.arange(matrix.shape[1], matrix.shape[1] + horizon) % SEASON
+    fit.update(
+        forecast=np.clip(level[:, None] + season[:, steps], 0, None),
+        alpha=alpha,
+        gamma=gamma,
+        rmse=np.sqrt(sse / max(matrix.shape[1] - SEASON, 1)),
+        names=dict(db.query(Product.id, Product.name).filter(Product.id.in_(product_ids)).all()),
+    )
+    return fit
+
+
+def _forecast_result(fit: dict, on_hand: dict) -> dict:
+    today, horizon = fit["today"], fit["horizon"]
+    result = {
+        "generated_for": today,
+        "horizon": horizon,
+        "history_days": HISTORY_DAYS,
+        "products": [],
+    }
+    if not fit["product_ids"]:
+        return result
+
+    forecast = fit["forecast"]
+    totals = forecast.sum(axis=1)
+    days = [today + timedelta(days=offset) for offset in range(horizon)]
+
+    for i, product_id in enumerate(fit["product_ids"]):
+        stock = float(on_hand.get(product_id) or 0)
+        daily = forecast[i]
+        cumulative = np.cumsum(daily)
+        covered = int(np.searchsorted(cumulative, stock, side="right"))
+        result["products"].append({
+            "product_id": product_id,
+            "product_name": fit["names"].get(product_id, f"Product {product_id}"),
+            "daily": [{"day": day, "quantity": round(float(q), 2)} for day, q in zip(days, daily)],
+            "total": round(float(totals[i]), 2),
+            "on_hand": stock,
+            "days_of_cover": covered if covered < horizon else None,
+            "reorder_quantity": round(max(0.0, float(totals[i]) - stock), 2),
+            "alpha": float(fit["alpha"][i]),
+            "gamma": float(fit["gamma"][i]),
+            "rmse": round(float(fit["rmse"][i]), 2),
+        })
+    result["products"].sort(key=lambda item: item["total"], reverse=True)
+    return result
+
+
+def demand_forecast(db: Session, vendor_id: int, horizon: int = 7) -> dict:
+    """
+    Forecast for the vendor. The fit runs at most once per vendor per EAT day;
+    on-hand stock, days of cover and reorder quantities are current on every call.
+    """
+    today = local_today()
+    by_horizon = _forecasts.get(vendor_id, today)
+    if by_horizon is None:
+        _forecasts.invalidate(vendor_id)  # drop earlier days
+        by_horizon = {}
+        _forecasts.set(vendor_id, today, by_horizon)
+    if horizon not in by_horizon:
+        by_horizon[horizon] = _fit_for_vendor(db, vendor_id, horizon)
+    fit = by_horizon[horizon]
+
+    on_hand = dict(db.query(Inventory.product_id, Inventory.quantity).filter(
+        Inventory.vendor_id == vendor_id,
+        Inventory.product_id.in_(fit["product_ids"])
+    ).all()) if fit["product_ids"] else {}
+    return _forecast_result(fit, on_hand)
@@ -1,7 +1,12 @@
 # backend/app/services/inventory.py
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models.inventory import Inventory
-from app.schemas.inventory import InventoryCreate
+from app.models.inventory_history import InventoryHistory
+from app.models.product import Product
+from app.schemas.inventory import InventoryCreate, InventoryBulkRow
+from app.services.inventory_lot import reconcile_lots
+from app.services.resource_version import bump_resource_version, INVENTORY
 
 def add_inventory(db: Session, vendor_id: int, inventory: InventoryCreate) -> Inventory:
     """Add or update inventory for a vendor/product."""
@@ -12,6 +17,8 @@ def add_inventory(db: Session, vendor_id: int, inventory: InventoryCreate) -> In
 
     if existing:
         existing.quantity += inventory.quantity
+        reconcile_lots(db, vendor_id, {inventory.product_id: existing.quantity})
+        bump_resource_version(db, vendor_id, INVENTORY)
         db.commit()
         db.refresh(existing)
         return existing
@@ -22,10 +29,93 @@ def add_inventory(db: Session, vendor_id: int, inventory: InventoryCreate) -> In
         quantity=inventory.quantity
     )
     db.add(new_item)
+    reconcile_lots(db, vendor_id, {inventory.product_id: new_item.quantity})
+    bump_resource_version(db, vendor_id, INVENTORY)
     db.commit()
     db.refresh(new_item)
     return new_item
 
+def bulk_upsert_inventory(db: Session, vendor_id: int, rows: list[tuple[int, InventoryBulkRow]]) -> list[dict]:
+    """Apply a stock-take in one transaction.
+
+    Ownership is checked with a single IN query and existing inventory rows are
+    loaded in one go. New inventory rows, history entries and lot adjustments
+    are each written as one batch, so the statement count does not grow with
+    the number of rows. Rows for products the vendor does not own are
+    reported back and skipped.
+    """
+    product_ids = {row.product_id for _, row in rows}
+    if not product_ids:
+        return []
+
+    owned = {
+        product_id for (product_id,) in db.query(Product.id).filter(
+            Product.vendor_id == vendor_id,
+            Product.id.in_(product_ids)
+        )
+    }
+    existing = {
+        item.product_id: item for item in db.query(Inventory).filter(
+            Inventory.vendor_id == vendor_id,
+            Inventory.product_id.in_(owned)
+        )
+    } if owned else {}
+
+    results = []
+    counted = {}  # product_id -> quantity after the rows applied so far
+    history = []  # (product_id, quantity_change)
+    for row_no, row in rows:
+        if row.product_id not in owned:
+            results.append({"row": row_no, "product_id": row.product_id, "status": "error",
+                            "detail": "Product not found or not yours"})
+            continue
+        if row.mode == "set" and row.quantity < 0:
+            results.append({"row": row_no, "product_id": row.product_id, "status": "error",
+                            "detail": "Counted quantity cannot be negative"})
+            continue
+
+        item = existing.get(row.product_id)
+        if row.product_id in counted:
+            previous = counted[row.product_id]
+        else:
+            previous = (item.quantity or 0) if item else 0
+        if row.mode == "add" and previous + row.quantity < 0:
+            results.append({"row": row_no, "product_id": row.product_id, "status": "error",
+                            "detail": "Stock cannot go below zero"})
+            continue
+
+        status = "updated" if item is not None or row.product_id in counted else "created"
+        quantity = row.quantity if row.mode == "set" else previous + row.quantity
+        counted[row.product_id] = quantity
+        if quantity != previous:
+            history.append((row.product_id, quantity - previous))
+        results.append({"row": row_no, "product_id": row.product_id, "status": status,
+                        "quantity": quantity})
+
+    inventory_ids = {}
+    created = []
+    for product_id, quantity in counted.items():
+        item = existing.get(product_id)
+        if item is None:
+            created.append({"vendor_id": vendor_id, "product_id": product_id, "quantity": quantity})
+        else:
+            item.quantity = quantity
+            inventory_ids[product_id] = item.id
+    if created:
+        inventory_ids.update(db.execute(
+            insert(Inventory).returning(Inventory.product_id, Inventory.id), created
+        ).all())
+    if history:
+        db.execute(insert(InventoryHistory), [
+            {"inventory_id": inventory_ids[product_id], "change_type": "manual", "quantity_change": change}
+            for product_id, change in history
+        ])
+
+    reconcile_lots(db, vendor_id, {product_id: counted[product_id] for product_id, _ in history})
+    bump_resource_version(db, vendor_id, INVENTORY)
+    db.commit()
+    return results
+
 def list_inventory(db: Session, vendor_id: int) -> list[Inventory]:
     """Fetch all inventory for a given vendor."""
     return db.query(Inventory).filter(Inventory.vendor_id == vendor_id).all()
@@ -43,5 +133,6 @@ def delete_inventory_item(db: Session, vendor_id: int, inventory_id: int) -> boo
     if not item:
         return False
     db.delete(item)
+    bump_resource_version(db, vendor_id, INVENTORY)
     db.commit()
     return True
@@ -1,7 +1,24 @@
+import base64
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from app.models.inventory import Inventory
 from app.models.inventory_history import InventoryHistory
 from app.schemas.inventory_history import InventoryHistoryCreate
 
+def _encode_cursor(record: InventoryHistory) -> str:
+    raw = f"{record.timestamp.isoformat()}|{record.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        timestamp, record_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(timestamp), int(record_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 def create_inventory_history(db: Session, history: InventoryHistoryCreate):
     new_record = InventoryHistory(
         inventory_id=history.inventory_id,
@@ -13,7 +30,46 @@ def create_inventory_history(db: Session, history: InventoryHistoryCreate):
     db.refresh(new_record)
     return new_record
 
-def list_inventory_history(db: Session, inventory_id: int):
-    return db.query(InventoryHistory).filter(
-        InventoryHistory.inventory_id == inventory_id
-    ).order_by(InventoryHistory.timestamp.desc()).all()
+def list_inventory_history(
+    db: Session,
+    vendor_id: int,
+    inventory_id: int,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    change_type: Optional[str] = None,
+) -> tuple[list[InventoryHistory], Optional[str]]:
+    """One newest-first page of an item's ledger plus the cursor for the next page.
+
+    Ownership is enforced by joining the inventory row, and paging is keyset
+    on (timestamp, id) so every page is an index range read. Rows without a
+    timestamp have no place in that order and are left out.
+    """
+    query = db.query(InventoryHistory).join(
+        Inventory, Inventory.id == InventoryHistory.inventory_id
+    ).filter(
+        InventoryHistory.inventory_id == inventory_id,
+        Inventory.vendor_id == vendor_id,
+        InventoryHistory.timestamp.isnot(None)
+    )
+    if date_from:
+        query = query.filter(InventoryHistory.timestamp >= date_from)
+    if date_to:
+        query = query.filter(InventoryHistory.timestamp < date_to)
+    if change_type:
+        query = query.filter(InventoryHistory.change_type == change_type)
+    if cursor:
+        after_timestamp, after_id = _decode_cursor(cursor)
+        query = query.filter(or_(
+            InventoryHistory.timestamp < after_timestamp,
+            and_(InventoryHistory.timestamp == after_timestamp, InventoryHistory.id < after_id)
+        ))
+
+    records = query.order_by(
+        InventoryHistory.timestamp.desc(),
+        InventoryHistory.id.desc()
+    ).limit(limit + 1).all()
+
+    next_cursor = _encode_cursor(records[limit - 1]) if len(records) > limit else None
+    return records[:limit], next_cursor
@@ -0,0 +1,141 @@
+# backend/app/services/inventory_lot.py
+from collections import defaultdict
+
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from typing import Optional
+from app.models.inventory_lot import InventoryLot
+from app.models.product import Product
+
+
+def receive_lot(
+    db: Session,
+    vendor_id: int,
+    product_id: int,
+    quantity: float,
+    unit_cost: Optional[float] = None,
+    expiry_date: Optional[datetime] = None,
+    purchase=None,
+) -> InventoryLot:
+    """Stage a new lot for a delivery; the caller commits."""
+    lot = InventoryLot(
+        vendor_id=vendor_id,
+        product_id=product_id,
+        quantity=quantity,
+        unit_cost=unit_cost,
+        expiry_date=expiry_date,
+        purchase=purchase,
+    )
+    db.add(lot)
+    return lot
+
+
+_FEFO_ORDER = (
+    InventoryLot.expiry_date.is_(None),
+    InventoryLot.expiry_date,
+    InventoryLot.received_at,
+    InventoryLot.id,
+)
+
+
+def consume_lots_fefo(db: Session, vendor_id: int, product_id: int, quantity: float) -> float:
+    """Take `quantity` out of a product's lots, first-expired-first-out.
+
+    Lots without an expiry date go last, ties break on received_at. Only stages
+    the changes; the caller commits. Returns the quantity no lot could cover.
+    """
+    remaining = quantity
+    if remaining <= 0:
+        return 0
+    lots = db.query(InventoryLot).filter(
+        InventoryLot.vendor_id == vendor_id,
+        InventoryLot.product_id == product_id,
+        InventoryLot.quantity > 0
+    ).order_by(*_FEFO_ORDER).with_for_update().all()
+
+    for lot in lots:
+        taken = min(lot.quantity, remaining)
+        lot.quantity -= taken
+        remaining -= taken
+        if remaining <= 0:
+            break
+    return remaining
+
+
+def adjust_lots(db: Session, vendor_id: int, product_id: int, delta: float) -> None:
+    """Keep a product's lots in step with an on-hand change that is not a purchase or sale.
+
+    Decreases are taken FEFO; increases open an adjustment lot with no
+    purchase and no expiry date. Only stages the changes; the caller commits.
+    """
+    if delta > 0:
+        receive_lot(db, vendor_id, product_id, delta)
+    elif delta < 0:
+        consume_lots_fefo(db, vendor_id, product_id, -delta)
+
+
+def reconcile_lots(db: Session, vendor_id: int, on_hand: dict[int, float]) -> None:
+    """Bring each product's lot total in line with its on-hand quantity after a manual change.
+
+    `on_hand` maps product_id to the new quantity. A shortfall opens an
+    adjustment lot, a surplus is consumed FEFO. Lots already staged in this
+    session are flushed first so they are counted. A whole stock-take costs
+    one grouped SUM, one locking select for the products in surplus and one
+    multi-row insert, whatever the number of products.
+    """
+    if not on_hand:
+        return
+    db.flush()
+    totals = dict(db.query(InventoryLot.product_id, func.sum(InventoryLot.quantity)).filter(
+        InventoryLot.vendor_id == vendor_id,
+        InventoryLot.product_id.in_(on_hand),
+        InventoryLot.quantity > 0
+    ).group_by(InventoryLot.product_id).all())
+
+    surplus, shortfall = {}, {}
+    for product_id, quantity in on_hand.items():
+        delta = max(quantity or 0, 0) - (totals.get(product_id) or 0)
+        if delta < 0:
+            surplus[product_id] = -delta
+        elif delta > 0:
+            shortfall[product_id] = delta
+
+    if surplus:
+        lots = db.query(InventoryLot).filter(
+            InventoryLot.vendor_id == vendor_id,
+            InventoryLot.product_id.in_(surplus),
+            InventoryLot.quantity > 0
+        ).order_by(InventoryLot.product_id, *_FEFO_ORDER).with_for_update().all()
+        remaining = defaultdict(float, surplus)
+        for lot in lots:
+            taken = min(lot.quantity, remaining[lot.product_id])
+            lot.quantity -= taken
+            remaining[lot.product_id] -= taken
+
+    if shortfall:
+        db.execute(insert(InventoryLot), [
+            {"vendor_id": vendor_id, "product_id": product_id, "quantity": quantity}
+            for product_id, quantity in shortfall.items()
+        ])
+
+
+def list_expiring_lots(db: Session, vendor_id: int, within: timedelta, include_expired: bool = False) -> list[dict]:
+    """Stocked lots expiring within `within`, soonest first (range scan on vendor_id, expiry_date)."""
+    now = datetime.utcnow()
+    query = db.query(
+        InventoryLot.id,
+        InventoryLot.product_id,
+        Product.name.label("product_name"),
+        InventoryLot.quantity,
+        InventoryLot.received_at,
+        InventoryLot.expiry_date,
+        InventoryLot.unit_cost,
+    ).join(Product, Product.id == InventoryLot.product_id).filter(
+        InventoryLot.vendor_id == vendor_id,
+        InventoryLot.expiry_date <= now + within,
+        InventoryLot.quantity > 0
+    )
+    if not include_expired:
+        query = query.filter(InventoryLot.expiry_date >= now)
+    return [row._asdict() for row in query.order_by(InventoryLot.expiry_date).all()]
@@ -6,6 +6,8 @@ import requests
 from typing import Dict, Any
 from urllib.parse import urlparse
 
+from app.core.metrics import DARAJA_LATENCY, timed_call
+
 # ---- ENV ----
 DARAJA_BASE = os.getenv("MPESA_BASE_URL", "https://sandbox.safaricom.co.ke")
 CONSUMER_KEY = os.getenv("MPESA_CONSUMER_KEY")
@@ -29,8 +31,9 @@ def _password(ts: str) -> str:
     return base64.b64encode(raw).decode()
 
 def _token() -> str:
-    r = requests.get(OAUTH_URL, auth=(CONSUMER_KEY, CONSUMER_SECRET), timeout=TIMEOUT)
-    r.raise_for_status()
+    with timed_call(DARAJA_LATENCY, "oauth"):
+        r = requests.get(OAUTH_URL, auth=(CONSUMER_KEY, CONSUMER_SECRET), timeout=TIMEOUT)
+        r.raise_for_status()
     return r.json()["access_token"]
 
 def _normalize_msisdn(msisdn: str) -> str:
@@ -97,7 +100,10 @@ def stk_push(
     }
 
     print("STK DEBUG:", {"CallBackURL": cb_url, "Timestamp": ts})
-    r = requests.post(STK_URL, json=payload, headers=headers, timeout=TIMEOUT)
+    with timed_call(DARAJA_LATENCY, "stk_push") as call:
+        r = requests.post(STK_URL, json=payload, headers=headers, timeout=TIMEOUT)
+        if r.status_code != 200:
+            call.outcome = "error"
 
     try:
         dbg_body = r.json()
@@ -1,6 +1,7 @@
 # backend/app/services/payment.py
 from sqlalchemy.orm import Session
 from app.models.payment import Payment
+from app.models.sale import Sale
 from app.schemas.payment import PaymentCreate
 
 def create_payment(db: Session, payment: PaymentCreate) -> Payment:
@@ -13,11 +14,18 @@ def create_payment(db: Session, payment: PaymentCreate) -> Payment:
 def get_payment_by_id(db: Session, payment_id: int) -> Payment | None:
     return db.query(Payment).filter(Payment.id == payment_id).first()
 
+def get_payment_with_owner(db: Session, payment_id: int):
+    """(payment, vendor_id of its sale) in one query, or (None, None)."""
+    row = db.query(Payment, Sale.vendor_id).join(Sale, Sale.id == Payment.sale_id).filter(
+        Payment.id == payment_id
+    ).first()
+    return row if row else (None, None)
+
 def get_payments_for_sale(db: Session, sale_id: int) -> list[Payment]:
     return db.query(Payment).filter(Payment.sale_id == sale_id).all()
 
 def delete_payment(db: Session, payment_id: int) -> bool:
-    payment = db.query(Payment).filter(Payment.id == payment_id).first()
+    payment = db.get(Payment, payment_id)  # already in the session after an ownership check
     if not payment:
         return False
     db.delete(payment)
@@ -0,0 +1,152 @@
+# backend/app/services/price_suggestion.py
+"""
+Suggested selling prices for all of a vendor's products.
+
+The cost side is the quantity-weighted unit cost of the last
+RECENT_COST_DAYS of purchases, falling back to the product's moving-average
+cost. The vendor's pricing_margin (a markup on cost, as the settings page
+shows it) is applied on top, nudged up for products that sell through
+quickly and down for ones that sit on the shelf, and never below cost.
+
+Everything is computed with a handful of grouped queries per vendor and
+cached per EAT day under the versions of the vendor's products, purchases,
+prices and preferences. Writes bump those versions in their own transaction,
+so every worker sees a new key on its next read; sell-through drifts with
+sales and is refreshed daily.
+"""
+import math
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from app.core.buckets import local_today
+from app.core.cache import VendorCache
+from app.models.inventory import Inventory
+from app.models.product import Product
+from app.models.purchase import Purchase
+from app.models.sale import Sale
+from app.models.vendor_preference import VendorPreference
+from app.services import product_pricing as pricing_service
+from app.services.resource_version import (
+    get_resource_versions, PRICES, PRODUCTS, PURCHASES, VENDOR_PREFERENCES,
+)
+
+DEFAULT_MARGIN = 25
+RECENT_COST_DAYS = 30
+SELL_THROUGH_DAYS = 14
+FAST_SELL_THROUGH = 0.8
+SLOW_SELL_THROUGH = 0.3
+SELL_THROUGH_ADJUSTMENT = 5  # percentage points of markup
+
+SUGGESTION_RESOURCES = (PRODUCTS, PURCHASES, PRICES, VENDOR_PREFERENCES)
+
+_suggestions = VendorCache(maxsize=1024)
+
+
+def invalidate_price_suggestions(vendor_id: int) -> None:
+    """Drop this worker's entries early; other workers notice the bumped versions."""
+    _suggestions.invalidate(vendor_id)
+
+
+def _recent_costs(db: Session, vendor_id: int, since: datetime) -> dict:
+    rows = db.query(
+        Purchase.product_id,
+        func.sum(Purchase.total_cost),
+        func.sum(Purchase.quantity),
+    ).filter(
+        Purchase.vendor_id == vendor_id,
+        Purchase.timestamp >= since
+    ).group_by(Purchase.product_id).all()
+    return {
+        product_id: float(cost) / float(quantity)
+        for product_id, cost, quantity in rows if quantity
+    }
+
+
+def _last_purchases(db: Session, vendor_id: int) -> dict:
+    return dict(db.query(Purchase.product_id, func.max(Purchase.timestamp)).filter(
+        Purchase.vendor_id == vendor_id
+    ).group_by(Purchase.product_id).all())
+
+
+def _units_sold(db: Session, vendor_id: int, since: datetime) -> dict:
+    return dict(db.query(Sale.product_id, func.sum(Sale.quantity)).filter(
+        Sale.vendor_id == vendor_id,
+        Sale.created_at >= since
+    ).group_by(Sale.product_id).all())
+
+
+def _suggest(unit_cost: float, margin: float, sell_through) -> tuple[float, float, str]:
+    markup = margin
+    reason = f"{margin:g}% markup on cost"
+    if sell_through is not None and sell_through >= FAST_SELL_THROUGH:
+        markup += SELL_THROUGH_ADJUSTMENT
+        reason += f", +{SELL_THROUGH_ADJUSTMENT} for fast sell-through"
+    elif sell_through is not None and sell_through <= SLOW_SELL_THROUGH:
+        markup = max(0, markup - SELL_THROUGH_ADJUSTMENT)
+        reason += f", -{SELL_THROUGH_ADJUSTMENT} for slow sell-through"
+    price = max(unit_cost, unit_cost * (1 + markup / 100))
+    return float(math.ceil(price)), markup, reason
+
+
+def _compute_suggestions(db: Session, vendor_id: int) -> dict:
+    now = datetime.utcnow()
+    pref = db.query(VendorPreference).filter(VendorPreference.vendor_id == vendor_id).first()
+    margin = pref.pricing_margin if pref and pref.pricing_margin is not None else DEFAULT_MARGIN
+
+    products = db.query(Product.id, Product.name, Product.variation, Product.avg_unit_cost).filter(
+        Product.vendor_id == vendor_id,
+        or_(Product.is_active.is_(None), Product.is_active == True)
+    ).order_by(Product.name).all()
+    recent = _recent_costs(db, vendor_id, now - timedelta(days=RECENT_COST_DAYS))
+    last_purchases = _last_purchases(db, vendor_id)
+    sold = _units_sold(db, vendor_id, now - timedelta(days=SELL_THROUGH_DAYS))
+    on_hand = dict(db.query(Inventory.product_id, Inventory.quantity).filter(Inventory.vendor_id == vendor_id).all())
+    prices = {row["product_id"]: row["price"] for row in pricing_service.resolve_current_prices(db, vendor_id, now)}
+
+    suggestions = []
+    for product_id, name, variation, avg_cost in products:
+        recent_cost = recent.get(product_id)
+        unit_cost = recent_cost if recent_cost is not None else avg_cost
+        units = float(sold.get(product_id) or 0)
+        stock = float(on_hand.get(product_id) or 0)
+        sell_through = round(units / (units + stock), 3) if units + stock else None
+        current = prices.get(product_id)
+
+        suggestion = {
+            "product_id": product_id,
+            "product_name": name,
+            "variation": variation,
+            "unit_cost": round(unit_cost, 2) if unit_cost is not None else None,
+            "cost_source": "recent_purchases" if recent_cost is not None else ("average_cost" if avg_cost is not None else None),
+            "last_purchase_at": last_purchases.get(product_id),
+            "current_price": current,
+            "current_margin_pct": round((current - unit_cost) / unit_cost * 100, 1) if current is not None and unit_cost else None,
+            "sell_through": sell_through,
+            "suggested_price": None,
+            "suggested_margin_pct": None,
+            "reason": "No purchase cost recorded yet",
+        }
+        if unit_cost:
+            price, markup, reason = _suggest(unit_cost, margin, sell_through)
+            suggestion.update(suggested_price=price, suggested_margin_pct=markup, reason=reason)
+        suggestions.append(suggestion)
+
+    return {
+        "pricing_margin": margin,
+        "auto_suggest": bool(pref.pricing_auto_suggest) if pref else False,
+        "quick_pricing": bool(pref.pricing_quick_pricing) if pref and pref.pricing_quick_pricing is not None else True,
+        "suggestions": suggestions,
+    }
+
+
+def price_suggestions(db: Session, vendor_id: int) -> dict:
+    """Suggestions for every active product, recomputed after relevant writes or a new EAT day."""
+    key = (local_today(), get_resource_versions(db, vendor_id, SUGGESTION_RESOURCES))
+    cached = _suggestions.get(vendor_id, key)
+    if cached is None:
+        _suggestions.invalidate(vendor_id)  # entries for older days or versions
+        cached = _compute_suggestions(db, vendor_id)
+        _suggestions.set(vendor_id, key, cached)
+    return cached
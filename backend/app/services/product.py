@@ -4,6 +4,8 @@ from fastapi import HTTPException, status
 from app.models.product import Product
 from app.models.vendor import Vendor
 from app.schemas.product import ProductCreate
+from app.services.price_suggestion import invalidate_price_suggestions
+from app.services.resource_version import bump_resource_version, PRODUCTS, BONUS_RULES
 
 def create_product(db: Session, product_in: ProductCreate, vendor_id: int) -> Product:
     vendor = db.query(Vendor).filter(Vendor.id == vendor_id).first()
@@ -21,8 +23,10 @@ def create_product(db: Session, product_in: ProductCreate, vendor_id: int) -> Pr
         is_active=True
     )
     db.add(product)
+    bump_resource_version(db, vendor_id, PRODUCTS)
     db.commit()
     db.refresh(product)
+    invalidate_price_suggestions(vendor_id)
     return product
 
 def get_products_by_vendor(db: Session, vendor_id: int) -> list[Product]:
@@ -46,18 +50,24 @@ def update_product(db: Session, product_id: int, vendor_id: int, product_in: Pro
     product.unit = product_in.unit
     product.variation = product_in.variation
     product.sale_type = product_in.sale_type
+    bump_resource_version(db, vendor_id, PRODUCTS)
     db.commit()
     db.refresh(product)
+    invalidate_price_suggestions(vendor_id)
     return product
 
 def toggle_product_status(db: Session, product_id: int, vendor_id: int, active: bool) -> Product:
     product = get_product(db, product_id, vendor_id)
     product.is_active = active
+    bump_resource_version(db, vendor_id, PRODUCTS)
     db.commit()
     db.refresh(product)
+    invalidate_price_suggestions(vendor_id)
     return product
 
 def delete_product(db: Session, product_id: int, vendor_id: int) -> None:
     product = get_product(db, product_id, vendor_id)
     db.delete(product)
+    bump_resource_version(db, vendor_id, PRODUCTS, BONUS_RULES)  # rules list their product ids
     db.commit()
+    invalidate_price_suggestions(vendor_id)
@@ -1,18 +1,65 @@
 # backend/app/services/product_pricing.py
+from datetime import datetime
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
+from app.models.product import Product
 from app.models.product_pricing import ProductPricing
 from app.schemas.product_pricing import ProductPricingCreate
+from app.services import price_suggestion
+from app.services.resource_version import bump_resource_version, PRICES
 
 def create_product_pricing(db: Session, pricing: ProductPricingCreate) -> ProductPricing:
     new_pricing = ProductPricing(**pricing.dict())
+    vendor_id = db.query(Product.vendor_id).filter(Product.id == pricing.product_id).scalar()
     db.add(new_pricing)
+    bump_resource_version(db, vendor_id, PRICES)
     db.commit()
     db.refresh(new_pricing)
+    price_suggestion.invalidate_price_suggestions(vendor_id)
     return new_pricing
 
 def get_product_pricings(db: Session, product_id: int) -> list[ProductPricing]:
     return db.query(ProductPricing).filter(ProductPricing.product_id == product_id).all()
 
+def resolve_current_prices(db: Session, vendor_id: int, at: datetime | None = None) -> list[dict]:
+    """
+    The price in effect at `at` (default now) for every product of the vendor,
+    in one query: rank each product's open windows newest first and keep the top one.
+    """
+    at = at or datetime.utcnow()
+    ranked = db.query(
+        ProductPricing.id,
+        ProductPricing.product_id,
+        ProductPricing.price_type,
+        ProductPricing.price,
+        ProductPricing.effective_from,
+        ProductPricing.effective_to,
+        func.row_number().over(
+            partition_by=ProductPricing.product_id,
+            order_by=(ProductPricing.effective_from.desc(), ProductPricing.id.desc())
+        ).label("position"),
+    ).join(Product, Product.id == ProductPricing.product_id).filter(
+        Product.vendor_id == vendor_id,
+        ProductPricing.effective_from <= at,
+        or_(ProductPricing.effective_to.is_(None), ProductPricing.effective_to > at)
+    ).subquery()
+
+    rows = db.query(ranked, Product.name.label("product_name")).join(
+        Product, Product.id == ranked.c.product_id
+    ).filter(ranked.c.position == 1).order_by(Product.name).all()
+    return [
+        {
+            "id": row.id,
+            "product_id": row.product_id,
+            "product_name": row.product_name,
+            "price_type": row.price_type,
+            "price": row.price,
+            "effective_from": row.effective_from,
+            "effective_to": row.effective_to,
+        }
+        for row in rows
+    ]
+
 def get_pricing_by_id(db: Session, pricing_id: int) -> ProductPricing | None:
     return db.query(ProductPricing).filter(ProductPricing.id == pricing_id).first()
 
@@ -20,6 +67,9 @@ def delete_product_pricing(db: Session, pricing_id: int) -> bool:
     pricing = db.query(ProductPricing).filter(ProductPricing.id == pricing_id).first()
     if not pricing:
         return False
+    vendor_id = pricing.product.vendor_id
     db.delete(pricing)
+    bump_resource_version(db, vendor_id, PRICES)
     db.commit()
+    price_suggestion.invalidate_price_suggestions(vendor_id)
     return True
@@ -1,7 +1,12 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.models.purchase import Purchase
-from app.schemas.purchase import PurchaseCreate, PurchaseUpdate
+from app.schemas.purchase import PurchaseCreate, PurchaseOut, PurchaseUpdate
+from app.core.responses import schema_columns
+from app.services.inventory_lot import receive_lot
+from app.services.cost_basis import apply_purchase_cost
+from app.services.price_suggestion import invalidate_price_suggestions
+from app.services.resource_version import bump_resource_version, PURCHASES
 
 
 def create_purchase(db: Session, vendor_id: int, purchase: PurchaseCreate) -> Purchase:
@@ -14,8 +19,20 @@ def create_purchase(db: Session, vendor_id: int, purchase: PurchaseCreate) -> Pu
         source=purchase.source,
     )
     db.add(db_purchase)
+    receive_lot(
+        db,
+        vendor_id=vendor_id,
+        product_id=purchase.product_id,
+        quantity=purchase.quantity,
+        unit_cost=purchase.unit_cost,
+        expiry_date=purchase.expiry_date,
+        purchase=db_purchase,
+    )
+    apply_purchase_cost(db, purchase.product_id, purchase.quantity, purchase.unit_cost)
+    bump_resource_version(db, vendor_id, PURCHASES)
     db.commit()
     db.refresh(db_purchase)
+    invalidate_price_suggestions(vendor_id)
     return db_purchase
 
 
@@ -23,6 +40,11 @@ def get_purchases_by_vendor(db: Session, vendor_id: int) -> List[Purchase]:
     return db.query(Purchase).filter(Purchase.vendor_id == vendor_id).all()
 
 
+def get_purchase_rows(db: Session, vendor_id: int) -> list:
+    """All purchases for a vendor as PurchaseOut column tuples, for the read-only list."""
+    return db.query(*schema_columns(Purchase, PurchaseOut)).filter(Purchase.vendor_id == vendor_id).all()
+
+
 def get_purchase(db: Session, purchase_id: int) -> Optional[Purchase]:
     return db.query(Purchase).filter(Purchase.id == purchase_id).first()
 
@@ -36,8 +58,10 @@ def update_purchase(db: Session, purchase_id: int, purchase_update: PurchaseUpda
     for key, value in update_data.items():
         setattr(db_purchase, key, value)
 
+    bump_resource_version(db, db_purchase.vendor_id, PURCHASES)
     db.commit()
     db.refresh(db_purchase)
+    invalidate_price_suggestions(db_purchase.vendor_id)
     return db_purchase
 
 
@@ -46,5 +70,7 @@ def delete_purchase(db: Session, purchase_id: int) -> bool:
     if not db_purchase:
         return False
     db.delete(db_purchase)
+    bump_resource_version(db, db_purchase.vendor_id, PURCHASES)
     db.commit()
+    invalidate_price_suggestions(db_purchase.vendor_id)
     return True
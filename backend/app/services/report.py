@@ -0,0 +1,179 @@
+# backend/app/services/report.py
+from datetime import date, datetime, timedelta
+from typing import Optional
+from sqlalchemy import case, func, select, union
+from sqlalchemy.orm import Session
+from app.core.buckets import (
+    as_date, bucket_range, bucket_start, date_bucket, dialect_name, local_today, utc_start_of,
+)
+from app.models.product import Product
+from app.models.purchase import Purchase
+from app.models.sale import Sale
+from app.models.spoilage_entry import SpoilageEntry
+
+# default look-back per bucket size, in buckets
+PNL_DEFAULT_BUCKETS = {"day": 14, "week": 12, "month": 12}
+
+
+def _margin_line(units_sold, revenue, cost_of_goods, uncosted_units, **keys) -> dict:
+    revenue = float(revenue or 0)
+    cost_of_goods = float(cost_of_goods or 0)
+    gross_margin = revenue - cost_of_goods
+    return {
+        **keys,
+        "units_sold": float(units_sold or 0),
+        "revenue": revenue,
+        "cost_of_goods": cost_of_goods,
+        "gross_margin": gross_margin,
+        "margin_pct": round(gross_margin / revenue * 100, 2) if revenue else None,
+        "uncosted_units": float(uncosted_units or 0),
+    }
+
+
+def margin_report(
+    db: Session,
+    vendor_id: int,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> dict:
+    """Revenue vs. cost of goods per product, summed from the columns stamped on each sale."""
+    query = db.query(
+        Sale.product_id,
+        Product.name,
+        func.sum(Sale.quantity),
+        func.sum(Sale.total_price),
+        func.sum(Sale.cost_of_goods),
+        func.sum(case((Sale.cost_of_goods.is_(None), Sale.quantity), else_=0)),
+    ).join(Product, Product.id == Sale.product_id).filter(Sale.vendor_id == vendor_id)
+    if date_from:
+        query = query.filter(Sale.created_at >= date_from)
+    if date_to:
+        query = query.filter(Sale.created_at < date_to)
+    rows = query.group_by(Sale.product_id, Product.name).all()
+
+    products = [
+        _margin_line(units, revenue, cogs, uncosted, product_id=product_id, product_name=name)
+        for product_id, name, units, revenue, cogs, uncosted in rows
+    ]
+    products.sort(key=lambda line: line["gross_margin"], reverse=True)
+    totals = _margin_line(
+        sum(line["units_sold"] for line in products),
+        sum(line["revenue"] for line in products),
+        sum(line["cost_of_goods"] for line in products),
+        sum(line["uncosted_units"] for line in products),
+    )
+    return {"date_from": date_from, "date_to": date_to, "totals": totals, "products": products}
+
+
+def _default_pnl_window(period: str) -> tuple[date, date]:
+    last_day = local_today()
+    first_day = bucket_start(last_day, period)
+    for _ in range(PNL_DEFAULT_BUCKETS[period] - 1):
+        first_day = bucket_start(first_day - timedelta(days=1), period)
+    return first_day, last_day
+
+
+def _pnl_line(revenue, discounts, purchase_cost, cost_of_goods, spoilage_cost, **keys) -> dict:
+    revenue = float(revenue or 0)
+    cost_of_goods = float(cost_of_goods or 0)
+    spoilage_cost = float(spoilage_cost or 0)
+    purchase_cost = float(purchase_cost or 0)
+    gross_profit = revenue - cost_of_goods
+    return {
+        **keys,
+        "revenue": revenue,
+        "discounts": float(discounts or 0),
+        "purchase_cost": purchase_cost,
+        "cost_of_goods": cost_of_goods,
+        "spoilage_cost": spoilage_cost,
+        "gross_profit": gross_profit,
+        "net": gross_profit - spoilage_cost,
+        "cash_flow": revenue - purchase_cost,
+    }
+
+
+def pnl_report(
+    db: Session,
+    vendor_id: int,
+    period: str = "week",
+    first_day: Optional[date] = None,
+    last_day: Optional[date] = None,
+) -> dict:
+    """
+    Profit and loss per EAT day/week/month over [first_day, last_day], in one
+    statement: a CTE per source (sales, purchases, spoilage) grouped by bucket,
+    outer-joined onto the union of their buckets.
+
+    revenue is what customers paid (Sale.total_price, after discounts);
+    spoilage is valued at the product's moving-average cost. net is
+    gross profit less spoilage; cash_flow is revenue less purchases.
+    """
+    if first_day is None or last_day is None:
+        default_first, default_last = _default_pnl_window(period)
+        first_day = first_day or default_first
+        last_day = last_day or default_last
+    date_from, date_to = utc_start_of(first_day), utc_start_of(last_day + timedelta(days=1))
+    dialect = dialect_name(db)
+
+    sale_bucket = date_bucket(Sale.created_at, period, dialect)
+    sales = select(
+        sale_bucket.label("bucket"),
+        func.sum(Sale.total_price).label("revenue"),
+        func.sum(func.coalesce(Sale.discount_amount, 0)).label("discounts"),
+        func.sum(func.coalesce(Sale.cost_of_goods, 0)).label("cost_of_goods"),
+    ).where(
+        Sale.vendor_id == vendor_id,
+        Sale.created_at >= date_from,
+        Sale.created_at < date_to
+    ).group_by(sale_bucket).cte("sales_by_bucket")
+
+    purchase_bucket = date_bucket(Purchase.timestamp, period, dialect)
+    purchases = select(
+        purchase_bucket.label("bucket"),
+        func.sum(Purchase.total_cost).label("purchase_cost"),
+    ).where(
+        Purchase.vendor_id == vendor_id,
+        Purchase.timestamp >= date_from,
+        Purchase.timestamp < date_to
+    ).group_by(purchase_bucket).cte("purchases_by_bucket")
+
+    spoilage_bucket = date_bucket(SpoilageEntry.timestamp, period, dialect)
+    spoilage = select(
+        spoilage_bucket.label("bucket"),
+        func.sum(SpoilageEntry.quantity * func.coalesce(Product.avg_unit_cost, 0)).label("spoilage_cost"),
+    ).join(Product, Product.id == SpoilageEntry.product_id).where(
+        SpoilageEntry.vendor_id == vendor_id,
+        SpoilageEntry.timestamp >= date_from,
+        SpoilageEntry.timestamp < date_to
+    ).group_by(spoilage_bucket).cte("spoilage_by_bucket")
+
+    buckets = union(
+        select(sales.c.bucket), select(purchases.c.bucket), select(spoilage.c.bucket)
+    ).cte("buckets")
+
+    statement = select(
+        buckets.c.bucket,
+        sales.c.revenue,
+        sales.c.discounts,
+        purchases.c.purchase_cost,
+        sales.c.cost_of_goods,
+        spoilage.c.spoilage_cost,
+    ).select_from(buckets).outerjoin(
+        sales, sales.c.bucket == buckets.c.bucket
+    ).outerjoin(
+        purchases, purchases.c.bucket == buckets.c.bucket
+    ).outerjoin(
+        spoilage, spoilage.c.bucket == buckets.c.bucket
+    )
+    by_bucket = {as_date(row.bucket): row for row in db.execute(statement)}
+
+    lines = []
+    for start in bucket_range(first_day, last_day, period):
+        row = by_bucket.get(start)
+        values = row[1:] if row else (0, 0, 0, 0, 0)
+        lines.append(_pnl_line(*values, bucket=start))
+    totals = _pnl_line(*(
+        sum(line[field] for line in lines)
+        for field in ("revenue", "discounts", "purchase_cost", "cost_of_goods", "spoilage_cost")
+    ))
+    return {"period": period, "date_from": first_day, "date_to": last_day, "totals": totals, "buckets": lines}
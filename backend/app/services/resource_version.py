@@ -0,0 +1,45 @@
+# backend/app/services/resource_version.py
+from sqlalchemy.orm import Session
+from app.models.resource_version import ResourceVersion
+
+PRODUCTS = "products"
+BONUS_RULES = "bonus_rules"
+INVENTORY = "inventory"
+VENDOR_PREFERENCES = "vendor_preferences"
+PRICES = "product_prices"
+PURCHASES = "purchases"
+
+
+def get_resource_version(db: Session, vendor_id: int, resource: str) -> int:
+    version = db.query(ResourceVersion.version).filter(
+        ResourceVersion.vendor_id == vendor_id,
+        ResourceVersion.resource == resource
+    ).scalar()
+    return version or 0
+
+
+def get_resource_versions(db: Session, vendor_id: int, resources: tuple[str, ...]) -> tuple[int, ...]:
+    """Current versions of several resources in one query, in the order given."""
+    rows = dict(db.query(ResourceVersion.resource, ResourceVersion.version).filter(
+        ResourceVersion.vendor_id == vendor_id,
+        ResourceVersion.resource.in_(resources)
+    ).all())
+    return tuple(rows.get(resource, 0) for resource in resources)
+
+
+def bump_resource_version(db: Session, vendor_id: int, *resources: str) -> None:
+    """Stage a version bump; it is committed together with the write that caused it."""
+    for resource in resources:
+        updated = db.query(ResourceVersion).filter(
+            ResourceVersion.vendor_id == vendor_id,
+            ResourceVersion.resource == resource
+        ).update({ResourceVersion.version: ResourceVersion.version + 1}, synchronize_session=False)
+        if not updated:
+            db.add(ResourceVersion(vendor_id=vendor_id, resource=resource, version=1))
+            db.flush()
+
+
+def resource_etag(db: Session, vendor_id: int, resource: str) -> str:
+    # The vendor id is part of the tag: browsers cache by URL, not by token,
+    # so two vendors sharing a device must never match each other's tags.
+    return f'W/"{resource}-{vendor_id}-{get_resource_version(db, vendor_id, resource)}"'
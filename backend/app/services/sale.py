@@ -1,10 +1,15 @@
 # backend/app/services/sale.py
 from sqlalchemy.orm import Session
+from sqlalchemy import case, func
 from typing import List, Optional, Dict
 from app.models.sale import Sale
 from app.models.bonus_rule import BonusRule
 from app.models.product import Product
-from app.schemas.sale import SaleCreate, SaleUpdate
+from app.schemas.sale import SaleCreate, SaleOut, SaleUpdate
+from app.core.responses import schema_columns
+from app.services.inventory_lot import consume_lots_fefo
+from app.services.cost_basis import cost_of_goods_sold
+from app.services.analytics import period_window
 from decimal import Decimal
 
 
@@ -110,6 +115,7 @@ def create_sale(db: Session, vendor_id: int, sale: SaleCreate) -> Sale:
         quantity=sale.quantity,
         unit_price=sale.unit_price,
         total_price=final_total,
+        cost_of_goods=cost_of_goods_sold(db, sale.product_id, sale.quantity),
         original_price=original_total,
         discount_amount=discount_amount,
         discount_type=reward_info['discount_type'],
@@ -119,6 +125,7 @@ def create_sale(db: Session, vendor_id: int, sale: SaleCreate) -> Sale:
         cart_id=sale.cart_id,
     )
     db.add(db_sale)
+    consume_lots_fefo(db, vendor_id, sale.product_id, sale.quantity)
     db.commit()
     db.refresh(db_sale)
     return db_sale
@@ -168,6 +175,7 @@ def complete_sale_with_rewards(
             quantity=line.quantity,
             unit_price=line.unitPrice,
             total_price=final_subtotal,
+            cost_of_goods=cost_of_goods_sold(db, product_id, line.quantity),
             original_price=original_subtotal,
             discount_amount=discount_amount,
             discount_type=reward_info['discount_type'],
@@ -178,6 +186,7 @@ def complete_sale_with_rewards(
         )
         
         db.add(db_sale)
+        consume_lots_fefo(db, vendor_id, product_id, line.quantity)
         created_sales.append(db_sale)
         total_discount_recalculated += discount_amount
     
@@ -196,6 +205,58 @@ def get_sales_by_vendor(db: Session, vendor_id: int) -> List[Sale]:
     return db.query(Sale).filter(Sale.vendor_id == vendor_id).all()
 
 
+def get_sale_rows(db: Session, vendor_id: int) -> list:
+    """All sales for a vendor as SaleOut column tuples, for the read-only list."""
+    return db.query(*schema_columns(Sale, SaleOut)).filter(Sale.vendor_id == vendor_id).all()
+
+
+def top_sellers(db: Session, vendor_id: int, k: int = 5, period: str = "week", by: str = "units") -> List[dict]:
+    """
+    Best sellers for the period, ranked in SQL, with each product's rank in
+    the period before it so the dashboard can show movement.
+    """
+    _, _, date_from, date_to, _ = period_window(period)
+    previous_from = date_from - (date_to - date_from)
+    metric = Sale.quantity if by == "units" else Sale.total_price
+    in_current = Sale.created_at >= date_from
+
+    totals = db.query(
+        Sale.product_id.label("product_id"),
+        func.sum(case((in_current, Sale.quantity), else_=0)).label("units"),
+        func.sum(case((in_current, Sale.total_price), else_=0)).label("revenue"),
+        func.sum(case((in_current, metric), else_=0)).label("current_value"),
+        func.sum(case((in_current, 0), else_=metric)).label("previous_value"),
+    ).filter(
+        Sale.vendor_id == vendor_id,
+        Sale.created_at >= previous_from,
+        Sale.created_at < date_to
+    ).group_by(Sale.product_id).subquery()
+
+    ranked = db.query(
+        totals,
+        func.rank().over(order_by=totals.c.current_value.desc()).label("rank"),
+        func.rank().over(order_by=totals.c.previous_value.desc()).label("previous_rank"),
+    ).subquery()
+
+    rows = db.query(ranked, Product.name).join(
+        Product, Product.id == ranked.c.product_id
+    ).filter(ranked.c.current_value > 0).order_by(ranked.c.rank, ranked.c.product_id).limit(k).all()
+
+    results = []
+    for row in rows:
+        previous_rank = row.previous_rank if row.previous_value else None
+        results.append({
+            "product_id": row.product_id,
+            "product_name": row.name,
+            "units": float(row.units or 0),
+            "revenue": float(row.revenue or 0),
+            "rank": row.rank,
+            "previous_rank": previous_rank,
+            "rank_change": previous_rank - row.rank if previous_rank else None,
+        })
+    return results
+
+
 def get_sale(db: Session, sale_id: int) -> Optional[Sale]:
     """Get a specific sale by ID"""
     return db.query(Sale).filter(Sale.id == sale_id).first()
@@ -1,30 +1,125 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import func
+from fastapi import HTTPException
+from datetime import datetime
 from app.models.spoilage_entry import SpoilageEntry
+from app.models.inventory import Inventory
+from app.models.inventory_history import InventoryHistory
+from app.models.product import Product
 from app.schemas.spoilage_entry import SpoilageEntryCreate, SpoilageEntryUpdate
+from app.core.buckets import date_bucket, dialect_name
+from app.services.inventory_lot import adjust_lots
+from app.services.cost_basis import adjust_cost_basis_quantity
+from app.services.resource_version import bump_resource_version, INVENTORY
 from typing import List, Optional
 
 
+def _adjust_inventory_for_spoilage(db: Session, vendor_id: int, product_id: int, quantity: float) -> None:
+    """Move `quantity` from on-hand stock to spoiled stock (negative to reverse).
+
+    Spoilage larger than the stock on hand is rejected, so every entry was
+    deducted in full and reversing it restores exactly its quantity (into an
+    adjustment lot). Only stages the change; the caller commits it together
+    with the entry.
+    """
+    if not quantity:
+        return
+    inv = db.query(Inventory).filter(
+        Inventory.vendor_id == vendor_id,
+        Inventory.product_id == product_id
+    ).with_for_update().first()
+    previous = (inv.quantity or 0) if inv else 0
+    if quantity > previous:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot spoil {quantity:g}: only {previous:g} in stock",
+        )
+    if not inv:
+        return
+
+    adjust_lots(db, vendor_id, product_id, -quantity)
+    adjust_cost_basis_quantity(db, product_id, -quantity)
+    inv.quantity = previous - quantity
+    inv.spoilage_quantity = max(0, (inv.spoilage_quantity or 0) + quantity)
+    db.add(InventoryHistory(
+        inventory_id=inv.id,
+        change_type="spoilage",
+        quantity_change=inv.quantity - previous,
+    ))
+    bump_resource_version(db, vendor_id, INVENTORY)
+
+
 def create_spoilage_entry(db: Session, vendor_id: int, entry: SpoilageEntryCreate) -> SpoilageEntry:
+    """Record spoilage and take it out of stock in the same transaction."""
+    product = db.query(Product.id).filter(
+        Product.id == entry.product_id,
+        Product.vendor_id == vendor_id
+    ).first()
+    if not product:
+        raise HTTPException(status_code=404, detail="Product not found or not yours")
+
     db_entry = SpoilageEntry(**entry.dict(), vendor_id=vendor_id)
     db.add(db_entry)
+    _adjust_inventory_for_spoilage(db, vendor_id, entry.product_id, entry.quantity)
     db.commit()
     db.refresh(db_entry)
     return db_entry
 
 
-def get_spoilage_entry(db: Session, entry_id: int) -> Optional[SpoilageEntry]:
-    return db.query(SpoilageEntry).filter(SpoilageEntry.id == entry_id).first()
+def get_spoilage_entry(db: Session, vendor_id: int, entry_id: int) -> Optional[SpoilageEntry]:
+    """Fetch a spoilage entry scoped to its vendor."""
+    return db.query(SpoilageEntry).filter(
+        SpoilageEntry.id == entry_id,
+        SpoilageEntry.vendor_id == vendor_id
+    ).first()
 
 
 def get_all_spoilage_entries(db: Session, vendor_id: int, skip: int = 0, limit: int = 100) -> List[SpoilageEntry]:
     return db.query(SpoilageEntry).filter(SpoilageEntry.vendor_id == vendor_id).offset(skip).limit(limit).all()
 
 
-def update_spoilage_entry(db: Session, entry_id: int, entry_update: SpoilageEntryUpdate) -> Optional[SpoilageEntry]:
-    db_entry = get_spoilage_entry(db, entry_id)
+def summarize_spoilage(
+    db: Session,
+    vendor_id: int,
+    group_by: str,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> List[dict]:
+    """Total spoiled quantity per product, EAT day or reason, aggregated in SQL."""
+    if group_by == "product":
+        keys = [SpoilageEntry.product_id.label("product_id"), Product.name.label("product_name")]
+    elif group_by == "day":
+        keys = [date_bucket(SpoilageEntry.timestamp, "day", dialect_name(db)).label("day")]
+    else:
+        keys = [SpoilageEntry.reason.label("reason")]
+
+    query = db.query(
+        *keys,
+        func.sum(SpoilageEntry.quantity).label("total_quantity"),
+        func.count(SpoilageEntry.id).label("entry_count"),
+    ).filter(SpoilageEntry.vendor_id == vendor_id)
+    if group_by == "product":
+        query = query.join(Product, Product.id == SpoilageEntry.product_id)
+    if date_from:
+        query = query.filter(SpoilageEntry.timestamp >= date_from)
+    if date_to:
+        query = query.filter(SpoilageEntry.timestamp < date_to)
+
+    rows = query.group_by(*keys).order_by(keys[0]).all()
+    return [row._asdict() for row in rows]
+
+
+def update_spoilage_entry(
+    db: Session, vendor_id: int, entry_id: int, entry_update: SpoilageEntryUpdate
+) -> Optional[SpoilageEntry]:
+    db_entry = get_spoilage_entry(db, vendor_id, entry_id)
     if not db_entry:
         return None
     update_data = entry_update.dict(exclude_unset=True)
+    if update_data.get("quantity") is not None:
+        _adjust_inventory_for_spoilage(
+            db, db_entry.vendor_id, db_entry.product_id, update_data["quantity"] - db_entry.quantity
+        )
     for key, value in update_data.items():
         setattr(db_entry, key, value)
     db.commit()
@@ -32,10 +127,11 @@ def update_spoilage_entry(db: Session, entry_id: int, entry_update: SpoilageEntr
     return db_entry
 
 
-def delete_spoilage_entry(db: Session, entry_id: int) -> bool:
-    db_entry = get_spoilage_entry(db, entry_id)
+def delete_spoilage_entry(db: Session, vendor_id: int, entry_id: int) -> bool:
+    db_entry = get_spoilage_entry(db, vendor_id, entry_id)
     if not db_entry:
         return False
+    _adjust_inventory_for_spoilage(db, db_entry.vendor_id, db_entry.product_id, -db_entry.quantity)
     db.delete(db_entry)
     db.commit()
     return True
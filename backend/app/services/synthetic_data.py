@@ -0,0 +1,340 @@
+# backend/app/services/synthetic_data.py
+"""
+Deterministic synthetic vendor data for load tests and benchmarks.
+
+Every vendor gets a slice of a fruit catalogue and a history of:
+
+- daily sales per product, Poisson-distributed around a base rate scaled by
+  the product's season (peak month), the day of the week and a per-vendor
+  growth trend, at EAT trading hours;
+- restocking purchases every few days sized to recent demand, and spoilage
+  a few days later in proportion to each product's perishability;
+- bonus rules with product associations, prices, preferences and the stock
+  left on hand at the end;
+- M-Pesa transactions for M-Pesa sales with matching receipt numbers, plus
+  some failed or cancelled STK pushes with no sale.
+
+The random stream of vendor n depends only on (seed, n), so the same seed
+and end date always produce the same rows, whatever the vendor count.
+Vendors and products get explicit ids after the current maximum; rows are
+written in batches with COPY on PostgreSQL and executemany elsewhere.
+"""
+import csv
+import io
+import math
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from sqlalchemy import func, select, text
+
+from app.core.buckets import EAT_OFFSET, local_today
+from app.models.bonus_rule import BonusRule, bonus_rule_product
+from app.models.inventory import Inventory
+from app.models.mpesa_transaction import MpesaTransaction
+from app.models.product import Product
+from app.models.product_pricing import ProductPricing
+from app.models.purchase import Purchase
+from app.models.sale import Sale
+from app.models.spoilage_entry import SpoilageEntry
+from app.models.vendor import Vendor
+from app.models.vendor_preference import VendorPreference
+
+BATCH_SIZE = 50_000
+
+# name, unit, base cost per unit (KSh), markup, sales per day, peak month, perishability
+CATALOGUE = [
+    ("Banana", "bunch", 60, 0.35, 9.0, 4, 0.06),
+    ("Mango", "piece", 25, 0.45, 14.0, 12, 0.08),
+    ("Avocado", "piece", 15, 0.50, 12.0, 7, 0.07),
+    ("Orange", "kg", 90, 0.30, 6.0, 6, 0.03),
+    ("Pineapple", "piece", 80, 0.40, 4.0, 1, 0.04),
+    ("Watermelon", "piece", 180, 0.35, 2.5, 2, 0.05),
+    ("Pawpaw", "piece", 70, 0.40, 3.5, 9, 0.09),
+    ("Passion fruit", "kg", 150, 0.35, 3.0, 10, 0.05),
+    ("Tomato", "kg", 80, 0.30, 10.0, 8, 0.10),
+    ("Onion", "kg", 70, 0.25, 8.0, 5, 0.02),
+    ("Sukuma wiki", "bunch", 15, 0.60, 18.0, 4, 0.15),
+    ("Spinach", "bunch", 20, 0.55, 8.0, 11, 0.14),
+    ("Cabbage", "piece", 40, 0.40, 5.0, 3, 0.04),
+    ("Carrot", "kg", 60, 0.35, 4.5, 7, 0.03),
+    ("Potato", "kg", 55, 0.30, 9.0, 8, 0.02),
+    ("Lemon", "piece", 8, 0.75, 7.0, 3, 0.03),
+    ("Apple", "piece", 20, 0.50, 6.0, 6, 0.02),
+    ("Grapes", "kg", 300, 0.30, 1.5, 2, 0.08),
+    ("Guava", "piece", 10, 0.60, 4.0, 5, 0.09),
+    ("Coriander", "bunch", 10, 0.60, 6.0, 9, 0.18),
+]
+VARIATIONS = (None, None, None, "small", "large", "ripe")
+WEEKDAY_FACTOR = np.array([0.9, 0.85, 0.95, 1.0, 1.15, 1.3, 0.85])  # Monday first
+# Share of the day's sales by EAT hour, 06:00-20:00, with morning, lunch and evening peaks.
+HOUR_WEIGHTS = np.array([0, 0, 0, 0, 0, 0, 2, 5, 8, 6, 5, 6, 8, 7, 5, 5, 7, 9, 8, 5, 2, 0, 0, 0], dtype=float)
+HOUR_WEIGHTS /= HOUR_WEIGHTS.sum()
+MPESA_SHARE = 0.55
+FAILED_STK_SHARE = 0.08
+RESTOCK_EVERY = (2, 5)  # days between purchases, inclusive range
+LOCATIONS = ["Nairobi", "Mombasa", "Kisumu", "Nakuru", "Eldoret"]
+SUPPLIERS = ["Marikiti", "Wakulima market", "Farm gate", "Wholesaler"]
+SPOILAGE_REASONS = ["Overripe", "Bruised", "Rotten", "Damaged in transport"]
+STK_ACCEPTED = "Success. Request accepted for processing"
+STK_PAID = "The service request is processed successfully."
+BONUS_RULE_TEMPLATES = [
+    ("Bulk discount", "quantity", 5, "percentage", 10),
+    ("Big basket", "sales_value", 1000, "fixed", 50),
+    ("Loyal customer", "visit_frequency", 4, "percentage", 5),
+]
+
+VENDOR_COLUMNS = ("id", "name", "email", "contact", "location", "password_hash", "onboarding_completed", "created_at")
+PRODUCT_COLUMNS = (
+    "id", "vendor_id", "name", "unit", "variation", "sale_type", "is_active", "avg_unit_cost", "cost_basis_quantity",
+)
+INVENTORY_COLUMNS = ("vendor_id", "product_id", "quantity", "last_updated", "spoilage_quantity")
+PRICING_COLUMNS = ("product_id", "price_type", "price", "effective_from")
+# COPY skips ORM defaults, so updated_at (the export watermark) is written explicitly
+PURCHASE_COLUMNS = ("vendor_id", "product_id", "quantity", "unit_cost", "total_cost", "source", "timestamp", "updated_at")
+SPOILAGE_COLUMNS = ("vendor_id", "product_id", "quantity", "reason", "timestamp", "updated_at")
+SALE_COLUMNS = (
+    "vendor_id", "product_id", "quantity", "unit_price", "original_price", "discount_amount",
+    "total_price", "cost_of_goods", "reference_no", "payment_type", "created_at", "updated_at",
+)
+MPESA_COLUMNS = (
+    "vendor_id", "product_id", "merchant_request_id", "checkout_request_id", "amount", "phone_number",
+    "account_reference", "response_code", "response_description", "result_code", "result_desc",
+    "mpesa_receipt", "created_at", "updated_at",
+)
+BONUS_RULE_COLUMNS = (
+    "id", "vendor_id", "rule_name", "condition_type", "condition_value", "bonus_type", "bonus_value",
+    "is_active", "created_at",
+)
+
+
+def _vendor_rng(seed: int, vendor_number: int) -> np.random.Generator:
+    return np.random.default_rng([seed, vendor_number])
+
+
+def _receipt(seed: int, vendor_number: int, n: int) -> str:
+    """Ten base-36 characters like a Daraja receipt, unique per (seed, vendor, sequence)."""
+    value = ((seed % 1000) * 100_000 + vendor_number) * 10**7 + n
+    out = ""
+    while value:
+        value, digit = divmod(value, 36)
+        out = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"[digit] + out
+    return out.rjust(10, "0")
+
+
+def _at(day_start_utc, hours: int) -> datetime:
+    return (day_start_utc + np.timedelta64(hours * 3600, "s")).astype(datetime)
+
+
+def _seasonal(days: np.ndarray, peak_month: int) -> np.ndarray:
+    peak_doy = (peak_month - 1) * 30.4 + 15
+    return 1 + 0.35 * np.cos(2 * math.pi * (days - peak_doy) / 365.25)
+
+
+class _Writer:
+    """
+    Buffers rows per table. When any buffer fills, every table is flushed in
+    foreign-key order, so children never reach the database before parents.
+    """
+
+    def __init__(self, connection, batch_size: int = BATCH_SIZE):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.copy = connection.dialect.name == "postgresql"
+        self.order = {table: i for i, table in enumerate(Vendor.metadata.sorted_tables)}
+        self.buffers = {}
+        self.counts = {}
+
+    def add(self, table, columns: tuple, row: tuple) -> None:
+        buffer = self.buffers.setdefault((table, columns), [])
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        for key in sorted(self.buffers, key=lambda key: self.order[key[0]]):
+            self._write(*key, self.buffers.pop(key))
+
+    def _write(self, table, columns: tuple, rows: list) -> None:
+        if self.copy:
+            stream = io.StringIO()
+            writer = csv.writer(stream)
+            for row in rows:
+                writer.writerow(["\\N" if value is None else value for value in row])
+            stream.seek(0)
+            with self.connection.connection.driver_connection.cursor() as cursor:
+                cursor.copy_expert(
+                    f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", stream
+                )
+        else:
+            self.connection.execute(table.insert(), [dict(zip(columns, row)) for row in rows])
+        self.counts[table.name] = self.counts.get(table.name, 0) + len(rows)
+
+
+def _next_id(connection, model) -> int:
+    return (connection.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+
+def _reset_sequences(connection, models) -> None:
+    if connection.dialect.name != "postgresql":
+        return
+    for model in models:
+        table = model.__tablename__
+        connection.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE((SELECT MAX(id) FROM {table}), 1))"
+        ))
+
+
+def generate(
+    connection,
+    vendors: int,
+    days: int = 180,
+    seed: int = 1,
+    end: date | None = None,
+    password_hash: str = "",
+    email_domain: str = "example.com",
+    progress=None,
+) -> dict:
+    """
+    Generate `vendors` vendors with `days` days of history ending on `end`
+    (an EAT date, default today) into the database behind `connection`.
+
+    Runs inside the caller's transaction; returns rows written per table.
+    """
+    end = end or local_today()
+    first_day = end - timedelta(days=days - 1)
+    day_starts_utc = np.array(
+        [datetime.combine(first_day + timedelta(days=d), datetime.min.time()) - EAT_OFFSET for d in range(days)],
+        dtype="datetime64[s]",
+    )
+    day_of_year = np.array([(first_day + timedelta(days=d)).timetuple().tm_yday for d in range(days)])
+    weekday = np.array([(first_day + timedelta(days=d)).weekday() for d in range(days)])
+
+    writer = _Writer(connection)
+    vendor_id = _next_id(connection, Vendor)
+    product_id = _next_id(connection, Product)
+    rule_id = _next_id(connection, BonusRule)
+    created = datetime.combine(first_day, datetime.min.time()) - EAT_OFFSET
+
+    for number in range(1, vendors + 1):
+        rng = _vendor_rng(seed, number)
+        writer.add(Vendor.__table__, VENDOR_COLUMNS, (
+            vendor_id, f"Vendor {number}", f"vendor{number}@{email_domain}", f"07{rng.integers(10**7, 10**8)}",
+            str(rng.choice(LOCATIONS)), password_hash, True, created,
+        ))
+        writer.add(VendorPreference.__table__, ("vendor_id", "pricing_margin"), (vendor_id, int(rng.choice([20, 25, 30, 35]))))
+
+        growth = rng.normal(0.15, 0.1)
+        trend = 1 + growth * np.arange(days) / 365.25
+        size = rng.lognormal(0, 0.4)  # busier and quieter stalls
+        picks = rng.choice(len(CATALOGUE), size=int(rng.integers(8, 16)), replace=False)
+        vendor_products = []
+        mpesa_seq = 0
+
+        for index in picks:
+            name, unit, cost, markup, rate, peak, perishability = CATALOGUE[index]
+            unit_cost = round(cost * rng.uniform(0.85, 1.15), 2)
+            price = float(math.ceil(unit_cost * (1 + markup)))
+            variation = VARIATIONS[int(rng.integers(len(VARIATIONS)))]
+
+            # Sales: per-day counts, then per-sale time of day, quantity and payment type
+            expected = rate * size * _seasonal(day_of_year, peak) * WEEKDAY_FACTOR[weekday] * trend
+            per_day = rng.poisson(expected)
+            total = int(per_day.sum())
+            sale_day = np.repeat(np.arange(days), per_day)
+            seconds = rng.choice(24, size=total, p=HOUR_WEIGHTS) * 3600 + rng.integers(0, 3600, size=total)
+            stamps = (day_starts_utc[sale_day] + seconds.astype("timedelta64[s]")).astype(datetime)
+            quantities = rng.choice([1, 1, 1, 2, 2, 3, 4, 5], size=total)
+            mpesa = rng.random(total) < MPESA_SHARE
+            phones = rng.integers(10**7, 10**8, size=total)
+
+            # Purchases every few days cover the coming demand; some of each batch spoils
+            sold = np.bincount(sale_day, weights=quantities, minlength=days)
+            purchases, spoilage = [], []
+            stock = 0.0
+            day = 0
+            while day < days:
+                gap = int(rng.integers(RESTOCK_EVERY[0], RESTOCK_EVERY[1] + 1))
+                demand = float(sold[day:day + gap].sum())
+                quantity = max(0.0, round(demand * rng.uniform(1.05, 1.25) - stock * 0.5, 1))
+                if quantity > 0:
+                    batch_cost = round(unit_cost * rng.uniform(0.9, 1.1), 2)
+                    bought_at = _at(day_starts_utc[day], 5)  # 08:00 EAT
+                    purchases.append((
+                        vendor_id, product_id, quantity, batch_cost, round(quantity * batch_cost, 2),
+                        str(rng.choice(SUPPLIERS)), bought_at, bought_at,
+                    ))
+                    spoiled = round(quantity * perishability * rng.uniform(0.3, 1.5), 1)
+                    if spoiled > 0:
+                        spoil_day = min(days - 1, day + int(rng.integers(1, gap + 1)))
+                        spoiled_at = _at(day_starts_utc[spoil_day], 14)
+                        spoilage.append((
+                            vendor_id, product_id, spoiled, str(rng.choice(SPOILAGE_REASONS)), spoiled_at, spoiled_at,
+                        ))
+                        stock -= spoiled
+                    stock += quantity
+                stock = max(stock - demand, 0.0)
+                day += gap
+
+            # Parents first: a batch flush can happen on any row below
+            writer.add(Product.__table__, PRODUCT_COLUMNS, (
+                product_id, vendor_id, name, unit, variation, "quick" if rate >= 5 else "manual",
+                True, unit_cost, round(stock, 1),
+            ))
+            writer.add(Inventory.__table__, INVENTORY_COLUMNS, (
+                vendor_id, product_id, round(stock, 1), _at(day_starts_utc[-1], 0), 0.0,
+            ))
+            writer.add(ProductPricing.__table__, PRICING_COLUMNS, (product_id, "unit", price, created))
+            for row in purchases:
+                writer.add(Purchase.__table__, PURCHASE_COLUMNS, row)
+            for row in spoilage:
+                writer.add(SpoilageEntry.__table__, SPOILAGE_COLUMNS, row)
+
+            for i in np.argsort(stamps, kind="stable"):
+                quantity = int(quantities[i])
+                amount = quantity * price
+                receipt = None
+                if mpesa[i]:
+                    mpesa_seq += 1
+                    receipt = _receipt(seed, number, mpesa_seq)
+                    writer.add(MpesaTransaction.__table__, MPESA_COLUMNS, (
+                        vendor_id, product_id, f"{receipt}-M", f"ws_CO_{receipt}", amount, f"2547{phones[i]}",
+                        f"V{vendor_id}", "0", STK_ACCEPTED, 0, STK_PAID, receipt,
+                        stamps[i] - timedelta(seconds=20), stamps[i],
+                    ))
+                writer.add(Sale.__table__, SALE_COLUMNS, (
+                    vendor_id, product_id, quantity, price, amount, 0.0, amount, round(quantity * unit_cost, 2),
+                    receipt, "mpesa" if mpesa[i] else "cash", stamps[i], stamps[i],
+                ))
+
+            # Failed or cancelled STK pushes leave a transaction without a receipt or sale
+            for _ in range(int(rng.binomial(int(mpesa.sum()), FAILED_STK_SHARE))):
+                mpesa_seq += 1
+                stamp = _at(day_starts_utc[int(rng.integers(days))], int(rng.integers(6, 20)))
+                code, desc = (1032, "Request cancelled by user") if rng.random() < 0.7 else (1, "The balance is insufficient")
+                reference = _receipt(seed, number, mpesa_seq)
+                writer.add(MpesaTransaction.__table__, MPESA_COLUMNS, (
+                    vendor_id, product_id, f"{reference}-M", f"ws_CO_{reference}", price, None, f"V{vendor_id}",
+                    "0", STK_ACCEPTED, code, desc, None, stamp, stamp,
+                ))
+
+            vendor_products.append(product_id)
+            product_id += 1
+
+        for template in BONUS_RULE_TEMPLATES[:int(rng.integers(0, len(BONUS_RULE_TEMPLATES) + 1))]:
+            rule_name, condition_type, condition_value, bonus_type, bonus_value = template
+            writer.add(BonusRule.__table__, BONUS_RULE_COLUMNS, (
+                rule_id, vendor_id, rule_name, condition_type, condition_value, bonus_type, bonus_value,
+                bool(rng.random() < 0.8), created,
+            ))
+            linked = rng.choice(vendor_products, size=min(len(vendor_products), int(rng.integers(1, 5))), replace=False)
+            for linked_id in linked:
+                writer.add(bonus_rule_product, ("bonus_rule_id", "product_id"), (rule_id, int(linked_id)))
+            rule_id += 1
+
+        vendor_id += 1
+        if progress:
+            progress(number, vendors)
+
+    writer.flush()
+    _reset_sequences(connection, (Vendor, Product, BonusRule))
+    return writer.counts
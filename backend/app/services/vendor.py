@@ -1,17 +1,16 @@
 from sqlalchemy.orm import Session
 from app.models.vendor import Vendor
 from app.schemas.vendor import VendorCreate, VendorUpdate
-from app.core.security import get_password_hash
 
 
-def create_vendor(db: Session, vendor_in: VendorCreate):
-    hashed_pw = get_password_hash(vendor_in.password)
+def create_vendor(db: Session, vendor_in: VendorCreate, password_hash: str):
+    """password_hash comes from app.core.passwords.hash_password, awaited by the route."""
     db_vendor = Vendor(
         name=vendor_in.name,
         email=vendor_in.email,
         contact=vendor_in.contact,
         location=vendor_in.location,
-        password_hash=hashed_pw,
+        password_hash=password_hash,
     )
     db.add(db_vendor)
     db.commit()
@@ -31,14 +30,15 @@ def get_all_vendors(db: Session, skip: int = 0, limit: int = 10):
     return db.query(Vendor).offset(skip).limit(limit).all()
 
 
-def update_vendor(db: Session, vendor_id: int, vendor_update: VendorUpdate):
+def update_vendor(db: Session, vendor_id: int, vendor_update: VendorUpdate, password_hash: str | None = None):
     vendor = db.query(Vendor).filter(Vendor.id == vendor_id).first()
     if not vendor:
         return None
 
     update_data = vendor_update.dict(exclude_unset=True)
-    if "password" in update_data:
-        update_data["password_hash"] = get_password_hash(update_data.pop("password"))
+    update_data.pop("password", None)
+    if password_hash is not None:
+        update_data["password_hash"] = password_hash
 
     for key, value in update_data.items():
         setattr(vendor, key, value)
@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
 from app.models.vendor_preference import VendorPreference
 from app.schemas.vendor_preference import VendorPreferenceCreate, VendorPreferenceUpdate
+from app.services.price_suggestion import invalidate_price_suggestions
+from app.services.resource_version import bump_resource_version, VENDOR_PREFERENCES
 
 def create_vendor_preference(db: Session, vendor_id: int, pref: VendorPreferenceUpdate):
     db_pref = VendorPreference(
@@ -10,8 +12,10 @@ def create_vendor_preference(db: Session, vendor_id: int, pref: VendorPreference
         display_options=pref.display_options,
     )
     db.add(db_pref)
+    bump_resource_version(db, vendor_id, VENDOR_PREFERENCES)
     db.commit()
     db.refresh(db_pref)
+    invalidate_price_suggestions(vendor_id)
     return db_pref
 
 def get_vendor_preference(db: Session, vendor_id: int):
@@ -23,8 +27,10 @@ def update_vendor_preference(db: Session, vendor_id: int, updates: VendorPrefere
         return None
     for field, value in updates.dict(exclude_unset=True).items():
         setattr(db_pref, field, value)
+    bump_resource_version(db, vendor_id, VENDOR_PREFERENCES)
     db.commit()
     db.refresh(db_pref)
+    invalidate_price_suggestions(vendor_id)
     return db_pref
 
 def delete_vendor_preference(db: Session, vendor_id: int):
@@ -32,5 +38,7 @@ def delete_vendor_preference(db: Session, vendor_id: int):
     if not db_pref:
         return None
     db.delete(db_pref)
+    bump_resource_version(db, vendor_id, VENDOR_PREFERENCES)
     db.commit()
+    invalidate_price_suggestions(vendor_id)
     return True
@@ -0,0 +1,249 @@
+# benchmarks/api.py
+"""
+Repeatable benchmark of the hot API endpoints against a seeded local database.
+
+The script creates a throwaway database (SQLite by default, or a local
+Postgres via --database-url), fills it with the same deterministic synthetic
+vendors as generate_data.py (app/services/synthetic_data.py), starts the API
+on it with uvicorn, and
+drives each scenario with concurrent keep-alive clients, each logged in as a
+different vendor:
+
+    login            POST /auth/login
+    products         GET  /products/
+    inventory        GET  /inventory/
+    sales_list       GET  /sales/
+    sales_complete   POST /sales/complete  (two-line cash sale)
+    mpesa_callback   POST /mpesa/callback  (Daraja success payload)
+
+Results (req/s, p50/p95/p99) are written to benchmarks/results/<time>.json
+and compared with benchmarks/results/baseline.json; --save-baseline makes
+this run the new baseline. The seed and parameters are recorded with the
+results, and a comparison is only meaningful between runs that match.
+
+    python benchmarks/api.py
+    python benchmarks/api.py --database-url postgresql://localhost/fv_bench --clients 32
+    python benchmarks/api.py --scenarios products inventory --duration 20 --save-baseline
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+BASELINE = os.path.join(RESULTS_DIR, "baseline.json")
+PASSWORD = "bench-password"
+
+sys.path.insert(0, BACKEND_DIR)
+
+from loadgen import login, run_load, wait_ready  # noqa: E402
+
+SCENARIOS = ("login", "products", "inventory", "sales_list", "sales_complete", "mpesa_callback")
+
+
+def seed(database_url: str, vendors: int, days: int, seed_value: int) -> None:
+    """Create the schema and fill it with the synthetic vendors of generate_data.py."""
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("SQL_ECHO", "false")
+    from app.core.security import get_password_hash
+    from app.database import Base, get_engine
+    from app.models import (  # noqa: F401  register every table
+        bonus_rule, cart, cart_item, inventory, inventory_history, inventory_lot, mpesa_transaction,
+        payment, product, product_pricing, purchase, resource_version, sale, spoilage_entry,
+        vendor, vendor_preference,
+    )
+    from app.services.synthetic_data import generate
+
+    # A disposable benchmark database, so the tables are created directly.
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    try:
+        with engine.begin() as connection:
+            generate(connection, vendors=vendors, days=days, seed=seed_value, password_hash=get_password_hash(PASSWORD))
+    finally:
+        engine.dispose()
+
+
+def vendor_products(database_url: str, vendors: int) -> list[list[int]]:
+    """Product ids of vendors 1..vendors, in id order, for the sale scenario."""
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("SQL_ECHO", "false")
+    from sqlalchemy import select
+    from app.database import get_engine
+    from app.models.product import Product
+
+    engine = get_engine()
+    by_vendor = [[] for _ in range(vendors)]
+    try:
+        with engine.connect() as connection:
+            rows = connection.execute(
+                select(Product.vendor_id, Product.id).where(Product.vendor_id <= vendors).order_by(Product.id)
+            )
+            for vendor_id, product_id in rows:
+                by_vendor[vendor_id - 1].append(product_id)
+    finally:
+        engine.dispose()
+    return by_vendor
+
+
+def _scenario_requests(name: str, tokens: list, vendors: int, products: list, run_id: str):
+    auth = lambda client: {"Authorization": f"Bearer {tokens[client % len(tokens)]}"}
+
+    if name == "login":
+        return lambda client, n: (
+            "POST", "/auth/login", {"Content-Type": "application/x-www-form-urlencoded"},
+            f"username=vendor{client % vendors + 1}%40example.com&password={PASSWORD}",
+        )
+    if name == "products":
+        return lambda client, n: ("GET", "/products/", auth(client), None)
+    if name == "inventory":
+        return lambda client, n: ("GET", "/inventory/", auth(client), None)
+    if name == "sales_list":
+        return lambda client, n: ("GET", "/sales/", auth(client), None)
+    if name == "sales_complete":
+        def sale(client, n):
+            ids = products[client % len(tokens)]
+            lines = [
+                {"itemId": str(ids[n % len(ids)]), "quantity": 1, "unitPrice": 50, "subtotal": 50},
+                {"itemId": str(ids[(n + 1) % len(ids)]), "quantity": 2, "unitPrice": 30, "subtotal": 60},
+            ]
+            body = json.dumps({"lines": lines, "method": "cash", "finalTotal": 110})
+            return "POST", "/sales/complete", {**auth(client), "Content-Type": "application/json"}, body
+        return sale
+    if name == "mpesa_callback":
+        def callback(client, n):
+            receipt = f"B{run_id}{client:03d}{n:07d}"
+            body = json.dumps({"Body": {"stkCallback": {
+                "MerchantRequestID": f"m-{receipt}", "CheckoutRequestID": f"ws_CO_{receipt}",
+                "ResultCode": 0, "ResultDesc": "The service request is processed successfully.",
+                "CallbackMetadata": {"Item": [
+                    {"Name": "Amount", "Value": 100}, {"Name": "MpesaReceiptNumber", "Value": receipt},
+                    {"Name": "PhoneNumber", "Value": 254700000000},
+                ]},
+            }}})
+            return "POST", "/mpesa/callback", {"Content-Type": "application/json"}, body
+        return callback
+    raise ValueError(f"unknown scenario {name}")
+
+
+def run(args) -> dict:
+    env = dict(
+        os.environ, DATABASE_URL=args.database_url, SQL_ECHO="false", SCHEMA_CHECK="off",
+        LOG_DIR=os.path.join(RESULTS_DIR, "logs"),
+    )
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_ready(args.port, process=server)
+        tokens = [login(args.port, f"vendor{v}@example.com", PASSWORD) for v in range(1, min(args.clients, args.vendors) + 1)]
+        products = vendor_products(args.database_url, len(tokens))
+        run_id = datetime.utcnow().strftime("%H%M%S")
+        scenarios = {}
+        for name in args.scenarios:
+            make_request = _scenario_requests(name, tokens, args.vendors, products, run_id)
+            run_load(args.port, make_request, args.clients, min(args.duration, 2))  # warm-up
+            scenarios[name] = run_load(args.port, make_request, args.clients, args.duration)
+            print(f"  {name:<15} {scenarios[name]['rps']:>8} req/s  p95 {scenarios[name]['p95_ms']} ms", file=sys.stderr)
+        return scenarios
+    finally:
+        server.terminate()
+        server.wait(timeout=60)
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def diff(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print current vs baseline per scenario; returns the regressions beyond `threshold` (a fraction)."""
+    regressions = []
+    print(f"{'scenario':<15} {'req/s':>9} {'Δ':>7} {'p50':>7} {'p95':>7} {'Δ p95':>7} {'p99':>7}")
+    for name, now in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        change = lambda a, b: (a - b) / b if a is not None and b else None
+        rps_change = change(now["rps"], before["rps"]) if before else None
+        p95_change = change(now["p95_ms"], before["p95_ms"]) if before else None
+        fmt = lambda x: f"{x:+.0%}" if x is not None else "-"
+        print(f"{name:<15} {now['rps']:>9} {fmt(rps_change):>7} {now['p50_ms']!s:>7} {now['p95_ms']!s:>7} {fmt(p95_change):>7} {now['p99_ms']!s:>7}")
+        if rps_change is not None and rps_change < -threshold:
+            regressions.append(f"{name}: throughput {fmt(rps_change)}")
+        if p95_change is not None and p95_change > threshold:
+            regressions.append(f"{name}: p95 {fmt(p95_change)}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hot API endpoints against a seeded database.")
+    parser.add_argument("--database-url", default=f"sqlite:///{os.path.join(BENCH_DIR, 'bench.db')}")
+    parser.add_argument("--vendors", type=int, default=50)
+    parser.add_argument("--days", type=int, default=30, help="days of synthetic history per vendor")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skip-seed", action="store_true", help="reuse the database from the previous run")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10, help="seconds per scenario")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.10, help="regression threshold as a fraction")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    if not args.skip_seed:
+        started = time.perf_counter()
+        seed(args.database_url, args.vendors, args.days, args.seed)
+        print(f"seeded in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+    result = {
+        "commit": _git_commit(),
+        "started_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "database": args.database_url.split(":", 1)[0],
+        "params": {
+            "vendors": args.vendors, "days": args.days, "seed": args.seed,
+            "clients": args.clients, "duration": args.duration,
+        },
+        "scenarios": run(args),
+    }
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, result["started_at"].replace(":", "") + ".json")
+    with open(path, "w") as f:
+        json.dump(result, f, indent=2)
+
+    baseline = None
+    if os.path.exists(BASELINE):
+        with open(BASELINE) as f:
+            baseline = json.load(f)
+    regressions = []
+    if baseline:
+        if baseline.get("params") != result["params"] or baseline.get("database") != result["database"]:
+            print("note: baseline was recorded with different parameters", file=sys.stderr)
+        print(f"vs baseline {baseline.get('commit')} ({baseline.get('started_at')}):")
+        regressions = diff(result, baseline, args.threshold)
+    else:
+        diff(result, {}, args.threshold)
+    if args.save_baseline or baseline is None:
+        with open(BASELINE, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"saved baseline {BASELINE}", file=sys.stderr)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# benchmarks/loadgen.py
+"""
+Load generation shared by the benchmark scripts: a closed loop of keep-alive
+HTTP clients (one thread each) and latency percentiles. Standard library
+only, so benchmarks run wherever the app does.
+"""
+import http.client
+import json
+import statistics
+import threading
+import time
+import urllib.parse
+
+
+def request(conn, method, path, headers=None, body=None):
+    conn.request(method, path, body=body, headers=headers or {})
+    response = conn.getresponse()
+    return response.status, response.read()
+
+
+def wait_ready(port: int, timeout: float = 60, process=None) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"server exited with code {process.returncode}")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            if request(conn, "GET", "/ping")[0] == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not become ready")
+
+
+def login(port: int, email: str, password: str, register: bool = False) -> str:
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    if register:
+        body = json.dumps({"name": "bench", "email": email, "contact": "0700000000", "password": password})
+        request(conn, "POST", "/auth/register", {"Content-Type": "application/json"}, body)
+    form = urllib.parse.urlencode({"username": email, "password": password})
+    status, data = request(conn, "POST", "/auth/login", {"Content-Type": "application/x-www-form-urlencoded"}, form)
+    if status != 200:
+        raise RuntimeError(f"login failed for {email}: {status} {data[:200]!r}")
+    return json.loads(data)["access_token"]
+
+
+def percentiles(latencies: list, duration: float, errors: int) -> dict:
+    ms = sorted(value * 1000 for value in latencies)
+    pick = lambda q: round(ms[min(len(ms) - 1, int(q * len(ms)))], 1) if ms else None
+    return {
+        "requests": len(ms),
+        "errors": errors,
+        "rps": round(len(ms) / duration, 1),
+        "p50_ms": pick(0.50),
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+        "mean_ms": round(statistics.fmean(ms), 1) if ms else None,
+    }
+
+
+def run_load(port: int, make_request, clients: int, duration: float, ok=(200, 201, 304)) -> dict:
+    """
+    Keep `clients` connections busy for `duration` seconds.
+
+    make_request(client, n) returns (method, path, headers, body) for the
+    client's n-th request; a response outside `ok` counts as an error.
+    """
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def client(index):
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        local, failed, n = [], 0, 0
+        while time.monotonic() < stop_at:
+            method, path, headers, body = make_request(index, n)
+            n += 1
+            start = time.perf_counter()
+            try:
+                status, _ = request(conn, method, path, headers, body)
+            except (OSError, http.client.HTTPException):
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                status = None
+            if status in ok:
+                local.append(time.perf_counter() - start)
+            else:
+                failed += 1
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return percentiles(latencies, duration, errors[0])
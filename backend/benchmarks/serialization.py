@@ -0,0 +1,155 @@
+# benchmarks/serialization.py
+"""
+Serialization cost of the large list endpoints, per 10k rows, for the
+default path and the column-tuple + orjson path (app/core/responses.py).
+
+    default  db.query(Model).all() -> response_model validation -> JSON-ready
+             Python -> stdlib json (what FastAPI does for a returned list)
+    fast     db.query(*columns).all() -> column_rows -> ORJSONResponse
+
+Each stage is timed separately (load from the database, build the
+response content, encode to bytes) on an in-memory SQLite database, so the
+numbers isolate Python-side cost from network and database latency.
+
+    python benchmarks/serialization.py
+    python benchmarks/serialization.py --rows 50000 --repeat 7 --json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault("SQL_ECHO", "false")
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.core.responses import ORJSONResponse, column_rows, schema_columns  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.models import (  # noqa: E402,F401  register every table
+    bonus_rule, cart, cart_item, inventory, inventory_history, inventory_lot, mpesa_transaction,
+    payment, product, product_pricing, purchase, resource_version, sale, spoilage_entry,
+    vendor, vendor_preference,
+)
+from app.models.product import Product  # noqa: E402
+from app.models.purchase import Purchase  # noqa: E402
+from app.models.sale import Sale  # noqa: E402
+from app.models.vendor import Vendor  # noqa: E402
+from app.schemas.purchase import PurchaseOut  # noqa: E402
+from app.schemas.sale import SaleOut  # noqa: E402
+
+ENDPOINTS = {"sales": (Sale, SaleOut), "purchases": (Purchase, PurchaseOut)}
+
+
+def seed(engine, rows: int) -> None:
+    Base.metadata.create_all(engine)
+    now = datetime(2025, 6, 30)
+    with engine.begin() as conn:
+        conn.execute(insert(Vendor.__table__), [{"id": 1, "name": "v", "email": "v@example.com", "password_hash": "x"}])
+        conn.execute(insert(Product.__table__), [
+            {"id": p, "vendor_id": 1, "name": f"Product {p}", "unit": "kg", "sale_type": "quick"} for p in range(1, 21)
+        ])
+        conn.execute(insert(Sale.__table__), [
+            {"vendor_id": 1, "product_id": i % 20 + 1, "quantity": i % 5 + 1, "unit_price": 50.0,
+             "total_price": (i % 5 + 1) * 50.0, "reference_no": f"R{i:09d}" if i % 2 else None,
+             "payment_type": "mpesa" if i % 2 else "cash", "created_at": now - timedelta(minutes=i)}
+            for i in range(rows)
+        ])
+        conn.execute(insert(Purchase.__table__), [
+            {"vendor_id": 1, "product_id": i % 20 + 1, "quantity": 12.5, "unit_cost": 40.0, "total_cost": 500.0,
+             "source": "Marikiti", "timestamp": now - timedelta(minutes=i)}
+            for i in range(rows)
+        ])
+
+
+def default_path(Session, model, schema):
+    adapter = TypeAdapter(List[schema])
+    timings = {}
+    db = Session()
+    start = time.perf_counter()
+    objects = db.query(model).filter(model.vendor_id == 1).all()
+    timings["load"] = time.perf_counter() - start
+    start = time.perf_counter()
+    content = adapter.dump_python(adapter.validate_python(objects), mode="json")
+    timings["build"] = time.perf_counter() - start
+    start = time.perf_counter()
+    body = JSONResponse(content).body
+    timings["encode"] = time.perf_counter() - start
+    db.close()
+    return timings, body
+
+
+def fast_path(Session, model, schema):
+    timings = {}
+    db = Session()
+    start = time.perf_counter()
+    rows = db.query(*schema_columns(model, schema)).filter(model.vendor_id == 1).all()
+    timings["load"] = time.perf_counter() - start
+    start = time.perf_counter()
+    content = column_rows(rows, schema)
+    timings["build"] = time.perf_counter() - start
+    start = time.perf_counter()
+    body = ORJSONResponse(content).body
+    timings["encode"] = time.perf_counter() - start
+    db.close()
+    return timings, body
+
+
+def measure(rows: int, repeat: int) -> dict:
+    # One connection for the in-memory database, shared by every session
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    seed(engine, rows)
+    Session = sessionmaker(bind=engine)
+    per_10k = 10_000 / rows
+    result = {}
+    for name, (model, schema) in ENDPOINTS.items():
+        bodies = {}
+        for label, path in (("default", default_path), ("fast", fast_path)):
+            samples = []
+            for _ in range(repeat):
+                timings, body = path(Session, model, schema)
+                samples.append(timings)
+            bodies[label] = body
+            stages = {
+                stage: round(statistics.median(s[stage] for s in samples) * 1000 * per_10k, 1)
+                for stage in ("load", "build", "encode")
+            }
+            stages["total"] = round(sum(stages.values()), 1)
+            result.setdefault(name, {})[label] = stages
+        # Same content, whatever the encoder's whitespace
+        result[name]["same_output"] = json.loads(bodies["default"]) == json.loads(bodies["fast"])
+        result[name]["speedup"] = round(result[name]["default"]["total"] / result[name]["fast"]["total"], 1)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serialization cost per 10k rows, default vs column-tuple/orjson path.")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args()
+
+    result = measure(args.rows, args.repeat)
+    if args.json:
+        print(json.dumps({"rows": args.rows, "repeat": args.repeat, **result}, indent=2))
+        return
+    print(f"ms per 10k rows (median of {args.repeat}, {args.rows} rows)")
+    print(f"{'endpoint':<10} {'path':<8} {'load':>7} {'build':>7} {'encode':>7} {'total':>7}")
+    for name, paths in result.items():
+        for label in ("default", "fast"):
+            s = paths[label]
+            print(f"{name:<10} {label:<8} {s['load']:>7} {s['build']:>7} {s['encode']:>7} {s['total']:>7}")
+        print(f"{'':<10} {'':<8} speed-up {paths['speedup']}x, same output: {paths['same_output']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/startup.py
+"""
+Cold-start time of the API: how long a fresh interpreter takes to import
+app.main, and to get through the lifespan startup (schema revision check)
+until the app is ready to serve.
+
+Every run is a new Python process, as on a worker boot. Uses DATABASE_URL
+from the environment or backend/.env, like the app.
+
+    python benchmarks/startup.py --runs 10
+    python benchmarks/startup.py --json > startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import asyncio, json, time
+start = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+
+async def boot():
+    async with app.router.lifespan_context(app):
+        return time.perf_counter()
+
+ready = asyncio.run(boot())
+print(json.dumps({"import": imported - start, "ready": ready - start}))
+"""
+
+
+def measure(runs: int) -> dict:
+    samples = {"import": [], "ready": []}
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        )
+        timings = json.loads(result.stdout.strip().splitlines()[-1])
+        for key, value in timings.items():
+            samples[key].append(value * 1000)
+    return {
+        key: {
+            "median_ms": round(statistics.median(values), 1),
+            "min_ms": round(min(values), 1),
+            "max_ms": round(max(values), 1),
+        }
+        for key, values in samples.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import and import-to-ready time of app.main.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args()
+
+    result = measure(args.runs)
+    if args.json:
+        print(json.dumps({"runs": args.runs, **result}, indent=2))
+        return
+    for key, stats in result.items():
+        print(f"{key:>7}: median {stats['median_ms']} ms (min {stats['min_ms']}, max {stats['max_ms']}) over {args.runs} runs")
+
+
+if __name__ == "__main__":
+    main()
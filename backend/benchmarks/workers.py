@@ -0,0 +1,76 @@
+# benchmarks/workers.py
+"""
+Throughput of the production server (gunicorn.conf.py) as the worker count
+grows.
+
+For each worker count the script starts gunicorn on a local port, waits for
+/ping, then keeps --clients keep-alive connections busy for --duration
+seconds and reports requests/second and latency percentiles. Uses
+DATABASE_URL from the environment or backend/.env, like the app.
+
+    python benchmarks/workers.py --workers 1 2 4 --clients 32 --duration 20
+    python benchmarks/workers.py --path /products/ --login bench@example.com:secret
+
+With --login the vendor is registered if needed and its bearer token is sent
+with every request, so authenticated, DB-backed routes can be measured.
+Throughput should grow roughly linearly with workers up to the CPU count
+(or the DB's capacity), and flatten beyond it.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from loadgen import login, run_load, wait_ready
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(workers: int, args) -> dict:
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), PORT=str(args.port), SQL_ECHO="false")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app.main:app"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_ready(args.port, process=server)
+        headers = {}
+        if args.login:
+            email, password = args.login.split(":", 1)
+            headers["Authorization"] = f"Bearer {login(args.port, email, password, register=True)}"
+        make_request = lambda client, n: ("GET", args.path, headers, None)
+        run_load(args.port, make_request, args.clients, min(args.duration, 3))  # warm-up
+        return {"workers": workers, **run_load(args.port, make_request, args.clients, args.duration)}
+    finally:
+        server.terminate()
+        server.wait(timeout=60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure throughput against the number of gunicorn workers.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=32, help="concurrent keep-alive connections")
+    parser.add_argument("--duration", type=float, default=15, help="seconds per worker count")
+    parser.add_argument("--path", default="/ping")
+    parser.add_argument("--login", help="email:password of a vendor to authenticate as")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = [run(workers, args) for workers in args.workers]
+    if args.json:
+        print(json.dumps({"path": args.path, "clients": args.clients, "results": results}, indent=2))
+        return
+    base = results[0]["rps"] or 1
+    print(f"GET {args.path}, {args.clients} clients, {args.duration:g}s per run")
+    print(f"{'workers':>7} {'req/s':>9} {'scaling':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for row in results:
+        print(
+            f"{row['workers']:>7} {row['rps']:>9} {row['rps'] / base:>7.2f}x "
+            f"{row['p50_ms']!s:>8} {row['p95_ms']!s:>8} {row['p99_ms']!s:>8} {row['errors']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# export_parquet.py
+"""
+Export sales, purchases, spoilage and M-Pesa transactions to Parquet.
+
+    python export_parquet.py exports/                 # everything new since the last run
+    python export_parquet.py exports/ --tables sales  # one table
+    python export_parquet.py exports/ --vendor 3      # one vendor
+    python export_parquet.py exports/ --full          # ignore the watermark (use a fresh directory)
+
+Load with pandas.read_parquet("exports/sales") or, in DuckDB,
+SELECT * FROM read_parquet('exports/sales/**/*.parquet', hive_partitioning = true).
+"""
+import argparse
+import json
+
+from app.database import SessionLocal
+from app.models import vendor, product, inventory, sale, purchase  # noqa: F401 - register mappers
+from app.models import vendor_preference, cart, cart_item, payment  # noqa: F401
+from app.models import inventory_history, product_pricing, bonus_rule, spoilage_entry  # noqa: F401
+from app.models import inventory_lot, mpesa_transaction  # noqa: F401
+from app.services.export import EXPORTS, export_all
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("out_dir")
+    parser.add_argument("--tables", nargs="+", choices=sorted(EXPORTS))
+    parser.add_argument("--vendor", type=int)
+    parser.add_argument("--full", action="store_true", help="re-export everything instead of appending")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        summary = export_all(db, args.out_dir, args.tables, args.vendor, args.full)
+    finally:
+        db.close()
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# generate_data.py
+"""
+Fill a database with deterministic synthetic vendors for load tests.
+
+    python generate_data.py --vendors 2000 --days 365 --seed 7 --end 2025-06-30
+    python generate_data.py --vendors 50 --create-schema   # throwaway SQLite/dev database
+
+Each vendor gets a product catalogue, seasonal daily sales, purchases,
+spoilage, bonus rules and M-Pesa transactions whose receipts match the
+sales. Vendors sign in as vendor<n>@example.com with --password. The same
+--seed and --end give the same rows; without --end the history ends today.
+Rows are appended after existing ids, so run it against an empty database
+when you need the numbering to match too.
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import date
+
+from app.core.security import get_password_hash
+from app.database import Base, get_engine
+from app.models import vendor, product, inventory, sale, purchase  # noqa: F401 - register mappers
+from app.models import vendor_preference, cart, cart_item, payment  # noqa: F401
+from app.models import inventory_history, product_pricing, bonus_rule, spoilage_entry  # noqa: F401
+from app.models import inventory_lot, mpesa_transaction  # noqa: F401
+from app.services.synthetic_data import generate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vendors", type=int, default=100)
+    parser.add_argument("--days", type=int, default=180, help="days of history per vendor")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--end", type=date.fromisoformat, help="last day of history (EAT), YYYY-MM-DD")
+    parser.add_argument("--password", default="bench-password", help="password shared by every vendor")
+    parser.add_argument("--create-schema", action="store_true", help="create missing tables first (not for migrated databases)")
+    args = parser.parse_args()
+
+    engine = get_engine()
+    if args.create_schema:
+        Base.metadata.create_all(bind=engine)
+
+    started = time.perf_counter()
+
+    def progress(done, total):
+        if done % 100 == 0 or done == total:
+            print(f"{done}/{total} vendors, {time.perf_counter() - started:.0f}s", file=sys.stderr)
+
+    with engine.begin() as connection:
+        counts = generate(
+            connection,
+            vendors=args.vendors,
+            days=args.days,
+            seed=args.seed,
+            end=args.end,
+            password_hash=get_password_hash(args.password),
+            progress=progress,
+        )
+    print(json.dumps({"seconds": round(time.perf_counter() - started, 1), "rows": counts}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
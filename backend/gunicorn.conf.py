@@ -0,0 +1,70 @@
+# gunicorn.conf.py
+"""
+Production server: gunicorn managing uvicorn workers.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+Each worker is a separate process with its own DB pool (DB_POOL_SIZE +
+DB_MAX_OVERFLOW connections), a request threadpool of the same size and
+HASH_WORKERS password hashing processes (app/core/passwords.py).
+Workers are sized from the CPU count and the memory available to the
+container, whichever allows fewer. Every setting can be overridden by
+environment variable:
+
+    WEB_CONCURRENCY            number of workers (skips the sizing below)
+    WORKER_MEMORY_MB           expected resident memory per worker (default 160)
+    HASH_PROCESS_MEMORY_MB     expected resident memory per hashing process (default 60)
+    KEEPALIVE                  seconds to hold idle keep-alive connections (default 5)
+    GRACEFUL_TIMEOUT           seconds in-flight requests get on shutdown/restart (default 30)
+    TIMEOUT                    seconds before a silent worker is killed (default 60)
+    MAX_REQUESTS               recycle a worker after this many requests, 0 = never (default 0)
+    MAX_REQUESTS_JITTER        random spread so workers do not recycle together (default 50)
+"""
+import multiprocessing
+import os
+
+RESERVED_MEMORY_MB = 64  # master process and headroom
+
+
+def _memory_limit_mb():
+    """The container's memory limit (cgroup v2, then v1), else physical memory."""
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < 1 << 60:
+            return int(value) // (1024 * 1024)
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def _default_workers() -> int:
+    by_cpu = multiprocessing.cpu_count() * 2 + 1
+    memory = _memory_limit_mb()
+    if memory is None:
+        return by_cpu
+    hashing = int(os.getenv("HASH_WORKERS", "1")) * int(os.getenv("HASH_PROCESS_MEMORY_MB", "60"))
+    per_worker = int(os.getenv("WORKER_MEMORY_MB", "160")) + hashing
+    by_memory = (memory - RESERVED_MEMORY_MB) // per_worker
+    return max(1, min(by_cpu, by_memory))
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY") or _default_workers())
+
+keepalive = int(os.getenv("KEEPALIVE", "5"))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("TIMEOUT", "60"))
+max_requests = int(os.getenv("MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", "50")) if max_requests else 0
+
+accesslog = "-"
+errorlog = "-"
+# Workers import the app themselves, so each one opens its own DB pool
+# after the fork rather than sharing the master's connections.
+preload_app = False
@@ -1,10 +1,12 @@
 # migrate.py
-from app.database import Base, engine
-from app.models import vendor, product, inventory, sale, purchase
-from app.models import vendor_preference, cart, cart_item, payment
-from app.models import inventory_history, product_pricing, bonus_rule, spoilage_entry
+# Bring the database schema up to date. Tables are owned by Alembic; this is
+# the same as running `alembic upgrade head` from this directory.
+import os
 
-# Create all tables
-Base.metadata.create_all(bind=engine)
+from alembic import command
+from alembic.config import Config
 
-print("All tables created successfully!")
+config = Config(os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini"))
+command.upgrade(config, "head")
+
+print("Database schema is up to date!")
@@ -21,7 +21,7 @@ if config.config_file_name is not None:
 
 # --- Import your Base and models so tables register on Base.metadata ---
 # NOTE: Prefer putting Base in app/models/__init__.py to avoid engine creation side-effects.
-from app.database import Base  # contains your Declarative Base
+from app.database import Base, database_url  # contains your Declarative Base
 from app.models import (
     vendor,
     product,
@@ -36,13 +36,15 @@ from app.models import (
     product_pricing,
     bonus_rule,
     spoilage_entry,
+    inventory_lot,
+    resource_version,
 )
 
 # THIS is what Alembic needs for --autogenerate:
 target_metadata = Base.metadata
 
 # Optionally allow DATABASE_URL to override alembic.ini
-db_url = os.getenv("DATABASE_URL")
+db_url = database_url()
 if db_url:
     config.set_main_option("sqlalchemy.url", db_url)
 
@@ -0,0 +1,39 @@
+"""add updated_at to sales, purchases and spoilage entries
+
+Revision ID: 3c7a91e5d204
+Revises: 9b3d6f0e2a18
+Create Date: 2026-10-19 18:05:11.482907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7a91e5d204'
+down_revision: Union[str, Sequence[str], None] = '9b3d6f0e2a18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> the column existing rows take their updated_at from. The server
+# default covers bulk loads (COPY, Core inserts) that skip the ORM default.
+TABLES = {
+    'sales': 'created_at',
+    'purchases': 'timestamp',
+    'spoilage_entries': 'timestamp',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, created_column in TABLES.items():
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=True))
+        op.execute(f'UPDATE {table} SET updated_at = {created_column}')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_column(table, 'updated_at')
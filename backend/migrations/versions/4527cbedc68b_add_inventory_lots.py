@@ -0,0 +1,54 @@
+"""add inventory lots
+
+Revision ID: 4527cbedc68b
+Revises: f5ee915bff99
+Create Date: 2026-10-19 09:12:41.508317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4527cbedc68b'
+down_revision: Union[str, Sequence[str], None] = 'f5ee915bff99'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('inventory_lots',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('vendor_id', sa.Integer(), nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=False),
+    sa.Column('purchase_id', sa.Integer(), nullable=True),
+    sa.Column('quantity', sa.Float(), nullable=False),
+    sa.Column('received_at', sa.DateTime(), nullable=False),
+    sa.Column('expiry_date', sa.DateTime(), nullable=True),
+    sa.Column('unit_cost', sa.Float(), nullable=True),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.ForeignKeyConstraint(['purchase_id'], ['purchases.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['vendor_id'], ['vendors.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_inventory_lots_id'), 'inventory_lots', ['id'], unique=False)
+    op.create_index('ix_inventory_lots_vendor_expiry', 'inventory_lots', ['vendor_id', 'expiry_date'], unique=False)
+    op.create_index('ix_inventory_lots_vendor_product', 'inventory_lots', ['vendor_id', 'product_id'], unique=False)
+
+    # Seed one lot per stocked inventory row so FEFO has something to consume
+    op.execute(
+        "INSERT INTO inventory_lots (vendor_id, product_id, quantity, received_at, expiry_date) "
+        "SELECT vendor_id, product_id, quantity, COALESCE(last_updated, CURRENT_TIMESTAMP), expiry_date "
+        "FROM inventories WHERE quantity > 0"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_inventory_lots_vendor_product', table_name='inventory_lots')
+    op.drop_index('ix_inventory_lots_vendor_expiry', table_name='inventory_lots')
+    op.drop_index(op.f('ix_inventory_lots_id'), table_name='inventory_lots')
+    op.drop_table('inventory_lots')
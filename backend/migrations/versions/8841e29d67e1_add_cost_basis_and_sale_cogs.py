@@ -0,0 +1,48 @@
+"""add moving-average cost basis and sale cost of goods
+
+Revision ID: 8841e29d67e1
+Revises: b83e0d5f1c27
+Create Date: 2026-10-19 11:26:52.130645
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8841e29d67e1'
+down_revision: Union[str, Sequence[str], None] = 'b83e0d5f1c27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('products', sa.Column('avg_unit_cost', sa.Float(), nullable=True))
+    op.add_column('products', sa.Column('cost_basis_quantity', sa.Float(), server_default='0', nullable=False))
+    op.add_column('sales', sa.Column('cost_of_goods', sa.Float(), nullable=True))
+
+    # Start every product from its historical weighted-average purchase cost
+    op.execute(
+        "UPDATE products SET avg_unit_cost = ("
+        "SELECT SUM(total_cost) / NULLIF(SUM(quantity), 0) FROM purchases "
+        "WHERE purchases.product_id = products.id)"
+    )
+    op.execute(
+        "UPDATE products SET cost_basis_quantity = COALESCE(("
+        "SELECT SUM(quantity) FROM inventories "
+        "WHERE inventories.product_id = products.id AND inventories.quantity > 0), 0)"
+    )
+    op.execute(
+        "UPDATE sales SET cost_of_goods = quantity * ("
+        "SELECT avg_unit_cost FROM products WHERE products.id = sales.product_id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('sales', 'cost_of_goods')
+    op.drop_column('products', 'cost_basis_quantity')
+    op.drop_column('products', 'avg_unit_cost')
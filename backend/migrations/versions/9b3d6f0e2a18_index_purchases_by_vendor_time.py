@@ -0,0 +1,28 @@
+"""index purchases by vendor and time
+
+Revision ID: 9b3d6f0e2a18
+Revises: e1f4b2c80a57
+Create Date: 2026-10-19 16:31:52.904415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3d6f0e2a18'
+down_revision: Union[str, Sequence[str], None] = 'e1f4b2c80a57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_purchases_vendor_timestamp', 'purchases', ['vendor_id', 'timestamp'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_purchases_vendor_timestamp', table_name='purchases')
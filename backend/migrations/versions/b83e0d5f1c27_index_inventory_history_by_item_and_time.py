@@ -0,0 +1,28 @@
+"""index inventory history by item and time
+
+Revision ID: b83e0d5f1c27
+Revises: 4527cbedc68b
+Create Date: 2026-10-19 10:03:18.774102
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b83e0d5f1c27'
+down_revision: Union[str, Sequence[str], None] = '4527cbedc68b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_inventory_history_inventory_timestamp', 'inventory_history', ['inventory_id', 'timestamp'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_inventory_history_inventory_timestamp', table_name='inventory_history')
@@ -0,0 +1,30 @@
+"""index sales and spoilage by vendor and time
+
+Revision ID: d842b9267b00
+Revises: 8841e29d67e1
+Create Date: 2026-10-19 12:40:07.318554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd842b9267b00'
+down_revision: Union[str, Sequence[str], None] = '8841e29d67e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_sales_vendor_created_at', 'sales', ['vendor_id', 'created_at'], unique=False)
+    op.create_index('ix_spoilage_entries_vendor_timestamp', 'spoilage_entries', ['vendor_id', 'timestamp'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_spoilage_entries_vendor_timestamp', table_name='spoilage_entries')
+    op.drop_index('ix_sales_vendor_created_at', table_name='sales')
@@ -0,0 +1,33 @@
+"""index product pricing by product and effective_from
+
+Revision ID: e1f4b2c80a57
+Revises: 5c0e7a93d1b4
+Create Date: 2026-10-19 16:05:41.227310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f4b2c80a57'
+down_revision: Union[str, Sequence[str], None] = '5c0e7a93d1b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_product_pricing_product_effective_from',
+        'product_pricing',
+        ['product_id', sa.text('effective_from DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_product_pricing_product_effective_from', table_name='product_pricing')
@@ -0,0 +1,66 @@
+# backend/tests/conftest.py
+"""
+Shared fixtures: the app on a throwaway SQLite database, a client and a
+logged-in vendor.
+
+The schema is created with create_all rather than Alembic, and the app's
+lifespan (which checks the Alembic revision) is not run. Passwords are
+hashed on the threadpool (HASH_WORKERS=0) with the cheapest bcrypt cost.
+"""
+import os
+import tempfile
+import uuid
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/test.db")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp())
+os.environ.setdefault("SQL_ECHO", "false")
+os.environ["HASH_WORKERS"] = "0"
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.database import Base, SessionLocal, get_engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def engine():
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@pytest.fixture
+def client(engine):
+    return TestClient(app)
+
+
+@pytest.fixture
+def db(engine):
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def vendor(client):
+    """A freshly registered vendor: {"id", "headers"}."""
+    email = f"{uuid.uuid4().hex[:12]}@example.com"
+    registered = client.post(
+        "/auth/register",
+        json={"name": "Test Vendor", "email": email, "contact": "0700000000", "password": "pw"},
+    )
+    assert registered.status_code == 200, registered.text
+    response = client.post("/auth/login", data={"username": email, "password": "pw"})
+    assert response.status_code == 200, response.text
+    return {"id": registered.json()["id"], "headers": {"Authorization": f"Bearer {response.json()['access_token']}"}}
+
+
+@pytest.fixture
+def enforce_query_budgets(monkeypatch):
+    """Turn a broken query budget into a failing request (QueryBudgetExceeded)."""
+    monkeypatch.setenv("QUERY_BUDGET", "enforce")
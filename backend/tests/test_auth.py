@@ -0,0 +1,54 @@
+# backend/tests/test_auth.py
+"""Login and register hold no pooled connection while a password hash runs."""
+import pytest
+
+from app.core import passwords
+from app.models.vendor import Vendor
+
+
+@pytest.fixture
+def checked_out_during_hash(monkeypatch, engine):
+    """Connections checked out at each hash or verify, in call order."""
+    seen = []
+    hash_, verify = passwords._hash, passwords._verify
+
+    def recording_hash(*args):
+        seen.append(engine.pool.checkedout())
+        return hash_(*args)
+
+    def recording_verify(*args):
+        seen.append(engine.pool.checkedout())
+        return verify(*args)
+
+    monkeypatch.setattr(passwords, "_hash", recording_hash)
+    monkeypatch.setattr(passwords, "_verify", recording_verify)
+    return seen
+
+
+def test_register_and_login_release_the_connection(client, checked_out_during_hash):
+    email = "hash-wait@example.com"
+    response = client.post(
+        "/auth/register", json={"name": "Test Vendor", "email": email, "contact": "0700000000", "password": "pw"}
+    )
+    assert response.status_code == 200, response.text
+    response = client.post("/auth/login", data={"username": email, "password": "pw"})
+    assert response.status_code == 200, response.text
+    assert response.json()["vendor"]["email"] == email
+
+    assert checked_out_during_hash == [0, 0]
+
+
+def test_login_upgrades_hash_cost(client, db, monkeypatch):
+    email = "rehash@example.com"
+    client.post("/auth/register", json={"name": "Test Vendor", "email": email, "contact": "0700000000", "password": "pw"})
+    stored = db.query(Vendor.password_hash).filter(Vendor.email == email).scalar()
+    db.rollback()
+
+    monkeypatch.setattr(passwords, "pwd_context", passwords.pwd_context.copy(
+        bcrypt__default_rounds=5, bcrypt__min_rounds=5, bcrypt__max_rounds=5
+    ))
+    response = client.post("/auth/login", data={"username": email, "password": "pw"})
+    assert response.status_code == 200, response.text
+
+    upgraded = db.query(Vendor.password_hash).filter(Vendor.email == email).scalar()
+    assert upgraded != stored and upgraded.startswith("$2b$05$")
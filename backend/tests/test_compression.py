@@ -0,0 +1,19 @@
+# backend/tests/test_compression.py
+"""A 200 and the 304 revalidating it carry the same Vary, whatever the client accepts."""
+import pytest
+
+
+@pytest.mark.parametrize("accept_encoding", ["gzip", "identity"])
+def test_not_modified_keeps_vary(client, vendor, accept_encoding):
+    for i in range(40):  # past COMPRESSION_MIN_SIZE
+        client.post("/products/", json={"name": f"Fruit {i}", "unit": "kg", "sale_type": "quick"}, headers=vendor["headers"])
+    headers = {**vendor["headers"], "Accept-Encoding": accept_encoding}
+
+    full = client.get("/products/", headers=headers)
+    assert full.status_code == 200
+    assert full.headers.get("content-encoding") == (None if accept_encoding == "identity" else "gzip")
+
+    cached = client.get("/products/", headers={**headers, "If-None-Match": full.headers["etag"]})
+    assert cached.status_code == 304
+    assert cached.headers["vary"] == full.headers["vary"]
+    assert "Accept-Encoding" in cached.headers["vary"]
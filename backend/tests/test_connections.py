@@ -0,0 +1,35 @@
+# backend/tests/test_connections.py
+"""An authenticated request checks out one pooled connection, shared by auth and the handler."""
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+
+@contextmanager
+def count_checkouts(engine):
+    checkouts = []
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checkouts.append(connection_record)
+
+    event.listen(engine, "checkout", on_checkout)
+    try:
+        yield checkouts
+    finally:
+        event.remove(engine, "checkout", on_checkout)
+
+
+@pytest.mark.parametrize("path", ["/products/", "/inventory/", "/sales/", "/auth/me"])
+def test_authenticated_request_uses_one_connection(client, engine, vendor, path):
+    with count_checkouts(engine) as checkouts:
+        response = client.get(path, headers=vendor["headers"])
+    assert response.status_code == 200, response.text
+    assert len(checkouts) == 1
+
+
+def test_rejected_token_uses_no_connection(client, engine):
+    with count_checkouts(engine) as checkouts:
+        response = client.get("/products/", headers={"Authorization": "Bearer not-a-token"})
+    assert response.status_code == 401
+    assert checkouts == []
@@ -0,0 +1,39 @@
+# backend/tests/test_forecast.py
+"""The cached forecast fit is reused, while stock-based advice follows inventory writes."""
+from datetime import datetime, timedelta
+
+from app.models.sale import Sale
+from app.services import forecast
+
+
+def test_reorder_advice_follows_stock(client, db, vendor, monkeypatch):
+    product_id = client.post(
+        "/products/", json={"name": "Mango", "unit": "kg", "sale_type": "quick"}, headers=vendor["headers"]
+    ).json()["id"]
+    now = datetime.utcnow()
+    db.add_all([
+        Sale(vendor_id=vendor["id"], product_id=product_id, quantity=10, unit_price=50.0, total_price=500.0,
+             created_at=now - timedelta(days=days))
+        for days in range(1, 29)
+    ])
+    db.commit()
+
+    def mango():
+        response = client.get("/analytics/forecast", params={"horizon": 7}, headers=vendor["headers"])
+        assert response.status_code == 200, response.text
+        return next(item for item in response.json()["products"] if item["product_id"] == product_id)
+
+    before = mango()
+    assert before["on_hand"] == 0 and before["days_of_cover"] == 0
+
+    fits = []
+    fit = forecast._fit_for_vendor
+    monkeypatch.setattr(forecast, "_fit_for_vendor", lambda *args: fits.append(args) or fit(*args))
+    client.post("/inventory/", json={"product_id": product_id, "quantity": 35}, headers=vendor["headers"])
+    after = mango()
+
+    assert fits == []  # same EAT day: the fit came from the cache
+    assert after["daily"] == before["daily"]
+    assert after["on_hand"] == 35
+    assert after["reorder_quantity"] == round(max(0.0, before["total"] - 35), 2)
+    assert after["days_of_cover"] != before["days_of_cover"]
@@ -0,0 +1,24 @@
+# backend/tests/test_inventory_bulk.py
+"""Stock-take import: POST /inventory/bulk and inventory_service.bulk_upsert_inventory."""
+from app.models.inventory import Inventory
+from app.schemas.inventory import InventoryBulkRow
+from app.services import inventory as inventory_service
+
+
+def _product(client, vendor, name="Mango"):
+    response = client.post("/products/", json={"name": name, "unit": "kg", "sale_type": "quick"}, headers=vendor["headers"])
+    return response.json()["id"]
+
+
+def test_add_mode_treats_missing_quantity_as_zero(client, db, vendor):
+    product_id = _product(client, vendor)
+    item = Inventory(vendor_id=vendor["id"], product_id=product_id, quantity=3)
+    db.add(item)
+    db.commit()
+    item.quantity = None  # unflushed, so the service sees the same object with no quantity
+
+    results = inventory_service.bulk_upsert_inventory(
+        db, vendor["id"], [(1, InventoryBulkRow(product_id=product_id, quantity=2, mode="add"))]
+    )
+
+    assert results == [{"row": 1, "product_id": product_id, "status": "updated", "quantity": 2}]
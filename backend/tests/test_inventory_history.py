@@ -0,0 +1,45 @@
+# backend/tests/test_inventory_history.py
+"""Keyset paging of an item's ledger."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, update
+
+from app.models.inventory_history import InventoryHistory
+
+
+@pytest.fixture
+def ledger(client, db, vendor):
+    """An item with six history rows, two of them without a timestamp."""
+    product_id = client.post(
+        "/products/", json={"name": "Mango", "unit": "kg", "sale_type": "quick"}, headers=vendor["headers"]
+    ).json()["id"]
+    inventory_id = client.post(
+        "/inventory/", json={"product_id": product_id, "quantity": 5}, headers=vendor["headers"]
+    ).json()["id"]
+    start = datetime(2026, 1, 1)
+    db.execute(insert(InventoryHistory), [
+        {"inventory_id": inventory_id, "change_type": "manual", "quantity_change": i, "timestamp": start + timedelta(hours=i)}
+        for i in range(10, 70, 10)
+    ])
+    db.execute(update(InventoryHistory).where(
+        InventoryHistory.inventory_id == inventory_id, InventoryHistory.quantity_change.in_((20, 50))
+    ).values(timestamp=None))
+    db.commit()
+    return inventory_id
+
+
+@pytest.mark.parametrize("limit", range(1, 7))
+def test_paging_skips_rows_without_timestamp(client, vendor, ledger, limit):
+    seen, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = client.get(f"/inventory-history/{ledger}", params=params, headers=vendor["headers"])
+        assert response.status_code == 200, response.text
+        page = response.json()
+        seen += [item["quantity_change"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == [60, 40, 30, 10]
@@ -0,0 +1,39 @@
+# backend/tests/test_price_suggestions.py
+"""Cached suggestions follow writes made in another worker, without explicit invalidation."""
+import pytest
+
+from app.services import price_suggestion, product, purchase
+
+
+@pytest.fixture
+def other_worker(monkeypatch):
+    """Writes from here on only bump resource versions, as in a different process."""
+    for module in (product, purchase):
+        monkeypatch.setattr(module, "invalidate_price_suggestions", lambda vendor_id: None)
+
+
+def _suggestions(client, vendor):
+    response = client.get("/product-pricings/suggestions", headers=vendor["headers"])
+    assert response.status_code == 200, response.text
+    return {row["product_name"]: row for row in response.json()["suggestions"]}
+
+
+def test_writes_in_another_worker_refresh_the_cache(client, vendor, other_worker):
+    mango = client.post("/products/", json={"name": "Mango", "unit": "kg", "sale_type": "quick"}, headers=vendor["headers"]).json()["id"]
+    assert _suggestions(client, vendor)["Mango"]["unit_cost"] is None
+
+    response = client.post(
+        "/purchases/", json={"product_id": mango, "quantity": 10, "unit_cost": 40, "total_cost": 400}, headers=vendor["headers"]
+    )
+    assert response.status_code == 200, response.text
+    assert _suggestions(client, vendor)["Mango"]["unit_cost"] == 40
+
+    client.post("/products/", json={"name": "Kiwi", "unit": "kg", "sale_type": "quick"}, headers=vendor["headers"])
+    assert set(_suggestions(client, vendor)) == {"Mango", "Kiwi"}
+
+
+def test_unchanged_versions_hit_the_cache(client, vendor, monkeypatch):
+    client.post("/products/", json={"name": "Mango", "unit": "kg", "sale_type": "quick"}, headers=vendor["headers"])
+    first = _suggestions(client, vendor)
+    monkeypatch.setattr(price_suggestion, "_compute_suggestions", lambda db, vendor_id: pytest.fail("recomputed"))
+    assert _suggestions(client, vendor) == first
@@ -0,0 +1,128 @@
+# backend/tests/test_query_budgets.py
+"""
+The budgeted M-Pesa, payment, bonus-rule and stock-take routes stay within their query
+budgets with several rows to load, so a per-row lazy load fails the request.
+"""
+import pytest
+from sqlalchemy import func, text
+
+from app.core.query_budget import QueryBudgetExceeded, query_budget
+from app.models.inventory_lot import InventoryLot
+from app.models.mpesa_transaction import MpesaTransaction
+from app.models.sale import Sale
+
+ROWS = 5
+
+pytestmark = pytest.mark.usefixtures("enforce_query_budgets")
+
+
+@pytest.fixture
+def products(client, vendor):
+    return [
+        client.post(
+            "/products/", json={"name": f"Fruit {i}", "unit": "kg", "sale_type": "quick"}, headers=vendor["headers"]
+        ).json()["id"]
+        for i in range(ROWS)
+    ]
+
+
+@pytest.fixture
+def sales(db, vendor, products):
+    rows = [
+        Sale(
+            vendor_id=vendor["id"], product_id=product_id, quantity=2, unit_price=50.0, total_price=100.0,
+            reference_no=f"RCP{vendor['id']:04d}{i}", payment_type="mpesa",
+        )
+        for i, product_id in enumerate(products)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return [sale.id for sale in rows]
+
+
+def test_enforce_raises_on_a_broken_budget(db):
+    with pytest.raises(QueryBudgetExceeded):
+        with query_budget(0, name="test"):
+            db.execute(text("SELECT 1"))
+
+
+def test_mpesa_history(client, db, vendor, products, sales):
+    db.add_all([
+        MpesaTransaction(
+            vendor_id=vendor["id"], product_id=product_id, amount=100.0, phone_number="254700000000",
+            result_code=0, mpesa_receipt=f"RCP{vendor['id']:04d}{i}",
+        )
+        for i, product_id in enumerate(products)
+    ])
+    db.commit()
+
+    response = client.get("/mpesa/history", headers=vendor["headers"])
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == ROWS
+    assert all(row["sale_id"] in sales for row in response.json())
+
+    response = client.get("/mpesa/history/enhanced", headers=vendor["headers"])
+    assert response.status_code == 200, response.text
+    assert len(response.json()["history"]) == ROWS
+
+
+def test_payments(client, vendor, sales):
+    sale_id = sales[0]
+    for i in range(ROWS):
+        response = client.post(
+            "/payments/", json={"sale_id": sale_id, "amount": 20.0, "payment_type": "cash"}, headers=vendor["headers"]
+        )
+        assert response.status_code == 200, response.text
+
+    response = client.get(f"/payments/sale/{sale_id}", headers=vendor["headers"])
+    assert response.status_code == 200, response.text
+    payments = response.json()
+    assert len(payments) == ROWS
+
+    response = client.delete(f"/payments/{payments[0]['id']}", headers=vendor["headers"])
+    assert response.status_code == 200, response.text
+
+
+def test_bonus_rules(client, vendor, products):
+    for i in range(ROWS):
+        response = client.post(
+            "/bonus-rules/",
+            json={
+                "rule_name": f"Rule {i}", "condition_type": "quantity", "condition_value": 3,
+                "bonus_type": "percentage", "bonus_value": 10, "product_ids": products,
+            },
+            headers=vendor["headers"],
+        )
+        assert response.status_code == 200, response.text
+    rule_id = response.json()["id"]
+
+    response = client.get("/bonus-rules/", headers=vendor["headers"])
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == ROWS
+
+    response = client.get(f"/bonus-rules/{rule_id}", headers=vendor["headers"])
+    assert response.status_code == 200, response.text
+    assert sorted(response.json()["product_ids"]) == sorted(products)
+
+    response = client.get(f"/bonus-rules/product/{products[0]}", headers=vendor["headers"])
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == ROWS
+
+
+def test_inventory_bulk(client, db, vendor, products):
+    for rows in (
+        [{"product_id": product_id, "quantity": 10} for product_id in products * 10],
+        [{"product_id": product_id, "quantity": 4 if i % 2 else 12} for i, product_id in enumerate(products)],
+        [{"product_id": product_id, "quantity": -1, "mode": "add"} for product_id in products * 3],
+    ):
+        response = client.post("/inventory/bulk", json=rows, headers=vendor["headers"])
+        assert response.status_code == 200, response.text
+        assert response.json()["failed"] == 0
+
+    expected = {product_id: 1.0 if i % 2 else 9.0 for i, product_id in enumerate(products)}
+    stock = {item["product_id"]: item["quantity"] for item in client.get("/inventory/", headers=vendor["headers"]).json()}
+    assert stock == expected
+    lots = dict(db.query(InventoryLot.product_id, func.sum(InventoryLot.quantity)).filter(
+        InventoryLot.vendor_id == vendor["id"]
+    ).group_by(InventoryLot.product_id).all())
+    assert lots == expected
@@ -0,0 +1,25 @@
+# backend/tests/test_synthetic_data.py
+"""Generated rows carry an updated_at, so incremental exports pick them up."""
+from sqlalchemy import func, select
+
+from app.models.purchase import Purchase
+from app.models.sale import Sale
+from app.models.spoilage_entry import SpoilageEntry
+from app.models.vendor import Vendor
+from app.services import synthetic_data
+
+
+def test_generated_rows_are_stamped(engine):
+    with engine.begin() as connection:
+        synthetic_data.generate(connection, vendors=1, days=21, seed=7, email_domain="synthetic.test")
+        generated = select(Vendor.id).where(Vendor.email.like("%@synthetic.test"))
+        for model, created in (
+            (Sale, Sale.created_at),
+            (Purchase, Purchase.timestamp),
+            (SpoilageEntry, SpoilageEntry.timestamp),
+        ):
+            total, stamped = connection.execute(
+                select(func.count(), func.count().filter(model.updated_at == created))
+                .where(model.vendor_id.in_(generated))
+            ).one()
+            assert total > 0 and stamped == total, model.__tablename__
@@ -51,11 +51,12 @@ export const useDashboardData = () => {
         setError(null)
 
         // Fetch all data in parallel
-        const [productsData, salesData, spoilageData, inventoryData] = await Promise.all([
+        const [productsData, salesData, spoilageData, inventoryData, topSellers] = await Promise.all([
           productApi.list(),
           saleApi.list(),
           spoilageApi.list(),
           inventoryApi.list(),
+          saleApi.top(5, 'month'),
         ])
 
         // Compute metrics from sales data
@@ -118,33 +119,15 @@ export const useDashboardData = () => {
           })
         }
 
-        // Compute top selling items
-        const productSales = salesData.reduce(
-          (acc, sale) => {
-            if (!acc[sale.product_id]) {
-              acc[sale.product_id] = { quantity: 0, revenue: 0 }
-            }
-            acc[sale.product_id].quantity += sale.quantity
-            acc[sale.product_id].revenue += sale.total_price
-            return acc
-          },
-          {} as Record<number, { quantity: number; revenue: number }>
-        )
-
-        const topItems: TopSellingItem[] = Object.entries(productSales)
-          .sort(([, a], [, b]) => b.quantity - a.quantity)
-          .slice(0, 5)
-          .map(([productId, data]) => {
-            const product = productsData.find((p) => p.id === parseInt(productId))
-            const maxQuantity = Math.max(...Object.values(productSales).map((s) => s.quantity))
-            return {
-              id: productId,
-              name: product?.name ?? 'Unknown Product',
-              unitsSold: Math.round(data.quantity),
-              revenue: `KES ${data.revenue.toLocaleString()}`,
-              progress: (data.quantity / maxQuantity) * 100,
-            }
-          })
+        // Top sellers are ranked server-side
+        const maxQuantity = Math.max(0, ...topSellers.map((item) => item.units))
+        const topItems: TopSellingItem[] = topSellers.map((item) => ({
+          id: item.product_id.toString(),
+          name: item.product_name,
+          unitsSold: Math.round(item.units),
+          revenue: `KES ${item.revenue.toLocaleString()}`,
+          progress: maxQuantity > 0 ? (item.units / maxQuantity) * 100 : 0,
+        }))
 
         setTopSellingItems(topItems)
 
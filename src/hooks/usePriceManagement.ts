@@ -1,5 +1,5 @@
 import { useState, useEffect, useCallback } from 'react'
-import { bonusRuleApi, pricingApi, productApi, purchaseApi } from '../services/api'
+import { bonusRuleApi, pricingApi } from '../services/api'
 import type { BonusRule, ProductPricing } from '../services/types'
 
 export type PriceMetric = {
@@ -54,47 +54,35 @@ export const usePriceManagement = () => {
       setIsLoading(true)
       setError(null)
 
-      const [productsData, purchasesData, bonusRulesData] = await Promise.all([
-        productApi.list(),
-        purchaseApi.list(),
+      const [bonusRulesData, suggestionsData, currentPrices] = await Promise.all([
         bonusRuleApi.list(),
+        pricingApi.suggestions(),
+        pricingApi.current(),
       ])
 
       setBonusRules(bonusRulesData)
+      setProductPricings(currentPrices)
 
-      // Fetch pricing for all products
-      const pricingsPromises = productsData.map((product) =>
-        pricingApi.list(product.id).catch(() => [] as ProductPricing[])
-      )
-      const pricingsArrays = await Promise.all(pricingsPromises)
-      const allPricings = pricingsArrays.flat()
-      setProductPricings(allPricings)
-
-      // Calculate product prices with margins
-      const prices: ProductPrice[] = productsData.map((product) => {
-        const productPurchases = purchasesData.filter((p) => p.product_id === product.id)
-        const latestPurchase = productPurchases.sort(
-          (a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime()
-        )[0]
-
-        const productPricing = allPricings.find((p) => p.product_id === product.id)
-
-        const purchasePrice = latestPurchase?.unit_cost ?? 0
-        const sellingPrice = productPricing?.price ?? purchasePrice * 1.3 // default 30% margin
+      // Costs, current prices and suggestions are resolved server-side
+      const prices: ProductPrice[] = suggestionsData.suggestions.map((item) => {
+        const purchasePrice = item.unit_cost ?? 0
+        const sellingPrice = item.current_price ?? item.suggested_price ?? purchasePrice
         const margin = purchasePrice > 0 ? ((sellingPrice - purchasePrice) / purchasePrice) * 100 : 0
+        const showSuggestion =
+          item.suggested_price !== null && item.current_price !== null && item.suggested_price !== item.current_price
 
         return {
-          id: product.id.toString(),
-          name: product.name,
-          variety: product.variation ?? undefined,
+          id: item.product_id.toString(),
+          name: item.product_name,
+          variety: item.variation ?? undefined,
           pricingMode: 'Per unit',
           currentPrice: formatCurrency(sellingPrice),
           purchasePrice: formatCurrency(purchasePrice),
           marginPercent: `${margin.toFixed(1)}%`,
-          lastUpdated: latestPurchase
-            ? formatDate(new Date(latestPurchase.timestamp))
+          lastUpdated: item.last_purchase_at
+            ? formatDate(new Date(item.last_purchase_at))
             : 'Never',
-          tags: [],
+          tags: showSuggestion ? [`Suggested ${formatCurrency(item.suggested_price ?? 0)}`] : [],
         }
       })
 
@@ -1,6 +1,6 @@
 import { useState, useEffect, useCallback } from 'react'
-import { productApi, saleApi, inventoryApi } from '../services/api'
-import type { Product, Sale, Inventory } from '../services/types'
+import { productApi, saleApi, inventoryApi, catalogueApi } from '../services/api'
+import type { Product, Sale, CatalogueItem } from '../services/types'
 
 type InventoryItem = {
   id: string
@@ -29,7 +29,7 @@ export const useSalesData = () => {
   const [error, setError] = useState<string | null>(null)
 
   const [products, setProducts] = useState<Product[]>([])
-  const [inventory, setInventory] = useState<Inventory[]>([])
+  const [catalogue, setCatalogue] = useState<CatalogueItem[]>([])
 
   const [inventoryItems, setInventoryItems] = useState<InventoryItem[]>([])
   const [salesRecords, setSalesRecords] = useState<SaleRecord[]>([])
@@ -39,37 +39,33 @@ export const useSalesData = () => {
       setIsLoading(true)
       setError(null)
 
-      const [productsData, inventoryData, salesData] = await Promise.all([
+      const [productsData, catalogueData, salesData] = await Promise.all([
         productApi.list(),
-        inventoryApi.list(),
+        catalogueApi.get(),
         saleApi.list(),
       ])
 
       setProducts(productsData)
-      setInventory(inventoryData)
-
-      // Transform to inventory items for sales UI
-      const items: InventoryItem[] = inventoryData
-        .map((inv) => {
-          const product = productsData.find((p) => p.id === inv.product_id)
-          if (!product) return null
-
-          // Get latest sale for pricing
-          const productSales = salesData.filter((s) => s.product_id === product.id)
-          const latestSale = productSales.sort(
-            (a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime()
-          )[0]
-
-          return {
-            id: product.id.toString(),
-            name: product.name,
-            unit: (product.unit === 'kg' ? 'kg' : 'pieces') as 'kg' | 'pieces',
-            pricePerUnit: latestSale?.unit_price ?? 100,
-            stock: inv.quantity,
-            status: (inv.quantity > 0 ? 'available' : 'out-of-stock') as 'available' | 'out-of-stock',
-          }
-        })
-        .filter((item): item is InventoryItem => item !== null)
+      setCatalogue(catalogueData)
+
+      // The catalogue already carries each active product's current price and stock
+      const items: InventoryItem[] = catalogueData.map((item) => {
+        // Fall back to the latest sale price for products that have no price yet
+        const latestSale = item.price === null
+          ? salesData
+              .filter((s) => s.product_id === item.id)
+              .sort((a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime())[0]
+          : undefined
+
+        return {
+          id: item.id.toString(),
+          name: item.name,
+          unit: (item.unit === 'kg' ? 'kg' : 'pieces') as 'kg' | 'pieces',
+          pricePerUnit: item.price ?? latestSale?.unit_price ?? 100,
+          stock: item.on_hand,
+          status: (item.on_hand > 0 ? 'available' : 'out-of-stock') as 'available' | 'out-of-stock',
+        }
+      })
 
       setInventoryItems(items)
 
@@ -119,10 +115,10 @@ export const useSalesData = () => {
           })
 
           // Update inventory (decrease stock)
-          const currentInv = inventory.find((inv) => inv.product_id === productId)
-          if (currentInv) {
+          const currentItem = catalogue.find((item) => item.id === productId)
+          if (currentItem) {
             // inventoryApi.add increments stock, so send a negative delta to deduct sales
-            const deduction = Math.min(currentInv.quantity, line.quantity)
+            const deduction = Math.min(currentItem.on_hand, line.quantity)
             if (deduction > 0) {
               await inventoryApi.add({
                 product_id: productId,
@@ -141,7 +137,7 @@ export const useSalesData = () => {
         return false
       }
     },
-    [products, inventory, fetchData]
+    [products, catalogue, fetchData]
   )
 
   const handleCreateQuickSale = useCallback(
@@ -165,9 +161,9 @@ export const useSalesData = () => {
         })
 
         // Update inventory
-        const currentInv = inventory.find((inv) => inv.product_id === productId)
-        if (currentInv) {
-          const deduction = Math.min(currentInv.quantity, quantity)
+        const currentItem = catalogue.find((item) => item.id === productId)
+        if (currentItem) {
+          const deduction = Math.min(currentItem.on_hand, quantity)
           if (deduction > 0) {
             await inventoryApi.add({
               product_id: productId,
@@ -184,7 +180,7 @@ export const useSalesData = () => {
         return false
       }
     },
-    [inventory, fetchData]
+    [catalogue, fetchData]
   )
 
   return {
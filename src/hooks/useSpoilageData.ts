@@ -1,6 +1,6 @@
 import { useState, useEffect, useCallback } from 'react'
-import { productApi, spoilageApi, inventoryApi } from '../services/api'
-import type { Product, Inventory } from '../services/types'
+import { productApi, spoilageApi } from '../services/api'
+import type { Product } from '../services/types'
 
 type RiskLevel = 'critical' | 'high' | 'medium' | 'low'
 
@@ -27,7 +27,6 @@ export const useSpoilageData = () => {
   const [error, setError] = useState<string | null>(null)
 
   const [products, setProducts] = useState<Product[]>([])
-  const [inventory, setInventory] = useState<Inventory[]>([])
 
   const [attentionItems, setAttentionItems] = useState<SpoilageItem[]>([])
   const [riskSummaries, setRiskSummaries] = useState<RiskSummary[]>([])
@@ -38,14 +37,12 @@ export const useSpoilageData = () => {
       setIsLoading(true)
       setError(null)
 
-      const [productsData, spoilageData, inventoryData] = await Promise.all([
+      const [productsData, spoilageData] = await Promise.all([
         productApi.list(),
         spoilageApi.list(),
-        inventoryApi.list(),
       ])
 
       setProducts(productsData)
-      setInventory(inventoryData)
 
       // Find last check timestamp
       if (spoilageData.length > 0) {
@@ -118,19 +115,7 @@ export const useSpoilageData = () => {
           reason,
         })
 
-        // Update inventory to reduce stock
-        const currentInv = inventory.find((inv) => inv.product_id === productId)
-        if (currentInv) {
-          // Reduce inventory by sending a negative delta equal to the spoilage quantity
-          const deduction = Math.min(currentInv.quantity, quantity)
-          if (deduction > 0) {
-            await inventoryApi.add({
-              product_id: productId,
-              quantity: -deduction,
-            })
-          }
-        }
-
+        // The backend takes spoiled stock out of inventory when the entry is posted
         await fetchData()
         return true
       } catch (err) {
@@ -139,7 +124,7 @@ export const useSpoilageData = () => {
         return false
       }
     },
-    [inventory, fetchData]
+    [fetchData]
   )
 
   return {
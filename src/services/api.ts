@@ -31,6 +31,12 @@ import type {
   MpesaSTKPushResponse,
   MpesaTransaction,
   MpesaTransactionEnhanced,
+  AnalyticsOverview,
+  AnalyticsPeriod,
+  TopSeller,
+  PriceSuggestions,
+  CurrentPrice,
+  CatalogueItem,
 } from './types'
 
 // ==================== AUTH API ====================
@@ -94,6 +100,9 @@ export const productApi = {
 export const saleApi = {
   list: () => apiFetch<Sale[]>('/sales/'),
 
+  top: (k = 5, period: AnalyticsPeriod = 'week', by: 'units' | 'revenue' = 'units') =>
+    apiFetch<TopSeller[]>(`/sales/top?k=${k}&period=${period}&by=${by}`),
+
   get: (id: number) => apiFetch<Sale>(`/sales/${id}`),
 
   create: (data: SaleCreate) =>
@@ -142,6 +151,10 @@ export const purchaseApi = {
 export const pricingApi = {
   list: (productId: number) => apiFetch<ProductPricing[]>(`/product-pricings/${productId}`),
 
+  current: () => apiFetch<CurrentPrice[]>('/product-pricings/current'),
+
+  suggestions: () => apiFetch<PriceSuggestions>('/product-pricings/suggestions'),
+
   create: (data: ProductPricingCreate) =>
     apiFetch<ProductPricing>('/product-pricings/', {
       method: 'POST',
@@ -305,3 +318,17 @@ export const mpesaApi = {
   getTransaction: (checkoutRequestId: string) =>
     apiFetch<MpesaTransaction>(`/mpesa/history?checkout_request_id=${checkoutRequestId}`),
 }
+
+// ==================== ANALYTICS API ====================
+export const analyticsApi = {
+  // Passing the chart's pixel width returns daily points, downsampled to at most that many.
+  overview: (period: AnalyticsPeriod = 'week', width?: number) =>
+    apiFetch<AnalyticsOverview>(
+      `/analytics/overview?period=${period}${width ? `&width=${Math.round(width)}` : ''}`
+    ),
+}
+
+// ==================== CATALOGUE API ====================
+export const catalogueApi = {
+  get: () => apiFetch<CatalogueItem[]>('/catalogue/'),
+}
@@ -79,6 +79,16 @@ export type SaleUpdate = {
   cart_id?: number
 }
 
+export type TopSeller = {
+  product_id: number
+  product_name: string
+  units: number
+  revenue: number
+  rank: number
+  previous_rank: number | null
+  rank_change: number | null
+}
+
 // Inventory Types
 export type Inventory = {
   id: number
@@ -128,6 +138,51 @@ export type ProductPricingCreate = {
   effective_to?: string
 }
 
+export type CurrentPrice = ProductPricing & {
+  product_name: string
+}
+
+export type CatalogueItem = {
+  id: number
+  name: string
+  unit: string
+  variation?: string | null
+  sale_type: string
+  price: number | null
+  price_type: string | null
+  on_hand: number
+  bonus_rules: {
+    id: number
+    rule_name: string
+    condition_type: string
+    condition_value: number
+    bonus_type: string
+    bonus_value: number
+  }[]
+}
+
+export type PriceSuggestion = {
+  product_id: number
+  product_name: string
+  variation?: string | null
+  unit_cost: number | null
+  cost_source: 'recent_purchases' | 'average_cost' | null
+  last_purchase_at: string | null
+  current_price: number | null
+  current_margin_pct: number | null
+  sell_through: number | null
+  suggested_price: number | null
+  suggested_margin_pct: number | null
+  reason: string
+}
+
+export type PriceSuggestions = {
+  pricing_margin: number
+  auto_suggest: boolean
+  quick_pricing: boolean
+  suggestions: PriceSuggestion[]
+}
+
 // Spoilage Entry Types
 export type SpoilageEntry = {
   id: number
@@ -285,4 +340,37 @@ export type MpesaTransaction = {
 export type MpesaTransactionEnhanced = MpesaTransaction & {
   vendor_name: string | null
   product_name: string | null
-}
\ No newline at end of file
+}
+
+// Analytics Types
+export type AnalyticsPeriod = 'week' | 'month' | 'quarter' | 'year'
+
+export type AnalyticsTotals = {
+  revenue: number
+  units: number
+  transactions: number
+  discounts: number
+  cost_of_goods: number
+  gross_profit: number
+  margin_pct: number | null
+  cash_revenue: number
+  mpesa_revenue: number
+  spoilage_quantity: number
+  spoilage_rate: number
+  inventory_items: number
+  inventory_units: number
+  inventory_value: number
+}
+
+export type AnalyticsOverview = {
+  period: AnalyticsPeriod
+  bucket: 'day' | 'week' | 'month'
+  date_from: string
+  date_to: string
+  totals: AnalyticsTotals
+  source_points: number
+  sales_performance: { bucket: string; revenue: number; units: number; profit: number }[]
+  product_shares: { product_id: number; product_name: string; revenue: number; share: number }[]
+  hourly_pattern: { hour: number; units: number; revenue: number }[]
+  insights: { id: string; title: string; detail: string; tone: 'info' | 'success' | 'alert' }[]
+}